@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     'django.contrib.sites',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'rest_framework.authtoken',
@@ -328,6 +329,73 @@ CACHES = {
     }
 }
 
+# Multi-site crawls (scrape_sites / run_scheduled_tasks scrape): how many
+# SiteConfigs crawl at once in one reactor, the in-flight download cap
+# across all of them, and Scrapy's per-domain limit. 1 = one process per site.
+SCRAPE_CONCURRENT_SITES = config("SCRAPE_CONCURRENT_SITES", default=4, cast=int)
+SCRAPE_GLOBAL_CONCURRENCY = config("SCRAPE_GLOBAL_CONCURRENCY", default=16, cast=int)
+SCRAPE_PER_DOMAIN_CONCURRENCY = config("SCRAPE_PER_DOMAIN_CONCURRENCY", default=2, cast=int)
+
+# Run the scrapers' ORM calls on a dedicated thread instead of the reactor
+# (scholarscope_scrapers/utils/db.py). False restores the inline behaviour.
+SCRAPE_DB_THREAD = config("SCRAPE_DB_THREAD", default=True, cast=bool)
+
+# Detail-page extraction worker processes per crawl process
+# (scholarscope_scrapers/utils/extraction_pool.py); 0 extracts on the reactor.
+SCRAPE_EXTRACTION_WORKERS = config("SCRAPE_EXTRACTION_WORKERS", default=os.cpu_count() or 1, cast=int)
+
+# Directory the spider records every extracted detail page into, for offline
+# replay by `manage.py benchmark_corpus` (scholarships/corpus.py). Empty = off.
+SCRAPE_RECORD_CORPUS = config("SCRAPE_RECORD_CORPUS", default="")
+
+# LLM rescue of weak extractions (scholarscope_scrapers/utils/llm_queue.py):
+# concurrent calls, estimated-token budget per scrape event or backfill run
+# (0 = unlimited), and the price used to report spend.
+SCRAPE_LLM_CONCURRENCY = config("SCRAPE_LLM_CONCURRENCY", default=3, cast=int)
+SCRAPE_LLM_TOKEN_BUDGET = config("SCRAPE_LLM_TOKEN_BUDGET", default=150_000, cast=int)
+SCRAPE_LLM_COST_PER_1K_TOKENS = config("SCRAPE_LLM_COST_PER_1K_TOKENS", default=0.0002, cast=float)
+
+# Bloom filter over Scholarship fingerprints (scholarships/dedup.py). At the
+# defaults the Redis bitmap is ~1.8 MB whatever the table size.
+FINGERPRINT_FILTER_CAPACITY = config("FINGERPRINT_FILTER_CAPACITY", default=1_000_000, cast=int)
+FINGERPRINT_FILTER_ERROR_RATE = config("FINGERPRINT_FILTER_ERROR_RATE", default=0.001, cast=float)
+
+# Browser page pool (scholarscope_scrapers/handlers.py): open pages per
+# context, contexts per crawler, and page loads before a context is recycled.
+PLAYWRIGHT_MAX_PAGES_PER_CONTEXT = config("PLAYWRIGHT_MAX_PAGES_PER_CONTEXT", default=4, cast=int)
+PLAYWRIGHT_MAX_CONTEXTS = config("PLAYWRIGHT_MAX_CONTEXTS", default=2, cast=int)
+PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS = config("PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS", default=50, cast=int)
+
+# Text embedding backend (scholarships/embedders.py): "gemini", "local"
+# (sentence-transformers on CPU; pip install sentence-transformers, plus
+# onnxruntime for EMBEDDING_LOCAL_BACKEND=onnx) or "hashing" (offline stub
+# for tests and benchmarks). Must produce 768-d vectors to fit the
+# VectorFields; re-embed everything after switching.
+EMBEDDING_PROVIDER = config("EMBEDDING_PROVIDER", default="gemini")
+EMBEDDING_LOCAL_MODEL = config("EMBEDDING_LOCAL_MODEL", default="sentence-transformers/all-mpnet-base-v2")
+EMBEDDING_LOCAL_BACKEND = config("EMBEDDING_LOCAL_BACKEND", default="torch")
+EMBEDDING_LOCAL_BATCH_SIZE = config("EMBEDDING_LOCAL_BATCH_SIZE", default=64, cast=int)
+
+# "memory" scores recommendation chunks against an in-process NumPy index
+# (scholarships/vector_index.py); "fused" computes the weighted score in one
+# Postgres query over the union of each chunk's top-k ANN neighbours; "sql"
+# keeps the per-chunk CosineDistance rank fusion for A/B comparison.
+RECOMMENDATION_ENGINE = config("RECOMMENDATION_ENGINE", default="memory")
+RECOMMENDATION_PREFILTER_K = config("RECOMMENDATION_PREFILTER_K", default=50, cast=int)
+
+# ScholarshipViewset ?mode=hybrid: full-text and embedding top-k fused with
+# reciprocal rank fusion. Queries whose embedding takes longer than the
+# budget are served lexical-only.
+HYBRID_SEARCH_K = config("HYBRID_SEARCH_K", default=100, cast=int)
+HYBRID_SEARCH_EMBED_BUDGET_MS = config("HYBRID_SEARCH_EMBED_BUDGET_MS", default=300, cast=int)
+HYBRID_SEARCH_CACHE_TTL = config("HYBRID_SEARCH_CACHE_TTL", default=600, cast=int)
+
+# pgvector query-time recall/latency knobs, applied to every new Postgres
+# connection. hnsw.ef_search must be >= the LIMIT of an ANN query to return
+# a full page; ivfflat.probes only matters if an index is rebuilt as IVFFlat
+# (python manage.py vector_indexes rebuild --method ivfflat).
+PGVECTOR_HNSW_EF_SEARCH = config("PGVECTOR_HNSW_EF_SEARCH", default=100, cast=int)
+PGVECTOR_IVFFLAT_PROBES = config("PGVECTOR_IVFFLAT_PROBES", default=10, cast=int)
 
 SITE_URL = config("SITE_URL", default="http://127.0.0.1:8000")
 FRONTEND_URL = "https://scholar-scope-phi.vercel.app"
@@ -0,0 +1,213 @@
+# scholarscope_scrapers/handlers.py
+#
+# Download handler shared by every ScholarshipBatchSpider crawler running in
+# one process (see scholarships.tasks.scraping._run_multi_spider_process).
+#
+# scrapy-playwright launches one browser per crawler. When N site crawlers
+# share a reactor that means N Firefox processes; this subclass starts
+# Playwright and the browser once per process, hands each crawler its own
+# contexts on that browser, and closes it when the last crawler finishes.
+# A process-wide semaphore (SCRAPE_GLOBAL_CONCURRENCY) caps in-flight
+# downloads across all crawlers; per-domain limits stay with Scrapy's
+# CONCURRENT_REQUESTS_PER_DOMAIN.
+#
+# It also bounds browser memory: pages per context are capped by
+# PLAYWRIGHT_MAX_PAGES_PER_CONTEXT (scrapy-playwright), and each context is
+# retired after PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS page loads — new pages go
+# to a fresh context and the old one closes once its last page does. Pool
+# counters are written to the crawler stats under playwright/pool/.
+
+import asyncio
+import logging
+import resource
+from contextlib import suppress
+
+from scrapy.utils.defer import deferred_to_future
+from scrapy_playwright.handler import Config, ScrapyPlaywrightDownloadHandler, DEFAULT_CONTEXT_NAME
+
+logger = logging.getLogger(__name__)
+
+# The subclass below overrides / calls these scrapy-playwright internals
+# (written against 0.0.44, pinned in both requirements.txt files; the scrape
+# workflow installs the root one). Fail at import rather than crawl with a
+# half-working handler after an upgrade renames one.
+_HANDLER_INTERNALS = (
+    "_launch", "_maybe_launch_browser", "_close", "_create_page", "_create_browser_context",
+    "_deferred_from_coro", "_set_max_concurrent_context_count",
+)
+_CONFIG_FIELDS = ("browser_type_name", "launch_options", "startup_context_kwargs")
+
+_missing = [name for name in _HANDLER_INTERNALS if not hasattr(ScrapyPlaywrightDownloadHandler, name)]
+_missing += [
+    f"Config.{name}" for name in _CONFIG_FIELDS
+    if name not in getattr(Config, "__dataclass_fields__", {})
+]
+if _missing:
+    raise ImportError(
+        "SharedBrowserPlaywrightHandler does not support this scrapy-playwright version; "
+        f"missing: {', '.join(_missing)}"
+    )
+
+
+class _SharedBrowser:
+    """Process-wide Playwright/browser state, reference-counted by handler."""
+    playwright = None
+    browser = None
+    users = 0
+    lock = None
+    download_slots = None
+
+
+class SharedBrowserPlaywrightHandler(ScrapyPlaywrightDownloadHandler):
+
+    def __init__(self, crawler):
+        super().__init__(crawler)
+        self.global_concurrency = crawler.settings.getint("SCRAPE_GLOBAL_CONCURRENCY", 16)
+        self.max_navigations = crawler.settings.getint("PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS", 50)
+        # scrapy-playwright has no global context-args setting; apply ours to
+        # every context this handler creates
+        self.context_args = crawler.settings.getdict("PLAYWRIGHT_CONTEXT_ARGS")
+
+        self.context_generation = {}   # base context name -> current generation
+        self.navigations = {}          # context name -> pages created in it
+        self.open_pages = {}           # context name -> pages not yet closed
+        self.retired = set()           # contexts taking no new pages
+
+    @staticmethod
+    def _lock():
+        if _SharedBrowser.lock is None:
+            _SharedBrowser.lock = asyncio.Lock()
+        return _SharedBrowser.lock
+
+    async def _launch(self) -> None:
+        async with self._lock():
+            if _SharedBrowser.playwright is None:
+                from playwright.async_api import async_playwright
+                logger.info("Starting shared Playwright instance")
+                _SharedBrowser.playwright = await async_playwright().start()
+            _SharedBrowser.users += 1
+
+        self.playwright_context_manager = None
+        self.playwright = _SharedBrowser.playwright
+        self.browser_type = getattr(self.playwright, self.config.browser_type_name)
+
+        if self.config.startup_context_kwargs:
+            await asyncio.gather(*[
+                self._create_browser_context(name=name, context_kwargs=kwargs)
+                for name, kwargs in self.config.startup_context_kwargs.items()
+            ])
+            self._set_max_concurrent_context_count()
+
+    async def _maybe_launch_browser(self) -> None:
+        async with self._lock():
+            if _SharedBrowser.browser is None or not _SharedBrowser.browser.is_connected():
+                logger.info(f"Launching shared browser {self.browser_type.name}")
+                _SharedBrowser.browser = await self.browser_type.launch(**self.config.launch_options)
+                self.stats.inc_value("playwright/browser_count")
+        self.browser = _SharedBrowser.browser
+
+    # ── page pool ─────────────────────────────────────────────────────────────
+
+    async def _create_page(self, request, spider):
+        base = request.meta.get("playwright_context", DEFAULT_CONTEXT_NAME).split("@")[0]
+        generation = self.context_generation.get(base, 0)
+        name = f"{base}@{generation}"
+
+        if self.navigations.get(name, 0) >= self.max_navigations:
+            self._retire(name)
+            generation += 1
+            self.context_generation[base] = generation
+            name = f"{base}@{generation}"
+
+        request.meta["playwright_context"] = name
+        if self.context_args:
+            request.meta.setdefault("playwright_context_kwargs", self.context_args)
+
+        page = await super()._create_page(request, spider)
+        self.navigations[name] = self.navigations.get(name, 0) + 1
+        self.open_pages[name] = self.open_pages.get(name, 0) + 1
+        page.on("close", lambda _page: self._page_closed(name))
+        self._record_pool_stats()
+        return page
+
+    def _page_closed(self, name):
+        self.open_pages[name] = max(0, self.open_pages.get(name, 0) - 1)
+        if name in self.retired and not self.open_pages[name]:
+            asyncio.ensure_future(self._close_context(name))
+        self._record_pool_stats()
+
+    def _retire(self, name):
+        self.retired.add(name)
+        self.stats.inc_value("playwright/pool/contexts_recycled")
+        if not self.open_pages.get(name):
+            asyncio.ensure_future(self._close_context(name))
+
+    async def _close_context(self, name):
+        self.retired.discard(name)
+        self.navigations.pop(name, None)
+        self.open_pages.pop(name, None)
+        wrapper = self.context_wrappers.get(name)
+        if wrapper is not None:
+            logger.debug(f"Closing recycled browser context {name}")
+            with suppress(Exception):
+                await wrapper.context.close()
+
+    def pool_stats(self) -> dict:
+        return {
+            "pages_open": sum(self.open_pages.values()),
+            "contexts_open": len(self.context_wrappers),
+            "navigations_per_context": dict(self.navigations),
+            "rss_mb": _rss_mb(),
+        }
+
+    def _record_pool_stats(self):
+        stats = self.pool_stats()
+        self.stats.set_value("playwright/pool/pages_open", stats["pages_open"])
+        self.stats.max_value("playwright/pool/pages_open/max", stats["pages_open"])
+        self.stats.set_value("playwright/pool/contexts_open", stats["contexts_open"])
+        self.stats.max_value("playwright/pool/rss_mb/max", stats["rss_mb"])
+        for name, count in stats["navigations_per_context"].items():
+            self.stats.set_value(f"playwright/pool/navigations/{name}", count)
+
+    # ── downloads ─────────────────────────────────────────────────────────────
+
+    def download_request(self, request, spider):
+        return self._deferred_from_coro(self._download_with_global_slot(request, spider))
+
+    async def _download_with_global_slot(self, request, spider):
+        if _SharedBrowser.download_slots is None:
+            _SharedBrowser.download_slots = asyncio.Semaphore(self.global_concurrency)
+        async with _SharedBrowser.download_slots:
+            return await deferred_to_future(super().download_request(request, spider))
+
+    async def _close(self) -> None:
+        # Only this crawler's contexts; the browser belongs to the process
+        with suppress(Exception):
+            await asyncio.gather(*[ctx.context.close() for ctx in self.context_wrappers.values()])
+        self.context_wrappers.clear()
+
+        async with self._lock():
+            _SharedBrowser.users = max(0, _SharedBrowser.users - 1)
+            if _SharedBrowser.users:
+                return
+            if _SharedBrowser.browser is not None:
+                logger.info("Closing shared browser")
+                with suppress(Exception):
+                    await _SharedBrowser.browser.close()
+                _SharedBrowser.browser = None
+            if _SharedBrowser.playwright is not None:
+                await _SharedBrowser.playwright.stop()
+                _SharedBrowser.playwright = None
+
+
+def _rss_mb() -> float:
+    """Current resident memory of this process (the crawler, not the browser)."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    # Peak, in KB on Linux; good enough where /proc is unavailable
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
@@ -1,39 +1,72 @@
 # scholarscope_scrapers/pipelines.py
 import logging
+import time
 from scrapy.exceptions import DropItem
 import os
 from itemadapter import ItemAdapter
 from django.utils import timezone
 from django.db import transaction
-from scholarships.utils import generate_fingerprint
+from scholarships.utils import generate_fingerprint, defer_recommendation_invalidation, flush_recommendation_invalidation
+from scholarships.dedup import PLACEHOLDER_TITLE_PREFIX, is_known_fingerprint, is_placeholder_title, similar_titles
 from scholarships.models import Scholarship, ScholarshipScrapeEvent, Tag, Level, ScholarshipCycle
 from asgiref.sync import sync_to_async
-from rapidfuzz import fuzz, utils
+from rapidfuzz import fuzz, process, utils
 from scrapy.exceptions import DropItem
+from scrapy.utils.defer import deferred_from_coro
+from .utils.db import run_db
 
 logger = logging.getLogger(__name__)
 
 BULK_BATCH_SIZE = 100
+FLUSH_INTERVAL = 10  # seconds; a slow crawl still writes at least this often
 FUZZ_THRESHOLD = 85
 DOMAIN_FUZZ_LIMIT = 500
 GLOBAL_FUZZ_LIMIT = 500
+CDIST_MIN_TITLES = 5000   # below this, a single-threaded extractOne is faster than cdist
+FUZZ_WORKERS = -1         # cdist threads; -1 = all cores
+RENEWAL_MATCH_THRESHOLD = 90
 
 class ScholarshipPipeline:
+    """
+    Buffers accepted items and writes them every BULK_BATCH_SIZE items or
+    FLUSH_INTERVAL seconds: one bulk_create for the scholarships, one cached
+    Tag/Level lookup, one bulk_create per M2M through table, and one
+    reembed_scholarships task for the batch. All ORM work runs on the DB
+    thread (utils/db.py), never on the reactor.
+    """
     def __init__(self):
         self.items_processed = 0
         self.items_created = 0
         self.scrape_event = None
-        self.existing_fingerprints = set()
-        self.existing_titles = []
+        self.seen_fingerprints = set()   # this crawl only; stored rows via scholarships.dedup
+        self.catalogue_titles = []   # default_process'd titles of the active catalogue
+        self.buffer = []
+        self.site_name = None
+        self.tag_ids = {}      # Tag.name -> id
+        self.level_ids = {}    # Level.level -> id
+        self.flush_loop = None
+        self.stats = None
+        self.started = None
 
     def open_spider(self, spider):
-        os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
-        from django.db import connection
-        connection.ensure_connection()
+        return deferred_from_coro(self._open_spider(spider))
 
+    async def _open_spider(self, spider):
+        self.stats = spider.crawler.stats
+        self.started = time.monotonic()
+        # Renewals re-save existing scholarships; invalidate caches once at close
+        await run_db(defer_recommendation_invalidation, stats=self.stats)
+        self.scrape_event, self.catalogue_titles = await run_db(self._load, spider, stats=self.stats)
+        self.site_name = spider.site_config.name if hasattr(spider, 'site_config') else spider.name
+
+        from twisted.internet import task
+        self.flush_loop = task.LoopingCall(lambda: deferred_from_coro(self.flush()))
+        self.flush_loop.start(FLUSH_INTERVAL, now=False)
+
+    def _load(self, spider):
         if getattr(spider, "scrape_event_id", None):
-            self.scrape_event = ScholarshipScrapeEvent.objects.get(id=spider.scrape_event_id)
-            self.scrape_event.mark_retried()
+            scrape_event = ScholarshipScrapeEvent.objects.get(id=spider.scrape_event_id)
+            scrape_event.mark_retried()
         else:
             if hasattr(spider, 'site_config'):
                 source_name = spider.site_config.name
@@ -42,145 +75,302 @@ class ScholarshipPipeline:
                 source_name = getattr(spider, "source_name", spider.name)
                 source_url = getattr(spider, "base_url", "Unknown URL")
 
-            self.scrape_event = ScholarshipScrapeEvent.objects.create_scrape_event(
+            scrape_event = ScholarshipScrapeEvent.objects.create_scrape_event(
                 source_name=source_name,
                 source_url=source_url,
             )
-        self.existing_fingerprints = set(Scholarship.objects.values_list("fingerprint", flat=True))
-        self.existing_titles = list(Scholarship.objects.order_by("-created_at").values_list("title", flat=True)[:100])
+        catalogue_titles = [
+            utils.default_process(title)
+            for title in (
+                Scholarship.objects.filter(status="active")
+                .exclude(title__startswith=PLACEHOLDER_TITLE_PREFIX)
+                .values_list("title", flat=True).iterator()
+            )
+        ]
+        return scrape_event, catalogue_titles
 
     
     async def process_item(self, item, spider):
-        from django.db import connection, OperationalError
         adapter = ItemAdapter(item)
         title = adapter.get("title")
         link = adapter.get("link")
         fingerprint = generate_fingerprint(title, link)
         adapter['fingerprint'] = fingerprint
 
-        if fingerprint in self.existing_fingerprints:
+        if fingerprint in self.seen_fingerprints or await run_db(is_known_fingerprint, fingerprint, stats=self.stats):
             raise DropItem(f"Duplicate by fingerprint: {title}")
 
-        for old in self.existing_titles:
-            if title == old: 
+        # Placeholder titles all look alike; the fingerprint (title + link) is enough
+        placeholder = is_placeholder_title(title)
+        if not placeholder:
+            normalized = utils.default_process(title)
+            score = self._best_title_score(normalized)
+            if score == 100:
                 raise DropItem(f"Duplicate by exact title: {title}")
-            
-            if abs(len(title) - len(old)) < 10:
-                if fuzz.token_sort_ratio(title, old) >= 85:
-                    raise DropItem(f"Duplicate by fuzzy title: {title}")
+            if score:
+                raise DropItem(f"Duplicate by fuzzy title ({score:.0f}): {title}")
 
         deadline = adapter.get("end_date")
         if deadline and deadline < timezone.now().date():
             raise DropItem(f"Expired scholarship: {title}")
 
-        site_name = spider.site_config.name if hasattr(spider, 'site_config') else spider.name
+        self.seen_fingerprints.add(fingerprint)
+        if not placeholder:
+            self.catalogue_titles.append(normalized)
+        self.buffer.append(adapter)
+        if len(self.buffer) >= BULK_BATCH_SIZE:
+            await self.flush()
+
+        return item
+
+    def _best_title_score(self, normalized):
+        """Best token_sort_ratio against the catalogue, or None below FUZZ_THRESHOLD."""
+        if not self.catalogue_titles:
+            return None
+        if len(self.catalogue_titles) >= CDIST_MIN_TITLES:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+            else:
+                scores = process.cdist(
+                    [normalized], self.catalogue_titles,
+                    scorer=fuzz.token_sort_ratio, processor=None,
+                    score_cutoff=FUZZ_THRESHOLD, dtype=np.uint8, workers=FUZZ_WORKERS,
+                )[0]
+                best = int(scores.max())
+                return best or None
+        match = process.extractOne(
+            normalized, self.catalogue_titles,
+            scorer=fuzz.token_sort_ratio, processor=None, score_cutoff=FUZZ_THRESHOLD,
+        )
+        return match[1] if match else None
+
+    # ── batched writes ────────────────────────────────────────────────────────
+
+    async def flush(self):
+        if not self.buffer:
+            return
+        batch, self.buffer = self.buffer, []
+        created = await run_db(self._write_batch_with_retry, batch, stats=self.stats)
+        self.items_created += len(created)
+        await run_db(self._after_batch_insert, created, stats=self.stats)
+
+    def _write_batch_with_retry(self, batch):
+        from django.db import connection, OperationalError
         try:
-            self._save_scholarship(adapter, site_name)
+            return self._write_batch(batch)
         except OperationalError:
             connection.close()
-            self._save_scholarship(item, spider)
-        
-        self.existing_fingerprints.add(fingerprint)
-        self.items_created += 1
-        
-        return item
+            return self._write_batch(batch)
 
-    def _save_scholarship(self, item, source_name):
+    def _write_batch(self, batch):
+        """Inserts a batch; falls back to row-by-row if one row conflicts."""
+        from django.db import OperationalError
+        scholarships = [self._build_scholarship(item) for item in batch]
+        _assign_unique_slugs(scholarships)
+        # Committed on its own, before the inserts: ids cached inside a
+        # transaction that rolls back would point at rows that are gone
+        self._resolve_m2m_ids(batch)
+        try:
+            with transaction.atomic():
+                Scholarship.objects.bulk_create(scholarships, batch_size=BULK_BATCH_SIZE)
+                self._link_m2m(list(zip(scholarships, batch)))
+            return scholarships
+        except OperationalError:
+            raise
+        except Exception as e:
+            logger.warning(f"Bulk insert of {len(batch)} items failed ({e}); saving one by one")
+
+        created = []
+        for scholarship, item in zip(scholarships, batch):
+            scholarship.pk = None
+            try:
+                with transaction.atomic():
+                    Scholarship.objects.bulk_create([scholarship])
+                    self._link_m2m([(scholarship, item)])
+                created.append(scholarship)
+            except Exception as e:
+                logger.error(f"Failed to save {item.get('title')}: {e}")
+        return created
+
+    def _build_scholarship(self, item):
         reqs = item.get('requirements', [])
         if isinstance(reqs, list): reqs = "\n".join(reqs)
 
         elig = item.get('eligibility', [])
         if isinstance(elig, list): elig = "\n".join(elig)
 
-        tags_list = item.get('tags', [])
-        levels_list = item.get('levels', [])
+        scholarship = Scholarship(
+            title=item.get('title'),
+            start_date=item.get('start_date'),
+            end_date=item.get('end_date'),
+            description=item.get('description', ''),
+            reward=item.get('reward', ''),
+            link=str(item.get('link')),
+            requirements=reqs,
+            eligibility=elig,
+            source=self.site_name,
+            scrape_event=self.scrape_event,
+            fingerprint=item.get('fingerprint'),
+            scraped_at=item.get('scraped_at'),
+            needs_llm_backfill=bool(item.get('needs_llm_backfill')),
+        )
+        # bulk_create skips Scholarship.save(); apply its truncation here
+        for field in Scholarship._meta.fields:
+            if getattr(field, "max_length", None):
+                value = getattr(scholarship, field.attname, None)
+                if isinstance(value, str) and len(value) > field.max_length:
+                    setattr(scholarship, field.attname, value[:field.max_length])
+        return scholarship
 
-        try:
-            with transaction.atomic():
-                scholarship = Scholarship.objects.create(
-                    title=item.get('title'),
-                    start_date=item.get('start_date'),
-                    end_date=item.get('end_date'),
-                    description=item.get('description', ''),
-                    reward=item.get('reward', ''),
-                    link=str(item.get('link')),
-                    requirements=reqs,
-                    eligibility=elig,
-                    source=source_name,
-                    scrape_event=self.scrape_event,
-                    fingerprint=item.get('fingerprint'),
-                    scraped_at=item.get('scraped_at')
-                )
-
-                for tag_name in tags_list:
-                    if tag_name and tag_name != "general":
-                        tag, _ = Tag.objects.get_or_create(name=tag_name)
-                        scholarship.tags.add(tag)
-
-                for level_name in levels_list:
-                    if level_name and level_name != "unspecified":
-                        level, _ = Level.objects.get_or_create(level=level_name)
-                        scholarship.level.add(level)
+    def _resolve_m2m_ids(self, batch):
+        tag_names = {
+            name for item in batch for name in item.get('tags', [])
+            if name and name != "general"
+        }
+        level_names = {
+            name for item in batch for name in item.get('levels', [])
+            if name and name != "unspecified"
+        }
+        self._resolve_ids(Tag, "name", tag_names, self.tag_ids)
+        self._resolve_ids(Level, "level", level_names, self.level_ids)
 
-        except Exception as e:
-            logger.error(f"Failed to save {item.get('title')}: {e}")
+    def _link_m2m(self, pairs):
+        """Links rows to the tags/levels `_resolve_m2m_ids` already cached."""
+        TagLink = Scholarship.tags.through
+        LevelLink = Scholarship.level.through
+        tag_links, level_links = [], []
+        for scholarship, item in pairs:
+            for tag_id in {self.tag_ids[n] for n in item.get('tags', []) if n in self.tag_ids}:
+                tag_links.append(TagLink(scholarship_id=scholarship.id, tag_id=tag_id))
+            for level_id in {self.level_ids[n] for n in item.get('levels', []) if n in self.level_ids}:
+                level_links.append(LevelLink(scholarship_id=scholarship.id, level_id=level_id))
+
+        TagLink.objects.bulk_create(tag_links, ignore_conflicts=True)
+        LevelLink.objects.bulk_create(level_links, ignore_conflicts=True)
+
+    @staticmethod
+    def _resolve_ids(model, field, names, cache):
+        """Fills `cache` (name -> id) for `names`, creating missing rows in one insert."""
+        missing = names - cache.keys()
+        if not missing:
+            return
+        model.objects.bulk_create([model(**{field: n}) for n in missing], ignore_conflicts=True)
+        cache.update(model.objects.filter(**{f"{field}__in": missing}).values_list(field, "id"))
+
+    def _after_batch_insert(self, scholarships):
+        """What post_save would have done per row, once for the batch."""
+        if not scholarships:
+            return
+        from django.core.cache import cache
+        from scholarships.dedup import remember_fingerprints
+        from scholarships.tasks import reembed_scholarships
+
+        cache.set("scholarships_updated_at", timezone.now().isoformat())
+        remember_fingerprints(s.fingerprint for s in scholarships)
+        reembed_scholarships.delay(scholarship_ids=[s.id for s in scholarships])
+        logger.info(f"Saved {len(scholarships)} scholarships in one batch")
 
     def close_spider(self, spider):
+        return deferred_from_coro(self._close_spider(spider))
+
+    async def _close_spider(self, spider):
+        if self.flush_loop is not None and self.flush_loop.running:
+            self.flush_loop.stop()
+        try:
+            await self.flush()
+            await run_db(self._finish, spider, stats=self.stats)
+        finally:
+            # Always end the deferral opened in _open_spider, even if the final
+            # flush or the ScrapeEvent update fails
+            await run_db(flush_recommendation_invalidation, stats=self.stats)
+
+        # Compare with SCRAPE_DB_THREAD=False for the inline (pre-offload) baseline
+        elapsed = time.monotonic() - self.started
+        if elapsed:
+            logger.info(
+                f"Pipeline throughput: {60 * spider.scraped_count / elapsed:.1f} items/min, "
+                f"{self.stats.get_value('db/seconds', 0):.1f}s in {self.stats.get_value('db/calls', 0)} DB calls"
+            )
+
+    def _finish(self, spider):
         if self.scrape_event:
             self.scrape_event.scholarships_found = spider.scraped_count
             self.scrape_event.scholarships_created = self.items_created
             self.scrape_event.scholarships_skipped = spider.scraped_count - self.items_created
+            if getattr(spider, "llm_queue", None) is not None:
+                self.scrape_event.llm_tokens_used = spider.llm_queue.tokens_reserved
             
             self.scrape_event.mark_completed()
             logger.info(f"Scrape finished. Created {self.items_created} items.")
 
 
+def _assign_unique_slugs(scholarships):
+    """Scholarship.generate_unique_slug for a whole batch in one query."""
+    from django.db.models import Q
+    from django.utils.text import slugify
+
+    bases = [slugify(s.title)[:1000] for s in scholarships]
+    lookup = Q()
+    for base in set(bases):
+        lookup |= Q(slug=base) | Q(slug__startswith=f"{base}-")
+    taken = set(Scholarship.objects.filter(lookup).values_list("slug", flat=True)) if bases else set()
+
+    for scholarship, base in zip(scholarships, bases):
+        slug, counter = base, 1
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        taken.add(slug)
+        scholarship.slug = slug
+
 
 class RenewalAndDuplicatePipeline:
-    def process_item(self, item, spider):
+    async def process_item(self, item, spider):
         adapter = ItemAdapter(item)
         title = adapter.get('title')
         link = adapter.get('link')
-        stop_words = {'the', 'a', 'an', 'international', 'global', '2024', '2025', '2026'}
-        words = title.lower().split()
-        search_term = next((w for w in words if w not in stop_words), words[0])
-        candidates = Scholarship.objects.filter(title__icontains=search_term)
-        
-        best_match = None
-        best_score = 0
-        norm_title_new = utils.default_process(title)
-
-        for old in candidates:
-            norm_title_old = utils.default_process(old.title)
-            score = fuzz.token_set_ratio(norm_title_new, norm_title_old)
-            if score > best_score:
-                best_score = score
-                best_match = old
-
-        if best_match and best_score >= 90:
-            
-            if best_match.status == 'active':
-                raise DropItem(f"Duplicate of active item {best_match.id} (Score: {best_score})")
-
-            elif best_match.status == 'expired':
-                
-                last_deadline = best_match.end_date
-                year_guess = last_deadline.year if last_deadline else (timezone.now().year - 1)
-                
-                ScholarshipCycle.objects.get_or_create(
-                    scholarship=best_match,
-                    batch_year=year_guess,
-                    defaults={"deadline": last_deadline, "status": "expired"}
-                )
-
-                best_match.status = "active"
-                best_match.is_recurring = True
-                best_match.last_renewed_at = timezone.now()
-                best_match.link = link 
-                
-                new_deadline = adapter.get('end_date')
-                best_match.end_date = new_deadline
-                best_match.save()
-                raise DropItem(f"Handled as Renewal for ID {best_match.id}")
+
+        # Top-k trigram neighbours from the index, then one vectorised rescore
+        candidates = await run_db(similar_titles, title, stats=spider.crawler.stats)
+        match = process.extractOne(
+            utils.default_process(title),
+            {sid: utils.default_process(old_title) for sid, old_title, _ in candidates},
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            score_cutoff=RENEWAL_MATCH_THRESHOLD,
+        )
+
+        if match:
+            _, best_score, best_id = match
+            status = next(status for sid, _, status in candidates if sid == best_id)
+
+            if status == 'active':
+                raise DropItem(f"Duplicate of active item {best_id} (Score: {best_score})")
+
+            elif status == 'expired':
+                await run_db(self._renew, best_id, link, adapter.get('end_date'), stats=spider.crawler.stats)
+                raise DropItem(f"Handled as Renewal for ID {best_id}")
         return item
 
+    @staticmethod
+    def _renew(scholarship_id, link, new_deadline):
+        best_match = Scholarship.objects.get(id=scholarship_id)
+
+        last_deadline = best_match.end_date
+        year_guess = last_deadline.year if last_deadline else (timezone.now().year - 1)
+
+        ScholarshipCycle.objects.get_or_create(
+            scholarship=best_match,
+            batch_year=year_guess,
+            defaults={"deadline": last_deadline, "status": "expired"}
+        )
+
+        best_match.status = "active"
+        best_match.is_recurring = True
+        best_match.last_renewed_at = timezone.now()
+        best_match.link = link
+
+        best_match.end_date = new_deadline
+        best_match.save()
@@ -27,6 +27,7 @@ class ScholarshipScrapedSchema(BaseModel):
     tags: List[str] = Field(default_factory=list)
     levels: List[str] = Field(default_factory=list)
     fingerprint: Optional[str] = None
+    needs_llm_backfill: bool = False
 
     # --- FIELD VALIDATORS (Formerly @validator) ---
 
@@ -1,20 +1,28 @@
 import scrapy
+from scrapy import signals
+from scrapy.exceptions import DontCloseSpider
 from datetime import datetime
-import dateparser
 from ..utils.django_setup import setup_django
 from ..utils.llm_engine import LLMEngine
 from ..utils.quality import QualityCheck
+from ..utils.db import run_db, run_db_blocking
+from ..utils.llm_queue import LLMRescueQueue, LLMBudgetExceeded
+from ..utils.extraction_pool import extract_detail
+from ..utils.fetch import SCRAPERAPI_KEY, build_scraperapi_url, is_bot_wall
 from .schemas import ScholarshipScrapedSchema
 from pydantic import ValidationError
 setup_django()
+from django.conf import settings
 from scholarships.models import SiteConfig, Scholarship
 from scholarships.utils import generate_fingerprint
-from scholarships.utils import ScholarshipExtractor
+from scholarships.dedup import PLACEHOLDER_TITLE_PREFIX, known_fingerprints
+from scholarships.dates import parse_date, preload_date_parsers
+from scholarships.corpus import record_page
 from scrapy_playwright.page import PageMethod
+import asyncio
+import functools
+import hashlib
 import json
-import os
-
-SCRAPERAPI_KEY = os.environ.get("SCRAPERAPI_KEY", "")
 
 def should_abort_request(request):
     """
@@ -36,17 +44,6 @@ def should_abort_request(request):
         
     return False
 
-def build_scraperapi_url(target_url: str) -> str:
-    """Wrap a target URL for ScraperAPI with JS rendering enabled."""
-    return (
-        f"http://api.scraperapi.com/"
-        f"?api_key={SCRAPERAPI_KEY}"
-        f"&url={target_url}"
-        f"&render=true"          # JavaScript rendering
-        f"&country_code=us"      
-        f"&keep_headers=false"
-    )
-
 class ScholarshipBatchSpider(scrapy.Spider):
     name = "scholarship_batch"
     custom_settings = {
@@ -56,10 +53,13 @@ class ScholarshipBatchSpider(scrapy.Spider):
         },
         "PLAYWRIGHT_ABORT_REQUEST": should_abort_request,
         "DOWNLOAD_HANDLERS": {
-            "http":  "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+            "http":  "scholarscope_scrapers.scholarscope_scrapers.handlers.SharedBrowserPlaywrightHandler",
+            "https": "scholarscope_scrapers.scholarscope_scrapers.handlers.SharedBrowserPlaywrightHandler",
         },
         "PLAYWRIGHT_BROWSER_TYPE": "firefox",
+        "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": settings.PLAYWRIGHT_MAX_PAGES_PER_CONTEXT,
+        "PLAYWRIGHT_MAX_CONTEXTS": settings.PLAYWRIGHT_MAX_CONTEXTS,
+        "PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS": settings.PLAYWRIGHT_CONTEXT_MAX_NAVIGATIONS,
         "PLAYWRIGHT_LAUNCH_OPTIONS": {"headless": True, "timeout": 60_000},
         "PLAYWRIGHT_CONTEXT_ARGS": {
             "ignore_https_errors": True,
@@ -86,10 +86,7 @@ class ScholarshipBatchSpider(scrapy.Spider):
         if not site_config_id:
             raise ValueError("site_config_id is required!")
 
-        self.site_config = SiteConfig.objects.get(id=site_config_id)
-        from scholarships.models import ListingSource
-        self.sources = ListingSource.objects.filter(site=self.site_config, active=True)
-        self.start_urls = [source.url for source in self.sources]
+        self.site_config, self.start_urls, self.crawl_states = run_db_blocking(_load_site, site_config_id)
         self.scrape_event_id = scrape_event_id
         self.max_items = int(max_items)
         self.scraped_count = 0
@@ -104,6 +101,14 @@ class ScholarshipBatchSpider(scrapy.Spider):
         self.using_scraperapi = bool(SCRAPERAPI_KEY)
         self.scraperapi_failed = False  # flips to True on quota exhaustion
 
+        # "auto" | "http" | "browser" — see SiteConfig.render_strategy
+        self.render_strategy = self.site_config.render_strategy
+        self.http_details = 0
+        self.detail_escalations = 0
+
+        # self.crawl_states: validators from the last run, keyed by URL (see CrawlState)
+        self.crawl_state_updates = {}
+
         for url in self.start_urls:
             list_domain = urlparse(url).netloc.replace("www.", "")
             if list_domain not in self.allowed_domains:
@@ -111,10 +116,42 @@ class ScholarshipBatchSpider(scrapy.Spider):
 
         self.logger.debug(f"Allowed domains: {self.allowed_domains}")
 
-        self.existing_fingerprints = set(
-            Scholarship.objects.values_list("fingerprint", flat=True)
-        )
+        # Fingerprints requested during this crawl; stored ones are checked
+        # per listing page through scholarships.dedup
+        self.seen_fingerprints = set()
         self.llm_engine = LLMEngine()
+        self.llm_queue = None   # needs crawler stats; created in from_crawler
+        # In-flight LLM rescues (see _rescue_item)
+        self.llm_rescues = set()
+        # Load dateparser's locale data now rather than on the first detail page
+        preload_date_parsers()
+        # Per-site CSS selectors, shipped with each page to the extraction pool
+        cfg = self.site_config
+        self.extraction_selectors = {
+            "title": cfg.title_selector,
+            "description": cfg.description_selector,
+            "reward": cfg.reward_selector,
+            "deadline": cfg.deadline_selector,
+            "start_date": cfg.start_date_selector,
+            "requirements": cfg.requirements_selector,
+            "eligibility": cfg.eligibility_selector,
+            "tag": cfg.tag_selector,
+            "level": cfg.level_selector,
+        }
+        # Benchmark corpus directory (SCRAPE_RECORD_CORPUS); None = not recording
+        self.corpus_dir = settings.SCRAPE_RECORD_CORPUS or None
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        spider.llm_queue = LLMRescueQueue(stats=crawler.stats)
+        crawler.signals.connect(spider._keep_open_for_rescues, signal=signals.spider_idle)
+        return spider
+
+    def _keep_open_for_rescues(self, spider):
+        # Nothing left to download, but rescued items still have to come back
+        if self.llm_rescues:
+            raise DontCloseSpider
 
     def _make_scraperapi_request(self, url, callback, **meta_extras):
         """
@@ -133,7 +170,7 @@ class ScholarshipBatchSpider(scrapy.Spider):
             dont_filter=True,  # ScraperAPI URL differs from original, bypass dupe filter
         )
     
-    def _make_playwright_request(self, url, callback, **meta_extras):
+    def _make_playwright_request(self, url, callback, dont_filter=False, **meta_extras):
         """
         Fall back to Scrapy-Playwright for direct browser rendering.
         Used when ScraperAPI key is absent or quota is exhausted.
@@ -155,7 +192,42 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 ],
                 **meta_extras,
             },
+            # No playwright_include_page: scrapy-playwright closes the page
+            # itself after the download, on success or failure
             callback=callback,
+            dont_filter=dont_filter,
+        )
+
+    def _make_http_request(self, url, callback, conditional=True, **meta_extras):
+        """
+        Plain Scrapy download — no browser, no ScraperAPI credits. Conditional
+        (listings) on what this URL returned last run, so an unchanged page
+        costs a 304.
+        """
+        return scrapy.Request(
+            url,
+            callback=callback,
+            headers=self._conditional_headers(url) if conditional else {},
+            # 403/429 reach the callback so parse_list can escalate to a browser
+            meta={"render": "http", "handle_httpstatus_list": [304, 403, 429], **meta_extras},
+        )
+
+    def _make_browser_request(self, url, callback, dont_filter=False, **meta_extras):
+        if self.using_scraperapi and not self.scraperapi_failed:
+            return self._make_scraperapi_request(url, callback=callback, **meta_extras)
+        return self._make_playwright_request(url, callback, dont_filter=dont_filter, **meta_extras)
+
+    def _make_request(self, url, callback, conditional=True, **meta_extras):
+        """Route by render strategy: plain HTTP unless the site needs a browser."""
+        if self.render_strategy == "browser":
+            return self._make_browser_request(url, callback, **meta_extras)
+        return self._make_http_request(url, callback, conditional=conditional, **meta_extras)
+
+    def _escalate(self, response, callback, **meta_extras):
+        """Re-fetch a plain-HTTP response with a browser render."""
+        original_url = response.meta.get("original_url", response.url)
+        return self._make_browser_request(
+            original_url, callback, dont_filter=True, escalated=True, **meta_extras
         )
     
 
@@ -185,14 +257,81 @@ class ScholarshipBatchSpider(scrapy.Spider):
 
 
     def start_requests(self):
-        self.logger.info("start_requests called")
+        self.logger.info(f"start_requests called (render strategy: {self.render_strategy})")
         for url in self.start_urls:
-            if self.using_scraperapi and not self.scraperapi_failed:
-                self.logger.info(f"Routing via ScraperAPI: {url}")
-                yield self._make_scraperapi_request(url, callback=self.parse_list)
+            if self.render_strategy == "browser":
+                # Cheap conditional GET first; only render listings that changed
+                yield self._make_http_request(url, callback=self.parse_probe, handle_httpstatus_all=True)
             else:
-                self.logger.info(f"Routing via Playwright: {url}")
-                yield self._make_playwright_request(url, callback=self.parse_list)
+                yield self._make_request(url, callback=self.parse_list)
+
+    # ── crawl state ───────────────────────────────────────────────────────────
+
+    def _conditional_headers(self, url) -> dict:
+        state = self.crawl_states.get(url)
+        headers = {}
+        if state is not None:
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+        return headers
+
+    @staticmethod
+    def _validators(response) -> dict:
+        def header(name):
+            return (response.headers.get(name) or b"").decode("latin-1")
+        return {
+            "etag":          header("ETag"),
+            "last_modified": header("Last-Modified"),
+            "content_hash":  hashlib.sha256(response.body).hexdigest(),
+        }
+
+    def _is_unchanged(self, response) -> bool:
+        """True for a 304, or a plain-HTTP body identical to the last run's."""
+        if response.status == 304:
+            return True
+        state = self.crawl_states.get(response.meta.get("original_url", response.url))
+        return (
+            state is not None
+            and response.status == 200
+            and state.content_hash == self._validators(response)["content_hash"]
+        )
+
+    def _record_crawl_state(self, url, validators=None) -> None:
+        """Queue a CrawlState upsert; validators=None only refreshes last_seen."""
+        state = self.crawl_states.get(url)
+        if validators is None:
+            if state is None:
+                return
+            validators = {
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "content_hash": state.content_hash,
+            }
+        changed = state is None or state.content_hash != validators["content_hash"]
+        self.crawl_state_updates[url] = {**validators, "changed": changed}
+
+    def _skip_unchanged(self, response) -> None:
+        url = response.meta.get("original_url", response.url)
+        self.logger.info(f"Unchanged since last run ({response.status}) — skipping: {url}")
+        self.crawler.stats.inc_value("crawl_state/unchanged")
+        self._record_crawl_state(url)
+
+    async def parse_probe(self, response):
+        """
+        Conditional plain-HTTP check of a browser-rendered listing. Only a 304
+        (ETag / Last-Modified) counts as unchanged: the plain body of a browser
+        site is a shell or a challenge page, so its hash says nothing.
+        """
+        if response.status == 304:
+            self._skip_unchanged(response)
+            return
+        yield self._make_browser_request(
+            response.url,
+            callback=self.parse_list,
+            crawl_validators=self._validators(response) if response.status == 200 else None,
+        )
 
     # ── List page parser ───────────────────────────────────────────────────────
 
@@ -210,12 +349,24 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 yield self._make_playwright_request(original_url, callback=self.parse_list)
                 return
 
-        if response.status == 403:
-            self.logger.warning(f"Blocked (403) — skipping: {response.url}")
+        if response.meta.get("render") == "http" and self._is_bot_wall(response):
+            # Blocked or challenged over plain HTTP — a browser render may get through
+            self.logger.info(f"Bot wall ({response.status}) over plain HTTP on {response.url}; escalating to browser render.")
+            self.render_strategy = "browser"
+            yield self._escalate(response, self.parse_list, page_number=response.meta.get("page_number", 1))
+            return
+
+        if response.status in (403, 429):
+            self.logger.warning(f"Blocked ({response.status}) — skipping: {response.url}")
             return
         if response.status == 202:
             self.logger.warning(f"Got 202 — page still processing: {response.url}")
 
+        if response.meta.get("render") == "http" and self._is_unchanged(response):
+            # Same listing as last run: its cards, and later pages, are already known
+            self._skip_unchanged(response)
+            return
+
         cfg = self.site_config
         current_page = response.meta.get("page_number", 1)
         MAX_PAGES = 2
@@ -230,6 +381,16 @@ class ScholarshipBatchSpider(scrapy.Spider):
         cards_found = len(response.css(cfg.list_item_selector))
         self.logger.info(f"Cards found on {base_url}: {cards_found}")
 
+        if response.meta.get("render") == "http":
+            if cards_found == 0:
+                # Client-rendered (or bot-walled) listing — needs a browser
+                self.logger.info(f"No cards over plain HTTP on {base_url}; escalating to browser render.")
+                self.render_strategy = "browser"
+                yield self._escalate(response, self.parse_list, page_number=current_page)
+                return
+            if self.render_strategy == "auto":
+                self.render_strategy = "http"
+
         if cards_found == 0:
             self.logger.warning(
                 f"No cards matched selector '{cfg.list_item_selector}' on {base_url}. "
@@ -237,14 +398,9 @@ class ScholarshipBatchSpider(scrapy.Spider):
             )
             return
 
+        from urllib.parse import urljoin
+        cards = []
         for card in response.css(cfg.list_item_selector):
-            if self.scraped_count >= self.max_items:
-                self.logger.info(f"Reached max ({self.max_items}) for {cfg.name}")
-                break
-            if self.consecutive_duplicates >= 3:
-                self.logger.info("Stopping: 3 consecutive duplicates")
-                break
-
             relative_link = (
                 card.css(link_sel_raw).attrib.get("href")
                 or card.css(link_sel_raw).xpath("@href").get()
@@ -261,11 +417,37 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 continue
 
             # Resolve relative URL against the original page URL, not ScraperAPI URL
-            from urllib.parse import urljoin
             url = urljoin(base_url, relative_link)
-            fingerprint = generate_fingerprint(title, url)
+            cards.append((title, url, generate_fingerprint(title, url)))
+
+        # Only a listing that produced cards is worth remembering — never a bot wall.
+        # Browser-rendered bodies vary per render, so their hash covers the
+        # sorted card links; ETag / Last-Modified are the probe's.
+        if response.meta.get("render") == "http":
+            self._record_crawl_state(base_url, self._validators(response))
+        else:
+            probe = response.meta.get("crawl_validators") or {}
+            card_links = "\n".join(sorted(url for _, url, _ in cards))
+            self._record_crawl_state(base_url, {
+                "etag":          probe.get("etag", ""),
+                "last_modified": probe.get("last_modified", ""),
+                "content_hash":  hashlib.sha256(card_links.encode("utf-8")).hexdigest(),
+            })
+
+        # One filter/EXISTS round trip for the whole page
+        stored = await run_db(
+            known_fingerprints, [fingerprint for _, _, fingerprint in cards], stats=self.crawler.stats
+        )
 
-            if fingerprint in self.existing_fingerprints:
+        for title, url, fingerprint in cards:
+            if self.scraped_count >= self.max_items:
+                self.logger.info(f"Reached max ({self.max_items}) for {cfg.name}")
+                break
+            if self.consecutive_duplicates >= 3:
+                self.logger.info("Stopping: 3 consecutive duplicates")
+                break
+
+            if fingerprint in stored or fingerprint in self.seen_fingerprints:
                 self.consecutive_duplicates += 1
                 self.logger.info(
                     f"Duplicate #{self.consecutive_duplicates}/3: {title}"
@@ -273,24 +455,16 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 continue
 
             self.consecutive_duplicates = 0
-            self.existing_fingerprints.add(fingerprint)
+            self.seen_fingerprints.add(fingerprint)
             self.scraped_count += 1
 
-            # Route detail page requests through same mechanism
-            if self.using_scraperapi and not self.scraperapi_failed:
-                yield self._make_scraperapi_request(
-                    url,
-                    callback=self.parse_detail,
-                    fingerprint=fingerprint,
-                    title=title,
-                )
-            else:
-                yield self._make_playwright_request(
-                    url,
-                    callback=self.parse_detail,
-                    fingerprint=fingerprint,
-                    title=title,
-                )
+            yield self._make_request(
+                url,
+                callback=self.parse_detail,
+                conditional=False,   # a 304 here would drop the page before it is stored
+                fingerprint=fingerprint,
+                title=title,
+            )
 
         # ── Pagination ─────────────────────────────────────────────────────────
         if current_page < MAX_PAGES and self.consecutive_duplicates < 3:
@@ -301,99 +475,146 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 or response.css(".pagination a.active + a::attr(href)").get()
             )
             if next_page:
-                from urllib.parse import urljoin
                 next_url = urljoin(base_url, next_page)
-                if self.using_scraperapi and not self.scraperapi_failed:
-                    yield self._make_scraperapi_request(
-                        next_url,
-                        callback=self.parse_list,
-                        page_number=current_page + 1,
-                    )
-                else:
-                    yield self._make_playwright_request(
-                        next_url,
-                        callback=self.parse_list,
-                        page_number=current_page + 1,
-                    )
+                yield self._make_request(
+                    next_url,
+                    callback=self.parse_list,
+                    page_number=current_page + 1,
+                )
     # ── detail page ───────────────────────────────────────────────────────────
 
     async def parse_detail(self, response):
-        cfg = self.site_config
+        if response.meta.get("render") == "http" and self._is_bot_wall(response):
+            self.http_details += 1
+            self.detail_escalations += 1
+            yield self._escalate(
+                response,
+                self.parse_detail,
+                fingerprint=response.meta.get("fingerprint"),
+                title=response.meta.get("title"),
+            )
+            return
 
-        # ── build extractor (Scrapy response mode) ────────────────────────────
-        extractor = ScholarshipExtractor(scrapy_response=response)
+        # ── extraction + quality check (worker process, see extraction_pool) ──
         original_url = response.meta.get("original_url", response.url)
+        if self.corpus_dir:
+            # A browser re-render of the same URL overwrites the plain-HTTP record.
+            # gzip + file write in the default executor, off the reactor thread
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                record_page,
+                self.corpus_dir,
+                url=original_url,
+                body=response.text,
+                headers=dict(response.headers.to_unicode_dict()),
+                status=response.status,
+                site_config_id=self.site_config.id,
+                selectors=self.extraction_selectors,
+                render=response.meta.get("render"),
+            ))
+        extracted, quality_report, clean_text = await extract_detail(
+            response.text, response.url, self.extraction_selectors, stats=self.crawler.stats,
+        )
         item = {
-            "title":       extractor.extract_title(cfg.title_selector),
-            "description": extractor.extract_description(cfg.description_selector),
-            "reward":      extractor.extract_reward(cfg.reward_selector),
-            "link":        original_url,
-            "end_date":    extractor.extract_date("end",   cfg.deadline_selector),
-            "start_date":  extractor.extract_date("start", cfg.start_date_selector),
-            "requirements": extractor.extract_requirements(
-                css_selector=cfg.requirements_selector,
-                fallback_text=extractor.clean_text,
-            ),
-            "eligibility": extractor.extract_eligibility(
-                css_selector=cfg.eligibility_selector,
-                fallback_text=extractor.clean_text,
-            ),
-            "tags":   extractor.extract_tags(cfg.tag_selector),
-            "levels": extractor.extract_levels(cfg.level_selector),
+            **extracted,
+            "link":       original_url,
             "scraped_at": datetime.now().isoformat(),
         }
 
-        # ── quality check + optional LLM rescue ───────────────────────────────
-        quality_report = QualityCheck.get_quality_score(
-            item, ["title", "reward", "end_date", "description", "requirements", "eligibility"]
-        )
+        # ── weak extractions ──────────────────────────────────────────────────
+
+        if response.meta.get("render") == "http":
+            self.http_details += 1
+            if QualityCheck.should_full_regenerate(quality_report):
+                # Likely rendered client-side; a browser render is cheaper than an LLM rescue
+                self.detail_escalations += 1
+                self.logger.info(f"Weak plain-HTTP extraction for {original_url}; escalating to browser render.")
+                yield self._escalate(
+                    response,
+                    self.parse_detail,
+                    fingerprint=response.meta.get("fingerprint"),
+                    title=response.meta.get("title"),
+                )
+                return
 
         if not item.get("reward"):
             item["reward"] = "Amount not specified"
 
-        if QualityCheck.should_full_regenerate(quality_report):
-            self.logger.info(f"Full LLM extraction. Score: {quality_report['quality_score']}")
-            recovered = await self.llm_engine.extract_data(response.text, item["link"])
-            
-            if isinstance(recovered, list):
-                recovered = recovered[0] if recovered else {}
+        # ── optional LLM rescue ───────────────────────────────────────────────
+        # Run as a detached task so this response leaves the scraper slot now;
+        # the rescued item comes back through _emit_rescued.
+        if QualityCheck.should_full_regenerate(quality_report) or quality_report["needs_llm"]:
+            task = asyncio.ensure_future(self._rescue_item(item, quality_report, response.text, clean_text))
+            self.llm_rescues.add(task)
+            task.add_done_callback(self.llm_rescues.discard)
+            return
+
+        validated = self._validate_item(item)
+        if validated is not None:
+            yield validated
+
+    async def _rescue_item(self, item, quality_report, html, clean_text):
+        """Fill a weak item through the crawl's LLMRescueQueue, then hand it back to the engine."""
+        original_url = item["link"]
+        # Worst extractions first when the LLM queue is backed up
+        deficit = 1.0 - quality_report["quality_score"]
+        try:
+            if QualityCheck.should_full_regenerate(quality_report):
+                self.logger.info(f"Full LLM extraction. Score: {quality_report['quality_score']}")
+                recovered = await self.llm_queue.submit(
+                    lambda: self.llm_engine.extract_data(html, original_url),
+                    deficit=deficit + 1.0, text=clean_text, kind="full",
+                )
+                if isinstance(recovered, list):
+                    recovered = recovered[0] if recovered else {}
+            else:
+                fields = list(set(
+                    quality_report["failed_fields"]
+                    + [f for f, _, _ in quality_report["low_confidence_fields"]]
+                ))
+                self.logger.info(f"Partial LLM fix for: {fields}")
+                recovered = await self.llm_queue.submit(
+                    lambda: self.llm_engine.recover_specific_fields(clean_text, fields),
+                    deficit=deficit, text=clean_text, kind="partial",
+                ) if fields else {}
+
             if isinstance(recovered, str):
                 try:
-                    import json
                     recovered = json.loads(recovered)
                 except json.JSONDecodeError:
-                    self.logger.error("Failed to parse LLM response as JSON")
+                    self.logger.error(f"Failed to parse LLM response for {original_url} as JSON")
                     recovered = {}
-                    
-            _parse_dates_inplace(recovered)
-            item.update(recovered)
 
-        elif quality_report["needs_llm"]:
-            fields = list(set(
-                quality_report["failed_fields"]
-                + [f for f, _, _ in quality_report["low_confidence_fields"]]
-            ))
-            if fields:
-                self.logger.info(f"Partial LLM fix for: {fields}")
-                recovered = await self.llm_engine.recover_specific_fields(
-                    extractor.clean_text, fields
-                )
-                
-                if isinstance(recovered, str):
-                    try:
-                        import json
-                        recovered = json.loads(recovered)
-                    except json.JSONDecodeError:
-                        self.logger.error("Failed to parse partial LLM response as JSON")
-                        recovered = {}
-                        
-                _parse_dates_inplace(recovered)
-                item.update(recovered)
+            _parse_dates_inplace(recovered)
+            item.update(recovered or {})
+        except LLMBudgetExceeded as e:
+            self.logger.info(f"Storing {original_url} without LLM rescue: {e}")
+            item["needs_llm_backfill"] = True
+        except Exception as e:
+            self.logger.warning(f"LLM rescue failed for {original_url}: {e}")
+            item["needs_llm_backfill"] = True
+
+        # A data: request costs nothing to "download" and runs the item through
+        # the normal callback -> item pipeline path
+        self.crawler.engine.crawl(scrapy.Request(
+            "data:,",
+            callback=self._emit_rescued,
+            cb_kwargs={"item": item},
+            dont_filter=True,
+        ))
+
+    def _emit_rescued(self, response, item):
+        validated = self._validate_item(item)
+        if validated is not None:
+            yield validated
+
+    def _validate_item(self, item):
+        """Fill defaults and validate; None when the item cannot be stored."""
+        original_url = item["link"]
 
         # ── defaults / guard rails ────────────────────────────────────────────
-        item.setdefault("title",       f"Unknown Scholarship - {response.url}")
-        item.setdefault("link",        original_url)
-        item.setdefault("description", "Description unavailable.")
+        # Items flagged for the backfill keep placeholders until it replaces them
+        item["title"] = item.get("title") or f"{PLACEHOLDER_TITLE_PREFIX}{original_url}"
+        item["description"] = item.get("description") or "Description unavailable."
         item.setdefault("scraped_at",  datetime.now().isoformat())
 
         for field in ["requirements", "eligibility", "tags", "levels"]:
@@ -401,9 +622,66 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 item[field] = []
 
         try:
-            yield ScholarshipScrapedSchema(**item).dict()
+            return ScholarshipScrapedSchema(**item).dict()
         except ValidationError as e:
             self.logger.warning(f"Dropping '{item.get('title')}': {e}")
+            return None
+
+    def closed(self, reason):
+        from scrapy.utils.defer import deferred_from_coro
+        if self.llm_rescues:
+            # Closed early (shutdown, CloseSpider): these items are not stored
+            self.logger.warning(f"Cancelling {len(self.llm_rescues)} pending LLM rescues")
+            for task in list(self.llm_rescues):
+                task.cancel()
+        if self.llm_queue is not None:
+            self.llm_queue.close()
+        return deferred_from_coro(run_db(self._persist_site_state))
+
+    def _persist_site_state(self):
+        """Remember which fetch strategy this site needs so the next run skips the probe."""
+        strategy = self.render_strategy
+        if strategy == "http" and self.http_details and self.detail_escalations * 2 > self.http_details:
+            # Listing is server-rendered but most detail pages are not
+            strategy = "browser"
+        if strategy != "auto" and strategy != self.site_config.render_strategy:
+            self.logger.info(f"Storing render strategy '{strategy}' for {self.site_config.name}")
+            SiteConfig.objects.filter(id=self.site_config.id).update(render_strategy=strategy)
+
+        self._save_crawl_states()
+
+    def _save_crawl_states(self) -> None:
+        from django.utils import timezone
+        from scholarships.models import CrawlState
+
+        if not self.crawl_state_updates:
+            return
+        now = timezone.now()
+        states = []
+        for url, fields in self.crawl_state_updates.items():
+            previous = self.crawl_states.get(url)
+            states.append(CrawlState(
+                site=self.site_config,
+                url=url,
+                etag=fields["etag"][:255],
+                last_modified=fields["last_modified"][:64],
+                content_hash=fields["content_hash"],
+                last_seen=now,
+                last_changed=now if fields["changed"] or previous is None else previous.last_changed,
+            ))
+        CrawlState.objects.bulk_create(
+            states,
+            update_conflicts=True,
+            unique_fields=["url"],
+            update_fields=["etag", "last_modified", "content_hash", "last_seen", "last_changed"],
+        )
+        self.logger.info(f"Saved crawl state for {len(states)} URLs")
+
+    def _is_bot_wall(self, response) -> bool:
+        """A block or challenge page instead of content (see utils.fetch.is_bot_wall)."""
+        if response.status == 304:
+            return False
+        return is_bot_wall(response.status, response.body[:5000].decode("utf-8", "ignore"))
 
     def _is_scraperapi_quota_error(self, response) -> bool:
         """
@@ -424,16 +702,26 @@ class ScholarshipBatchSpider(scrapy.Spider):
                 return True
         return False
 # ─────────────────────────────────────────────────────────────────────────────
-# Shared helper
+# Shared helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _load_site(site_config_id):
+    """SiteConfig, active listing URLs and CrawlState by URL, read on the DB thread."""
+    from scholarships.models import ListingSource, CrawlState
+
+    site_config = SiteConfig.objects.get(id=site_config_id)
+    start_urls = list(
+        ListingSource.objects.filter(site=site_config, active=True).values_list("url", flat=True)
+    )
+    crawl_states = {state.url: state for state in CrawlState.objects.filter(site=site_config)}
+    return site_config, start_urls, crawl_states
+
 def _parse_dates_inplace(data: dict) -> None:
     """Parse any string date values in 'end_date' / 'start_date' in-place."""
     if not isinstance(data, dict):
         return
-    
+
     for key in ("end_date", "start_date"):
         val = data.get(key)
         if isinstance(val, str):
-            dt = dateparser.parse(val)
-            data[key] = dt.date() if dt else None
+            data[key] = parse_date(val)
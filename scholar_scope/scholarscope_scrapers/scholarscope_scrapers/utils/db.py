@@ -0,0 +1,70 @@
+# scholarscope_scrapers/scholarscope_scrapers/utils/db.py
+#
+# Every ORM call made by the spider and pipelines goes through here, onto
+# one dedicated worker thread. The reactor thread runs an asyncio loop that
+# also drives every Playwright download, so a blocking Postgres round trip
+# there stalls the whole crawl; on the worker it only delays other DB work.
+#
+# One thread keeps Django's thread-local connection stable for the crawl and
+# serialises writes the way the single reactor thread used to. At most
+# DB_QUEUE_LIMIT calls wait for it; further callers back off in the loop.
+#
+# SCRAPE_DB_THREAD=False runs calls inline on the reactor (the old behaviour)
+# so crawl throughput can be compared with the same build.
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+DB_QUEUE_LIMIT = 64
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape-db")
+_queue_slots = None
+
+
+def _offloaded() -> bool:
+    if settings.SCRAPE_DB_THREAD:
+        return True
+    import os
+    os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
+    return False
+
+
+def _timed(fn, stats):
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if stats is not None:
+                stats.inc_value("db/calls")
+                stats.inc_value("db/seconds", time.perf_counter() - started)
+    return call
+
+
+async def run_db(fn, *args, stats=None, **kwargs):
+    """Await blocking ORM code `fn(*args, **kwargs)` run on the DB thread."""
+    global _queue_slots
+    call = functools.partial(_timed(fn, stats), *args, **kwargs)
+    if not _offloaded():
+        return call()
+
+    if _queue_slots is None:
+        _queue_slots = asyncio.Semaphore(DB_QUEUE_LIMIT)
+    async with _queue_slots:
+        return await asyncio.get_running_loop().run_in_executor(_executor, call)
+
+
+def run_db_blocking(fn, *args, **kwargs):
+    """
+    Run `fn` on the DB thread and wait for it. Only for one-off reads in
+    synchronous hooks (spider __init__), where awaiting is not possible; the
+    loop still blocks, but Django's async-safety check is satisfied.
+    """
+    if not _offloaded():
+        return fn(*args, **kwargs)
+    return _executor.submit(fn, *args, **kwargs).result()
@@ -0,0 +1,104 @@
+# scholarscope_scrapers/scholarscope_scrapers/utils/extraction_pool.py
+#
+# Detail-page extraction off the reactor. ScholarshipExtractor (trafilatura,
+# XPath scans, regex heuristics) and QualityCheck are pure CPU; run inline in
+# parse_detail they hold the reactor thread — which also drives every
+# download and browser page — for the whole of each page.
+#
+# extract_detail() ships the page HTML to a pool of SCRAPE_EXTRACTION_WORKERS
+# processes (one per core by default), shared by every crawler in the
+# process, and awaits the fields and quality report. Workers are spawned,
+# not forked: the parent has live reactor, DB and Playwright threads. They
+# import only scholarships.extraction and ..utils.quality, neither of which
+# needs Django set up.
+#
+# SCRAPE_EXTRACTION_WORKERS=0 extracts inline (the old behaviour). A worker
+# that dies (e.g. out of memory on a pathological page) breaks the pool; that
+# page is extracted inline and the next one starts a fresh pool.
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from scholarships.extraction import ScholarshipExtractor
+
+from .quality import QualityCheck
+
+logger = logging.getLogger(__name__)
+
+QUALITY_FIELDS = ["title", "reward", "end_date", "description", "requirements", "eligibility"]
+
+_executor = None
+
+
+def _init_worker():
+    from scholarships.dates import preload_date_parsers
+    preload_date_parsers()
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        workers = settings.SCRAPE_EXTRACTION_WORKERS
+        logger.info(f"Starting extraction pool with {workers} worker processes")
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _executor
+
+
+def extract_fields(html: str, url: str, selectors: dict) -> tuple:
+    """
+    (fields, quality report, clean_text) for one detail page. Runs in a pool
+    worker, so arguments and results must pickle: HTML in, plain data out.
+    """
+    extractor = ScholarshipExtractor(raw_html=html, url=url)
+    fields = {
+        "title":       extractor.extract_title(selectors.get("title")),
+        "description": extractor.extract_description(selectors.get("description")),
+        "reward":      extractor.extract_reward(selectors.get("reward")),
+        "end_date":    extractor.extract_date("end",   selectors.get("deadline")),
+        "start_date":  extractor.extract_date("start", selectors.get("start_date")),
+        "requirements": extractor.extract_requirements(
+            css_selector=selectors.get("requirements"),
+            fallback_text=extractor.clean_text,
+        ),
+        "eligibility": extractor.extract_eligibility(
+            css_selector=selectors.get("eligibility"),
+            fallback_text=extractor.clean_text,
+        ),
+        "tags":   extractor.extract_tags(selectors.get("tag")),
+        "levels": extractor.extract_levels(selectors.get("level")),
+    }
+    return fields, QualityCheck.get_quality_score(fields, QUALITY_FIELDS), extractor.clean_text
+
+
+async def extract_detail(html: str, url: str, selectors: dict, stats=None) -> tuple:
+    """Await extract_fields(html, url, selectors) from the pool (or inline)."""
+    global _executor
+    started = time.perf_counter()
+    try:
+        if settings.SCRAPE_EXTRACTION_WORKERS > 0:
+            executor = _pool()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, extract_fields, html, url, selectors,
+                )
+            except BrokenProcessPool as e:
+                logger.warning(f"Extraction pool broke ({e}); extracting {url} inline")
+                if stats is not None:
+                    stats.inc_value("extraction/pool_broken")
+                if _executor is executor:
+                    _executor = None
+                    executor.shutdown(wait=False)
+        return extract_fields(html, url, selectors)
+    finally:
+        if stats is not None:
+            stats.inc_value("extraction/pages")
+            stats.inc_value("extraction/seconds", time.perf_counter() - started)
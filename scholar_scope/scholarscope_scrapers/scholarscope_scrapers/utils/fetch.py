@@ -0,0 +1,106 @@
+# scholarscope_scrapers/scholarscope_scrapers/utils/fetch.py
+#
+# Render path shared by ScholarshipBatchSpider and code that fetches a
+# detail page outside a crawl (scholarships.tasks.llm.backfill_scholarship_llm_fields).
+#
+# PageFetcher follows the spider's routing for one page: plain HTTP unless
+# the site's render_strategy is "browser" or the page comes back as a bot
+# wall, then ScraperAPI when SCRAPERAPI_KEY is set, else (or when ScraperAPI
+# fails) a local headless Firefox. It is synchronous; the browser starts on
+# first use and is reused until close().
+
+import logging
+import os
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+SCRAPERAPI_KEY = os.environ.get("SCRAPERAPI_KEY", "")
+BROWSER_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/115.0"
+BOT_WALL_PHRASES = (
+    "cf-chl",
+    "just a moment...",
+    "checking your browser",
+    "captcha-delivery",
+    "attention required!",
+)
+
+
+def build_scraperapi_url(target_url: str) -> str:
+    """Wrap a target URL for ScraperAPI with JS rendering enabled."""
+    return (
+        f"http://api.scraperapi.com/"
+        f"?api_key={SCRAPERAPI_KEY}"
+        f"&url={target_url}"
+        f"&render=true"          # JavaScript rendering
+        f"&country_code=us"
+        f"&keep_headers=false"
+    )
+
+
+def is_bot_wall(status: int, body: str) -> bool:
+    """
+    A block or challenge page instead of content:
+    - HTTP 403 or 429
+    - a bot-challenge / captcha body (Cloudflare, DataDome, etc.)
+    """
+    if status in (403, 429):
+        return True
+    body = body[:5000].lower()
+    return any(phrase in body for phrase in BOT_WALL_PHRASES)
+
+
+class PageFetcher:
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self._playwright = None
+        self._browser = None
+
+    def fetch(self, url: str, render_strategy: str = "auto") -> str:
+        """HTML for `url`, rendered the way a crawl of a `render_strategy` site would."""
+        if render_strategy != "browser":
+            response = requests.get(url, timeout=self.timeout, headers={"User-Agent": BROWSER_USER_AGENT})
+            if not is_bot_wall(response.status_code, response.text):
+                response.raise_for_status()
+                return response.text
+            logger.info(f"Bot wall on plain fetch of {url}; rendering in a browser")
+        return self._render(url)
+
+    def _render(self, url: str) -> str:
+        if SCRAPERAPI_KEY:
+            try:
+                response = requests.get(build_scraperapi_url(url), timeout=90)
+                response.raise_for_status()
+                return response.text
+            except requests.RequestException as e:
+                # Quota exhausted or ScraperAPI down: same fallback as the spider
+                logger.warning(f"ScraperAPI failed for {url} ({e}); using local Playwright")
+        return self._render_locally(url)
+
+    def _render_locally(self, url: str) -> str:
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.firefox.launch(headless=True, timeout=60_000)
+        page = self._browser.new_page(user_agent=BROWSER_USER_AGENT, ignore_https_errors=True)
+        try:
+            page.goto(url, wait_until="networkidle", timeout=60_000)
+            return page.content()
+        finally:
+            page.close()
+
+    def close(self):
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,106 @@
+# scholarscope_scrapers/scholarscope_scrapers/utils/llm_queue.py
+#
+# Crawl-scoped queue for LLM rescue calls started from parse_detail; the
+# offline backfill (scholarships.tasks.llm.backfill_scholarship_llm_fields)
+# uses one per run too.
+#
+# At most SCRAPE_LLM_CONCURRENCY calls run at once; waiting jobs are served
+# worst-extraction-first (quality deficit), so when the budget runs out it
+# is the nearly-fine pages that go without. Every job reserves an estimated
+# token cost against SCRAPE_LLM_TOKEN_BUDGET for the crawl (one scrape
+# event); a job that no longer fits raises LLMBudgetExceeded and the caller
+# stores the item as-is, flagged for the backfill.
+#
+# Token counts are estimates (~4 characters per token plus an output
+# allowance): the provider fallback chain in generate_text does not report
+# usage, and an estimate is enough to bound spend.
+
+import asyncio
+import itertools
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+OUTPUT_TOKENS = {"full": 800, "partial": 300}
+MAX_PROMPT_CHARS = 40_000   # trafilatura output rarely exceeds this; cap the estimate
+
+
+class LLMBudgetExceeded(Exception):
+    pass
+
+
+class LLMRescueQueue:
+
+    def __init__(self, stats=None, concurrency=None, token_budget=None):
+        self.stats = stats
+        self.concurrency = concurrency or settings.SCRAPE_LLM_CONCURRENCY
+        self.token_budget = token_budget if token_budget is not None else settings.SCRAPE_LLM_TOKEN_BUDGET
+        self.tokens_reserved = 0
+        self.over_budget = 0
+        self._queue = None
+        self._workers = []
+        self._order = itertools.count()   # FIFO among equal deficits
+
+    @staticmethod
+    def estimate_tokens(text: str, kind: str) -> int:
+        return min(len(text or ""), MAX_PROMPT_CHARS) // CHARS_PER_TOKEN + OUTPUT_TOKENS[kind]
+
+    def _start(self):
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.ensure_future(self._worker()) for _ in range(self.concurrency)]
+
+    async def submit(self, call, *, deficit: float, text: str, kind: str = "partial"):
+        """
+        Queue `call()` (a coroutine factory) and wait for its result.
+        Higher `deficit` runs sooner. Raises LLMBudgetExceeded instead of
+        calling when the crawl's budget cannot cover the estimate.
+        """
+        if self._queue is None:
+            self._start()
+        future = asyncio.get_running_loop().create_future()
+        tokens = self.estimate_tokens(text, kind)
+        await self._queue.put((-deficit, next(self._order), call, tokens, kind, future))
+        return await future
+
+    async def _worker(self):
+        while True:
+            _, _, call, tokens, kind, future = await self._queue.get()
+            try:
+                if self.token_budget and self.tokens_reserved + tokens > self.token_budget:
+                    self.over_budget += 1
+                    self._inc("llm/over_budget")
+                    if not future.done():
+                        future.set_exception(LLMBudgetExceeded(
+                            f"{tokens} tokens would exceed the crawl budget "
+                            f"({self.tokens_reserved}/{self.token_budget} used)"
+                        ))
+                    continue
+                self.tokens_reserved += tokens
+                self._inc(f"llm/calls/{kind}")
+                self._inc("llm/tokens_estimated", tokens)
+                try:
+                    result = await call()
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    def _inc(self, key, count=1):
+        if self.stats is not None:
+            self.stats.inc_value(key, count)
+
+    @property
+    def estimated_cost(self) -> float:
+        return self.tokens_reserved / 1000 * settings.SCRAPE_LLM_COST_PER_1K_TOKENS
+
+    def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
@@ -3,6 +3,48 @@ from datetime import datetime, date
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from scholarships.keywords import KeywordSet
+
+# Compiled once; the validators run for every field of every scraped item
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{5,}')
+_NAV_ELEMENT_RE   = re.compile(r'^(?:page \d+|\d+ of \d+|next|previous|prev)$')
+_URL_TLD_RE       = re.compile(r'\.(com|org|edu|gov|net)(/|$)')
+_CURRENCY_AMOUNT_RE = re.compile(r'[\$£€¥₹]\s*[\d,]+')
+_AMOUNT_UNIT_RE   = re.compile(r'\d+[,.]?\d*\s*(dollars?|usd|euro|euros?|pounds?|gbp)')
+_THOUSANDS_RE     = re.compile(r'\d+k')
+_YEAR_RE          = re.compile(r'\b(19|20)\d{2}\b')
+_SENTENCE_END_RE  = re.compile(r'[.!?]+')
+_DATE_PATTERNS = [
+    (re.compile(pattern), confidence) for pattern, confidence in [
+        (r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', 0.95),  # 12/31/2024
+        (r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', 0.95),     # 2024-12-31
+        (r'\b\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b', 0.95),
+        (r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b', 0.95),
+        (r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+\d{1,2},?\s+\d{4}\b', 0.9),
+        (r'\b\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+\d{4}\b', 0.9),
+    ]
+]
+
+_FUNDING_KEYWORDS  = KeywordSet(['tuition', 'funded', 'full ride', 'scholarship', 'stipend', 'allowance'])
+_FULL_FUNDING      = KeywordSet(['full tuition', 'full ride', 'fully funded'])
+_PERIOD_KEYWORDS   = KeywordSet(['per year', 'annually', 'total'])
+_VAGUE_QUALIFIERS  = KeywordSet(['up to', 'varies', 'various', 'multiple', 'range'])
+_MONTH_NAMES       = KeywordSet(['january', 'february', 'march', 'april', 'may', 'june',
+                                 'july', 'august', 'september', 'october', 'november', 'december'])
+_MONTH_ABBREVS     = KeywordSet(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'sept',
+                                 'oct', 'nov', 'dec'])
+_RELATIVE_DATES    = KeywordSet(['ongoing', 'rolling', 'rolling deadline', 'varies', 'annual', 'annually',
+                                 'quarterly', 'open', 'continuous'])
+_MASHUP_INDICATORS = KeywordSet([
+    " | how to apply",
+    " | fully funded",
+    "scholarship region",
+    "read also:",
+    "related posts:",
+    "you may also like",
+])
+
+
 class QualityCheck:
     GARBAGE_PHRASES = {
         "general": {
@@ -43,6 +85,8 @@ class QualityCheck:
         "applicant", "enrollment", "gpa", "merit", "financial", "award",
         "eligible", "scholarship", "grant", "application"
     }
+    _scholarship_keywords = KeywordSet(sorted(SCHOLARSHIP_KEYWORDS))
+    _description_garbage = KeywordSet(sorted(GARBAGE_PHRASES["description"]))
 
     @classmethod
     def check(cls, field_name: str, value: Any) -> Dict[str, Any]:
@@ -103,7 +147,7 @@ class QualityCheck:
             return True, f"Low alphanumeric density ({alnum_chars}/{len(t)})"
         
         # Repeated characters (e.g., "......." or "-------")
-        if re.search(r'(.)\1{5,}', t):
+        if _REPEATED_CHAR_RE.search(t):
             return True, "Contains repeated characters"
         
         # Just a year or short number
@@ -111,17 +155,9 @@ class QualityCheck:
             return True, "Just a number"
         
         # Common navigation patterns
-        nav_patterns = [
-            r'^page \d+$',
-            r'^\d+ of \d+$',
-            r'^next$',
-            r'^previous$',
-            r'^prev$',
-        ]
-        for pattern in nav_patterns:
-            if re.match(pattern, t):
-                return True, f"Navigation element: '{t}'"
-            
+        if _NAV_ELEMENT_RE.match(t):
+            return True, f"Navigation element: '{t}'"
+
         return False, None
 
     @classmethod
@@ -175,7 +211,7 @@ class QualityCheck:
             }
         
         # Check for URLs in title
-        if t_lower.startswith(('http://', 'https://', 'www.')) or re.search(r'\.(com|org|edu|gov|net)(/|$)', t_lower):
+        if t_lower.startswith(('http://', 'https://', 'www.')) or _URL_TLD_RE.search(t_lower):
             return {
                 'valid': False,
                 'confidence': 0.9,
@@ -194,7 +230,7 @@ class QualityCheck:
             }
         
         # Calculate confidence based on scholarship keyword presence
-        keyword_matches = sum(1 for keyword in cls.SCHOLARSHIP_KEYWORDS if keyword in t_lower)
+        keyword_matches = cls._scholarship_keywords.count_in(t_lower)
         
         if keyword_matches >= 2:
             confidence = 0.9
@@ -240,8 +276,7 @@ class QualityCheck:
         
         # Must contain either a number or specific funding keywords
         has_digit = any(c.isdigit() for c in t)
-        funding_keywords = ['tuition', 'funded', 'full ride', 'scholarship', 'stipend', 'allowance']
-        has_funding_keyword = any(kw in t_lower for kw in funding_keywords)
+        has_funding_keyword = _FUNDING_KEYWORDS.any_in(t_lower)
         
         if not has_digit and not has_funding_keyword:
             return {
@@ -255,15 +290,15 @@ class QualityCheck:
         confidence = 0.5
         
         # High confidence indicators
-        if re.search(r'[\$£€¥₹]\s*[\d,]+', t):  # Currency symbol with amount
+        if _CURRENCY_AMOUNT_RE.search(t):  # Currency symbol with amount
             confidence = 0.95
-        elif re.search(r'\d+[,.]?\d*\s*(dollars?|usd|euro|euros?|pounds?|gbp)', t_lower):
+        elif _AMOUNT_UNIT_RE.search(t_lower):
             confidence = 0.9
-        elif re.search(r'\d+k', t_lower):  # e.g., "10k scholarship"
+        elif _THOUSANDS_RE.search(t_lower):  # e.g., "10k scholarship"
             confidence = 0.85
-        elif 'full tuition' in t_lower or 'full ride' in t_lower or 'fully funded' in t_lower:
+        elif _FULL_FUNDING.any_in(t_lower):
             confidence = 0.9
-        elif has_digit and any(kw in t_lower for kw in ['per year', 'annually', 'total']):
+        elif has_digit and _PERIOD_KEYWORDS.any_in(t_lower):
             confidence = 0.8
         elif has_digit:
             confidence = 0.7
@@ -271,8 +306,7 @@ class QualityCheck:
             confidence = 0.6
         
         # Penalty for vague qualifiers
-        vague_qualifiers = ['up to', 'varies', 'various', 'multiple', 'range']
-        if any(vq in t_lower for vq in vague_qualifiers):
+        if _VAGUE_QUALIFIERS.any_in(t_lower):
             confidence *= 0.8
         
         return {
@@ -345,38 +379,23 @@ class QualityCheck:
         confidence = 0.5
         
         
-        date_patterns = [
-            (r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', 0.95),  # 12/31/2024
-            (r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', 0.95),     # 2024-12-31
-            (r'\b\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b', 0.95),
-            (r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b', 0.95),
-            (r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+\d{1,2},?\s+\d{4}\b', 0.9),
-            (r'\b\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\.?\s+\d{4}\b', 0.9),
-        ]
-        
-        for pattern, pattern_confidence in date_patterns:
-            if re.search(pattern, t_lower):
+        for pattern, pattern_confidence in _DATE_PATTERNS:
+            if pattern.search(t_lower):
                 confidence = pattern_confidence
                 break
         
         # Month names boost confidence
-        month_names = ['january', 'february', 'march', 'april', 'may', 'june',
-                        'july', 'august', 'september', 'october', 'november', 'december']
-        month_abbrevs = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec']
-        
-        if any(month in t_lower for month in month_names):
+        if _MONTH_NAMES.any_in(t_lower):
             confidence = max(confidence, 0.85)
-        elif any(abbrev in t_lower for abbrev in month_abbrevs):
+        elif _MONTH_ABBREVS.any_in(t_lower):
             confidence = max(confidence, 0.8)
         
         # Valid relative/rolling dates
-        relative_dates = ['ongoing', 'rolling', 'rolling deadline', 'varies', 'annual', 'annually', 
-                            'quarterly', 'open', 'continuous']
-        if any(rd in t_lower for rd in relative_dates):
+        if _RELATIVE_DATES.any_in(t_lower):
             confidence = 0.8
         
         # Year present (4 digits)
-        if re.search(r'\b(19|20)\d{2}\b', t):
+        if _YEAR_RE.search(t):
             confidence = max(confidence, 0.75)
         
         return {
@@ -401,25 +420,16 @@ class QualityCheck:
             }
         
         # Check for error/cookie messages
-        for phrase in cls.GARBAGE_PHRASES["description"]:
-            if phrase in t_lower:
-                return {
-                    'valid': False,
-                    'confidence': 0.95,
-                    'reason': f"Contains error/cookie text: '{phrase}'",
-                    'severity': 'critical'
-                }
+        phrase = cls._description_garbage.first_in(t_lower)
+        if phrase:
+            return {
+                'valid': False,
+                'confidence': 0.95,
+                'reason': f"Contains error/cookie text: '{phrase}'",
+                'severity': 'critical'
+            }
         
-        mashup_indicators = [
-            " | how to apply", 
-            " | fully funded", 
-            "scholarship region",
-            "read also:",
-            "related posts:",
-            "you may also like"
-        ]
-
-        indicator_count = sum(1 for ind in mashup_indicators if ind in t_lower)
+        indicator_count = _MASHUP_INDICATORS.count_in(t_lower)
         if indicator_count >= 2:
              return {
                 'valid': False,
@@ -427,7 +437,7 @@ class QualityCheck:
                 'reason': 'Description appears to be a mashup of Related Posts',
                 'severity': 'critical'
             }
-        sentences = [s.strip() for s in re.split(r'[.!?]+', t) if len(s.strip()) > 15]
+        sentences = [s.strip() for s in _SENTENCE_END_RE.split(t) if len(s.strip()) > 15]
         if len(sentences) < 2:
             return {
                 'valid': False,
@@ -447,7 +457,7 @@ class QualityCheck:
             }
         
         # Calculate confidence based on scholarship keyword density
-        keyword_matches = sum(1 for kw in cls.SCHOLARSHIP_KEYWORDS if kw in t_lower)
+        keyword_matches = cls._scholarship_keywords.count_in(t_lower)
         keyword_density = keyword_matches / max(word_count / 100, 1)  # keywords per 100 words
         
         # Base confidence
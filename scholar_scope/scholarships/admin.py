@@ -1,11 +1,17 @@
 from django.contrib import admin
-from .models import Scholarship, Application, ScholarshipScrapeEvent, Profile, Bookmark, User, SiteConfig, FailedScholarship, ScrapeSubmission, Tag, Level, ProfileChunk, WatchedScholarship, ScholarshipCycle
+from .models import Scholarship, Application, ScholarshipScrapeEvent, Profile, Bookmark, User, SiteConfig, FailedScholarship, ScrapeSubmission, Tag, Level, ProfileChunk, WatchedScholarship, ScholarshipCycle, UserRecommendation, CrawlState
 @admin.register(SiteConfig)
 class SiteConfigAdmin(admin.ModelAdmin):
     list_display = ("name", "active", "last_successful", "updated_at")
     list_filter = ("active",)
     search_fields = ("name", "base_url")
 
+@admin.register(CrawlState)
+class CrawlStateAdmin(admin.ModelAdmin):
+    list_display = ("url", "site", "last_seen", "last_changed")
+    list_filter = ("site",)
+    search_fields = ("url",)
+
 @admin.register(Scholarship)
 class AdminScholarship(admin.ModelAdmin):
     list_display = ['title', 'start_date', 'end_date', 'active', 'description', 'reward']
@@ -21,6 +27,7 @@ admin.site.register(Bookmark)
 admin.site.register(ScholarshipScrapeEvent)
 admin.site.register(ScholarshipCycle)
 admin.site.register(ProfileChunk)
+admin.site.register(UserRecommendation)
 admin.site.register(FailedScholarship)
 admin.site.register(WatchedScholarship)
 admin.site.register(User)
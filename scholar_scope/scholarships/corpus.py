@@ -0,0 +1,99 @@
+"""
+corpus.py
+─────────────────────────────────────────────────────────────────────────────
+Recorded detail pages for offline extraction benchmarks
+(manage.py benchmark_corpus, manage.py benchmark_extractor).
+
+ScholarshipBatchSpider records every detail page it extracts when
+SCRAPE_RECORD_CORPUS names a directory: one gzip'd JSON file per page,
+named by a hash of the URL, so a re-crawl overwrites rather than duplicates
+and a corpus directory can be copied or checked in as-is.
+
+  {"url", "status", "headers", "body", "site_config_id", "selectors",
+   "render", "recorded_at"}
+
+`selectors` is a snapshot of the site's CSS selectors at record time, so a
+replay needs neither the database nor the network. `iter_pages` also reads
+plain .html/.htm files (no selectors; the file name stands in for the URL).
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+RECORD_SUFFIX = ".json.gz"
+HTML_SUFFIXES = (".html", ".htm")
+
+
+def record_page(
+    directory,
+    *,
+    url: str,
+    body: str,
+    headers: Optional[dict] = None,
+    status: int = 200,
+    site_config_id: Optional[int] = None,
+    selectors: Optional[dict] = None,
+    render: Optional[str] = None,
+) -> Path:
+    """Write one page to `directory` (atomically) and return its path."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}{RECORD_SUFFIX}"
+    record = {
+        "url": url,
+        "status": status,
+        "headers": headers or {},
+        "body": body,
+        "site_config_id": site_config_id,
+        "selectors": selectors or {},
+        "render": render,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    }
+    partial = target.with_name(target.name + ".partial")
+    with gzip.open(partial, "wt", encoding="utf-8") as fh:
+        json.dump(record, fh)
+    os.replace(partial, target)
+    return target
+
+
+def load_page(path) -> dict:
+    path = Path(path)
+    if path.name.endswith(RECORD_SUFFIX):
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            return json.load(fh)
+    return {
+        "url": path.name,
+        "status": 200,
+        "headers": {},
+        "body": path.read_text(encoding="utf-8", errors="replace"),
+        "site_config_id": None,
+        "selectors": {},
+        "render": None,
+        "recorded_at": None,
+    }
+
+
+def _is_page(path: Path) -> bool:
+    return path.is_file() and (path.name.endswith(RECORD_SUFFIX) or path.suffix in HTML_SUFFIXES)
+
+
+def corpus_paths(paths: Iterable) -> list:
+    """Every recorded page / HTML file under `paths`, in a stable order."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(sorted(p for p in path.rglob("*") if _is_page(p)))
+        elif _is_page(path):
+            found.append(path)
+        else:
+            raise FileNotFoundError(f"{path} is not a recorded page, HTML file or directory")
+    return found
+
+
+def iter_pages(paths: Iterable) -> Iterator[dict]:
+    for path in corpus_paths(paths):
+        yield load_page(path)
@@ -0,0 +1,110 @@
+"""
+dates.py
+─────────────────────────────────────────────────────────────────────────────
+The one place scraped / LLM-returned date strings become `date`s. Used by
+ScholarshipExtractor, the spider, the extract-from-HTML view and the
+submission / backfill tasks.
+
+dateparser is the slowest call in extraction, and the strings it sees repeat
+heavily (a site's deadline boilerplate, LLM output in ISO form). So:
+
+1. Plain forms — 2026-11-30, 30 November 2026, Nov 30, 2026 — are parsed
+   directly from precompiled patterns.
+2. Everything else goes to dateparser behind a bounded LRU keyed by
+   (string, settings profile, today); today is part of the key because
+   relative phrases ("next Friday") move with it.
+3. dateparser runs with a fixed language subset (DATEPARSER_LANGUAGES)
+   instead of detecting among ~200 locales on every call; its parsers are
+   built once per process, up front via `preload_date_parsers()` where
+   first-call latency matters (crawler start-up).
+"""
+import functools
+import logging
+import re
+from datetime import date
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DATEPARSER_LANGUAGES = ["en"]
+PARSE_CACHE_SIZE = 4096
+
+# Settings profiles: "default" is dateparser's own behaviour; "future" is
+# what the extractor uses for deadlines found in page text.
+_PROFILES = {
+    "default": None,
+    "future": {"STRICT_PARSING": False, "PREFER_DATES_FROM": "future"},
+}
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sep", "sept"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ], start=1)
+    for name in names
+}
+_ISO_DATE_RE   = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_DAY_MONTH_RE  = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+([a-z]+)\.?,?\s+(\d{4})", re.IGNORECASE)
+_MONTH_DAY_RE  = re.compile(r"([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})", re.IGNORECASE)
+
+_parsers = {}
+
+
+def _parser(profile: str):
+    parser = _parsers.get(profile)
+    if parser is None:
+        from dateparser.date import DateDataParser
+        parser = _parsers[profile] = DateDataParser(
+            languages=DATEPARSER_LANGUAGES, settings=_PROFILES[profile],
+        )
+    return parser
+
+
+def preload_date_parsers() -> None:
+    """Import dateparser and build (and warm) every profile's parser now."""
+    for profile in _PROFILES:
+        _parser(profile).get_date_data("1 January 2000")
+
+
+def _fast_parse(text: str) -> Optional[date]:
+    try:
+        match = _ISO_DATE_RE.fullmatch(text)
+        if match:
+            return date(*map(int, match.groups()))
+        match = _DAY_MONTH_RE.fullmatch(text)
+        if match and match.group(2).lower() in _MONTHS:
+            return date(int(match.group(3)), _MONTHS[match.group(2).lower()], int(match.group(1)))
+        match = _MONTH_DAY_RE.fullmatch(text)
+        if match and match.group(1).lower() in _MONTHS:
+            return date(int(match.group(3)), _MONTHS[match.group(1).lower()], int(match.group(2)))
+    except ValueError:
+        pass   # e.g. 31 February; let dateparser decide
+    return None
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _dateparser_parse(text: str, profile: str, today: date) -> Optional[date]:
+    try:
+        data = _parser(profile).get_date_data(text)
+    except Exception as e:
+        logger.debug(f"dateparser failed on {text!r}: {e}")
+        return None
+    return data["date_obj"].date() if data and data["date_obj"] else None
+
+
+def parse_date(raw, *, prefer_future: bool = False) -> Optional[date]:
+    """
+    `raw` as a date, or None. prefer_future resolves year-less and relative
+    dates forwards (deadlines); it does not change fully specified dates.
+    """
+    if not raw or not isinstance(raw, str):
+        return None
+    text = raw.strip()
+    return _fast_parse(text) or _dateparser_parse(text, "future" if prefer_future else "default", date.today())
+
+
+def date_cache_info():
+    """functools cache statistics for the dateparser LRU (hits, misses, size)."""
+    return _dateparser_parse.cache_info()
@@ -0,0 +1,229 @@
+"""
+dedup.py
+─────────────────────────────────────────────────────────────────────────────
+"Have we already stored this scholarship?" without loading every fingerprint.
+
+A Bloom filter over Scholarship.fingerprint lives in one Redis bitmap shared
+by every crawl process. A miss is definitive (new scholarship, no query); a
+hit may be a false positive, so it is confirmed with an indexed EXISTS
+(`scholarship_fingerprint_idx`). Memory and startup cost are fixed by
+FINGERPRINT_FILTER_CAPACITY / FINGERPRINT_FILTER_ERROR_RATE, not table size.
+
+`similar_titles` is the near-duplicate side: top-k titles by trigram
+similarity from the `scholarship_title_trgm` GIN index, for rapidfuzz to
+rescore. Placeholder titles (PLACEHOLDER_TITLE_PREFIX + URL, written for
+pages whose title could not be extracted) take no part in it: they all look
+alike, so such rows are told apart by fingerprint only.
+
+Writers call `remember_fingerprints` after saving (the post_save signal does
+it for single saves). Deleted rows stay in the filter until the next rebuild
+and just cost an EXISTS. If the bitmap is missing it is rebuilt from the
+table once, under a lock; adds made while the lock is held also go to a
+pending bitmap that is OR'd in before the swap, so rows saved after the
+rebuild's scan started are not lost. Without Redis every lookup goes
+straight to the DB.
+"""
+import hashlib
+import logging
+import math
+from typing import Iterable, Set
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FILTER_KEY_PREFIX = "scholarship_fingerprints:bloom"
+REBUILD_LOCK_TTL  = 300
+REBUILD_CHUNK     = 5000
+TITLE_CANDIDATES  = 20
+PLACEHOLDER_TITLE_PREFIX = "Unknown Scholarship - "
+
+_filter = None
+
+
+class FingerprintFilter:
+    """Bloom filter stored as a Redis bitmap (GETBIT/SETBIT, pipelined)."""
+
+    def __init__(self, redis, capacity: int, error_rate: float):
+        self.redis = redis
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        # Sizing is part of the key: changing the settings starts a fresh bitmap
+        self.key = f"{FILTER_KEY_PREFIX}:{self.size}:{self.hashes}"
+
+    def _positions(self, fingerprint: str):
+        # Double hashing (Kirsch–Mitzenmacher) from one SHA-256 digest
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.key}:lock"
+
+    @property
+    def pending_key(self) -> str:
+        return f"{self.key}:pending"
+
+    def ensure_built(self) -> bool:
+        """True once the bitmap exists and covers the table."""
+        if self.redis.exists(self.key):
+            return True
+        if not self.redis.set(self.lock_key, 1, nx=True, ex=REBUILD_LOCK_TTL):
+            return False  # another process is rebuilding; use the DB meanwhile
+        try:
+            self.rebuild()
+        finally:
+            self.redis.delete(self.lock_key)
+        return True
+
+    def rebuild(self) -> int:
+        """
+        Rebuild from the table into a local bitmap, then swap it in atomically.
+        Call with the rebuild lock held (ensure_built) so that concurrent adds
+        are collected in the pending bitmap.
+        """
+        from scholarships.models import Scholarship
+
+        bits = bytearray((self.size + 7) // 8)
+        count = 0
+        fingerprints = (
+            Scholarship.objects.exclude(fingerprint__isnull=True)
+            .values_list("fingerprint", flat=True)
+            .iterator(chunk_size=REBUILD_CHUNK)
+        )
+        for fingerprint in fingerprints:
+            for position in self._positions(fingerprint):
+                # Redis bit order: bit 0 is the most significant bit of byte 0
+                bits[position >> 3] |= 0x80 >> (position & 7)
+            count += 1
+
+        staging = f"{self.key}:staging"
+        self.redis.set(staging, bytes(bits))
+        # One MULTI/EXEC: an add lands either in pending before the OR or in
+        # the new bitmap after the swap
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.bitop("OR", staging, staging, self.pending_key)
+        pipe.rename(staging, self.key)
+        pipe.delete(self.pending_key)
+        pipe.execute()
+        logger.info(f"Rebuilt fingerprint filter: {count} fingerprints, {len(bits) // 1024} KB")
+        return count
+
+    def _set_bits(self, key: str, positions: list, expire: int = None) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for position in positions:
+            pipe.setbit(key, position, 1)
+        if expire:
+            pipe.expire(key, expire)
+        pipe.execute()
+
+    def add_many(self, fingerprints: Iterable[str]) -> None:
+        positions = [p for fingerprint in fingerprints for p in self._positions(fingerprint)]
+        if self.redis.exists(self.lock_key):
+            # A rebuild may have scanned past these rows: keep them for its swap
+            # (left to expire if that rebuild dies; it only holds real fingerprints)
+            self._set_bits(self.pending_key, positions, expire=REBUILD_LOCK_TTL)
+        # Checked after the pending write, so a swap that raced it still gets the bits
+        if self.redis.exists(self.key):
+            self._set_bits(self.key, positions)
+        # else SETBIT would create a partial bitmap; the rebuild covers these rows
+
+    def might_contain_many(self, fingerprints: list) -> list:
+        pipe = self.redis.pipeline(transaction=False)
+        for fingerprint in fingerprints:
+            for position in self._positions(fingerprint):
+                pipe.getbit(self.key, position)
+        bits = pipe.execute()
+        return [
+            all(bits[i * self.hashes:(i + 1) * self.hashes])
+            for i in range(len(fingerprints))
+        ]
+
+
+def get_fingerprint_filter():
+    """Process-wide filter, or None when the cache backend is not Redis."""
+    global _filter
+    if _filter is None:
+        try:
+            from django_redis import get_redis_connection
+            redis = get_redis_connection("default")
+        except Exception as e:
+            logger.info(f"Fingerprint filter disabled, using DB lookups only: {e}")
+            _filter = False
+            return None
+        _filter = FingerprintFilter(
+            redis,
+            capacity=settings.FINGERPRINT_FILTER_CAPACITY,
+            error_rate=settings.FINGERPRINT_FILTER_ERROR_RATE,
+        )
+    return _filter or None
+
+
+def known_fingerprints(fingerprints: Iterable[str]) -> Set[str]:
+    """The subset of `fingerprints` already stored as Scholarship rows."""
+    from scholarships.models import Scholarship
+
+    candidates = list(dict.fromkeys(f for f in fingerprints if f))
+    if not candidates:
+        return set()
+
+    bloom = get_fingerprint_filter()
+    if bloom is not None:
+        try:
+            if bloom.ensure_built():
+                hits = bloom.might_contain_many(candidates)
+                candidates = [f for f, hit in zip(candidates, hits) if hit]
+        except Exception as e:
+            logger.warning(f"Fingerprint filter unavailable, checking DB: {e}")
+        if not candidates:
+            return set()
+
+    return set(
+        Scholarship.objects.filter(fingerprint__in=candidates)
+        .values_list("fingerprint", flat=True)
+    )
+
+
+def is_known_fingerprint(fingerprint: str) -> bool:
+    return fingerprint in known_fingerprints([fingerprint])
+
+
+def remember_fingerprints(fingerprints: Iterable[str]) -> None:
+    """Add freshly saved fingerprints to the filter. Best effort."""
+    bloom = get_fingerprint_filter()
+    fingerprints = [f for f in fingerprints if f]
+    if bloom is None or not fingerprints:
+        return
+    try:
+        bloom.add_many(fingerprints)
+    except Exception as e:
+        # A missed add only means a later EXISTS finds the row instead
+        logger.warning(f"Could not update fingerprint filter: {e}")
+
+
+def is_placeholder_title(title: str) -> bool:
+    return bool(title) and title.startswith(PLACEHOLDER_TITLE_PREFIX)
+
+
+def similar_titles(title: str, limit: int = TITLE_CANDIDATES) -> list:
+    """
+    [(id, title, status)] for the stored titles most trigram-similar to
+    `title`. `%` catches similar whole titles, `%>` titles that contain
+    `title` as a near-exact part (token_set_ratio's subset case); both
+    are answered by the GIN index.
+    """
+    from django.contrib.postgres.search import TrigramSimilarity
+    from django.db.models import Q
+    from scholarships.models import Scholarship
+
+    if not title or is_placeholder_title(title):
+        return []
+    return list(
+        Scholarship.objects.filter(Q(title__trigram_similar=title) | Q(title__trigram_word_similar=title))
+        .exclude(title__startswith=PLACEHOLDER_TITLE_PREFIX)
+        .annotate(similarity=TrigramSimilarity("title", title))
+        .order_by("-similarity")
+        .values_list("id", "title", "status")[:limit]
+    )
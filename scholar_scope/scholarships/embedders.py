@@ -0,0 +1,182 @@
+"""
+embedders.py
+─────────────────────────────────────────────────────────────────────────────
+Text embedding backends, selected with the EMBEDDING_PROVIDER setting.
+
+  gemini   Google text-embedding-004 over HTTP (default)
+  local    sentence-transformers on CPU (torch or ONNX), batches on all cores
+  hashing  deterministic feature-hashing stub — no network, no model download;
+           for tests, benchmarks and offline load runs
+
+Every backend exposes `dimensions`, `encode(text)` and `encode_batch(texts)`.
+Scholarship, Profile and ProfileChunk vectors are compared against each other,
+so `get_embedder()` refuses a backend whose dimension differs from any of
+those VectorFields.
+"""
+import hashlib
+import logging
+import math
+import os
+import re
+from typing import List
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BATCH_SIZE = 100
+
+_embedder = None
+
+
+class MockNumpyArray(list):
+    """Magic trick to mimic a numpy array's .tolist() method."""
+    def tolist(self): return self
+
+
+class GeminiEmbedder:
+    provider = "gemini"
+    dimensions = 768
+
+    def __init__(self, model_name="models/text-embedding-004"):
+        import google.generativeai as genai
+        self.model_name = model_name
+        genai.configure(api_key=os.environ.get("GEMINI_API_KEY"))
+
+    def encode(self, text: str, **kwargs):
+        import google.generativeai as genai
+        result = genai.embed_content(
+            model=self.model_name,
+            content=text
+        )
+        return MockNumpyArray(result['embedding'])
+
+    def encode_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """Embeds several texts per HTTP call (batchEmbedContents caps a request at 100)."""
+        import google.generativeai as genai
+        vectors = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            result = genai.embed_content(
+                model=self.model_name,
+                content=texts[start:start + EMBEDDING_BATCH_SIZE]
+            )
+            vectors.extend(result['embedding'])
+        return vectors
+
+
+class LocalEmbedder:
+    """
+    sentence-transformers model running in-process. The default
+    all-mpnet-base-v2 produces 768-d vectors, matching the VectorFields.
+    Set EMBEDDING_LOCAL_BACKEND=onnx to run through onnxruntime instead of torch.
+    """
+    provider = "local"
+
+    def __init__(self, model_name=None, backend=None):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name or settings.EMBEDDING_LOCAL_MODEL
+        backend = backend or settings.EMBEDDING_LOCAL_BACKEND
+        if backend == "torch":
+            import torch
+            torch.set_num_threads(os.cpu_count() or 1)
+
+        self.model = SentenceTransformer(self.model_name, device="cpu", backend=backend)
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, text: str, **kwargs):
+        vector = self.model.encode(text, normalize_embeddings=True, show_progress_bar=False)
+        return MockNumpyArray(vector.tolist())
+
+    def encode_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        vectors = self.model.encode(
+            list(texts),
+            batch_size=settings.EMBEDDING_LOCAL_BATCH_SIZE,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+
+class HashingEmbedder:
+    """
+    Signed feature hashing of word unigrams and bigrams into a fixed-size,
+    L2-normalised vector. Same text → same vector on every machine, and texts
+    sharing words land close together, which is enough to exercise ranking.
+    """
+    provider = "hashing"
+    _token_re = re.compile(r"\w+")
+
+    def __init__(self, dimensions=768):
+        self.dimensions = dimensions
+
+    def encode(self, text: str, **kwargs):
+        tokens = self._token_re.findall((text or "").lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+        vector = [0.0] * self.dimensions
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if (value >> 63) & 1 else -1.0
+
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return MockNumpyArray([v / norm for v in vector])
+
+    def encode_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return [self.encode(text) for text in texts]
+
+
+EMBEDDERS = {
+    "gemini":  GeminiEmbedder,
+    "local":   LocalEmbedder,
+    "hashing": HashingEmbedder,
+}
+
+
+def _check_dimensions(embedder) -> None:
+    from scholarships.models import Scholarship, Profile, ProfileChunk
+
+    for model in (Scholarship, Profile, ProfileChunk):
+        expected = model._meta.get_field("embedding").dimensions
+        if expected != embedder.dimensions:
+            raise ImproperlyConfigured(
+                f"EMBEDDING_PROVIDER={embedder.provider!r} produces {embedder.dimensions}-d vectors "
+                f"but {model.__name__}.embedding is VectorField(dimensions={expected})."
+            )
+
+
+def get_embedder():
+    """
+    Returns a singleton instance of the configured embedder.
+    Controlled by the EMBEDDING_PROVIDER setting.
+    """
+    global _embedder
+    if _embedder is None:
+        provider = settings.EMBEDDING_PROVIDER
+        try:
+            embedder_class = EMBEDDERS[provider]
+        except KeyError:
+            raise ImproperlyConfigured(
+                f"Unknown EMBEDDING_PROVIDER {provider!r}; choose one of {', '.join(EMBEDDERS)}."
+            )
+        embedder = embedder_class()
+        _check_dimensions(embedder)
+        logger.info(f"Initializing {provider} embedder ({embedder.dimensions} dimensions)")
+        _embedder = embedder
+
+    return _embedder
+
+
+def embedding_cache_namespace() -> str:
+    """
+    Cache key prefix for embeddings, so switching providers never serves
+    vectors from another model. Gemini keeps the original unprefixed keys.
+    """
+    provider = settings.EMBEDDING_PROVIDER
+    if provider == "gemini":
+        return "embedding_"
+    if provider == "local":
+        return f"embedding_local_{settings.EMBEDDING_LOCAL_MODEL}_"
+    return f"embedding_{provider}_"
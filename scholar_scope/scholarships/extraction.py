@@ -0,0 +1,845 @@
+"""
+extraction.py
+─────────────────────────────────────────────────────────────────────────────
+Single, reusable extraction engine shared by:
+  • ScholarshipBatchSpider  (Scrapy spider, through its extraction process pool)
+  • extract_from_html()     (Django REST view / Chrome-extension endpoint)
+  • process_new_submission / LLM backfill tasks
+
+Usage
+─────
+# Plain HTML string (view / Chrome extension / pool worker)
+extractor = ScholarshipExtractor(raw_html=html_str, url="https://example.com/scholarship")
+title      = extractor.extract_title()
+end_date   = extractor.extract_date("end")
+...
+
+# Scrapy response object
+extractor = ScholarshipExtractor(scrapy_response=response)
+title      = extractor.extract_title()
+...
+
+Imports nothing from Django (only scholarships.dates / scholarships.keywords,
+which are Django-free too), so extraction worker processes can load it
+without django.setup(). Keep it that way.
+"""
+from __future__ import annotations
+import copy
+import functools
+import logging
+import re
+from datetime import date
+from difflib import get_close_matches
+from typing import Optional
+
+import trafilatura
+from parsel import Selector
+from parsel.csstranslator import css2xpath
+
+from scholarships.dates import parse_date
+from scholarships.keywords import KeywordMap, KeywordSet
+
+logger = logging.getLogger(__name__)
+
+# ── Compiled patterns ────────────────────────────────────────────────────────
+# Every regex the extraction heuristics run, compiled once; the per-call
+# re.* string forms paid a cache lookup each and rebuilt their lists.
+
+_NON_ALNUM_RE   = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE_RE  = re.compile(r"\s+")
+_BULLET_RE      = re.compile(r"^[\d.\)\-*•►→➤]\s*")
+_LETTER_ITEM_RE = re.compile(r"^\w\)\s*")
+_ITEM_SPLIT_RE  = re.compile(r"[\n;•►→➤]")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]")
+_NAV_CATEGORY_RE   = re.compile(r"^[a-z\s]+ scholarships?$")
+_SELECTOR_PSEUDO_RE = re.compile(r"::(text|attr\([^)]+\))")
+
+_REWARD_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), prefix)
+    for patterns, prefix in [
+        ([r"₦\s*([0-9,]+(?:\.[0-9]{2})?)", r"N\s*([0-9,]+(?:\.[0-9]{2})?)",
+          r"([0-9,]+(?:\.[0-9]{2})?)\s*naira"], "₦"),
+        ([r"\$\s*([0-9,]+(?:\.[0-9]{2})?)",
+          r"([0-9,]+(?:\.[0-9]{2})?)\s*(?:USD|dollars?)"], "$"),
+        ([r"worth\s*(?:of\s*)?₦?\$?\s*([0-9,]+)",
+          r"value\s*(?:of\s*)?₦?\$?\s*([0-9,]+)",
+          r"amount\s*(?:of\s*)?₦?\$?\s*([0-9,]+)"], ""),
+    ]
+    for pattern in patterns
+]
+_REWARD_KEYWORDS = KeywordSet([
+    "tuition", "allowance", "stipend", "support", "funding",
+    "full scholarship", "fully funded",
+])
+
+_DATE_PATTERNS = {
+    "start": [re.compile(p, re.IGNORECASE) for p in [
+        r"application\s*(?:opens?|starts?)[:\s]*([^.!?\n]+)",
+        r"opening\s*date[:\s]*([^.!?\n]+)",
+        r"start\s*date[:\s]*([^.!?\n]+)",
+        r"begins?[:\s]*([^.!?\n]+)",
+        r"from[:\s]*([^.!?\n]+?)(?:\s*to\s*|\s*-\s*)",
+        r"available\s*from[:\s]*([^.!?\n]+)",
+    ]],
+    "end": [re.compile(p, re.IGNORECASE) for p in [
+        r"deadline[:\s]*([^.!?\n]+)",
+        r"due date[:\s]*([^.!?\n]+)",
+        r"closing date[:\s]*([^.!?\n]+)",
+        r"last date[:\s]*([^.!?\n]+)",
+        r"application closes?[:\s]*([^.!?\n]+)",
+        r"expires?[:\s]*([^.!?\n]+)",
+        r"close[sd]?\s*on[:\s]*([^.!?\n]+)",
+        r"submit\s*by[:\s]*([^.!?\n]+)",
+    ]],
+}
+
+_ELIGIBILITY_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r"eligibility[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"eligible\s*(?:candidates?|applicants?)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"who\s*can\s*apply[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"criteria[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"qualifications?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+]]
+_REQUIREMENTS_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r"requirements?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"documents?\s*(?:required|needed)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"application\s*requirements?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+    r"must\s*(?:provide|submit|include)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
+]]
+_AGE_RE = re.compile(r"(?:age|years?)\s*(?:between|from|of)?\s*(\d+)(?:\s*(?:to|and|-)\s*(\d+))?")
+_GPA_RE = re.compile(r"(?:gpa|cgpa)\s*(?:of\s*)?(\d+\.?\d*)")
+
+# ── Keyword sets ─────────────────────────────────────────────────────────────
+
+_ELIGIBILITY_KEYWORDS = KeywordSet([
+    "citizen", "nationality", "age", "year old", "year of age",
+    "grade", "gpa", "cgpa", "score",
+    "undergraduate", "postgraduate", "graduate", "student",
+    "enrolled", "admitted", "applicant",
+    "resident", "income", "family",
+    "female", "male", "gender",
+    "minority", "disability", "field of study",
+    "department", "faculty", "university", "college",
+    "must be", "must have", "should be", "should have",
+    "open to", "available to", "eligible",
+])
+_ELIGIBILITY_VERBS = KeywordSet(["must", "should", "need", "require",
+                                 "open", "eligible", "have", "be a", "be an"])
+_REQUIREMENT_KEYWORDS = KeywordSet([
+    "transcript", "certificate", "cv", "resume", "letter",
+    "essay", "statement", "recommendation", "reference",
+    "passport", "photo", "photograph",
+    "application form", "birth certificate", "identification",
+    "academic record", "degree", "diploma",
+    "ssce", "waec", "jamb", "neco",
+    "bank statement", "financial", "medical report",
+    "upload", "submit", "attach", "provide",
+    "official", "certified", "notarized",
+    "two copies", "three copies",
+])
+_COMMON_ELIGIBILITY = [
+    ("undergraduate", "Must be an undergraduate student"),
+    ("postgraduate",  "Must be a postgraduate student"),
+    ("international", "Open to international students"),
+]
+_COMMON_REQUIREMENTS = KeywordMap({
+    "Academic Transcript":      ["transcript", "academic record"],
+    "CV or Resume":             ["cv", "resume", "curriculum vitae"],
+    "Passport Photograph":      ["passport photo", "recent photo", "passport photograph"],
+    "Birth Certificate":        ["birth certificate"],
+    "Letter of Recommendation": ["recommendation letter", "reference letter", "letter of recommendation"],
+    "Statement of Purpose":     ["statement of purpose", "personal statement", "motivation letter"],
+    "Application Form":         ["application form", "completed form"],
+    "Academic Certificates":    ["academic certificate", "degree certificate"],
+    "Valid ID / Passport":      ["national id", "valid passport", "identification document"],
+})
+_LEVEL_KEYWORDS = KeywordMap({
+    "highschool":    ["secondary school", "high school", "ssce", "waec", "neco", "a-level", "k12"],
+    "undergraduate": ["undergraduate", "bachelor", "bsc", "ba ", "first degree", "college student"],
+    "postgraduate":  ["postgraduate", "masters", "msc", "ma ", "mphil", "graduate school"],
+    "phd":           ["phd", "doctorate", "doctoral", "dphil", "research degree"],
+})
+_TAG_KEYWORDS = KeywordMap({
+    "international": ["international", "global", "worldwide", "abroad", "foreign"],
+    "women":         ["women", "female", "girls"],
+    "stem":          ["stem", "engineering", "science"],
+    "merit":         ["merit", "academic excellence", "outstanding", "scholarly"],
+    "need":          ["need", "financial aid", "low income", "need-based"],
+})
+_DESCRIPTION_SKIP = KeywordSet(["home", "menu", "navigation", "copyright", "privacy", "cookie",
+                                "subscribe", "newsletter", "advertisement"])
+
+
+def _normalize(text: str) -> str:
+    text = text.lower()
+    text = _NON_ALNUM_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _clean_bullet(text: str) -> str:
+    text = _BULLET_RE.sub("", text.strip())
+    return _LETTER_ITEM_RE.sub("", text).strip()
+
+
+def _try_parse_date(raw: str) -> Optional[date]:
+    if not raw or len(raw) < 4:
+        return None
+    return parse_date(raw, prefer_future=True)
+
+_NAV_PHRASES = frozenset([
+    "postgraduate scholarships", "undergraduate scholarships",
+    "masters scholarships", "phd scholarships", "high school scholarships",
+    "scholarships by level", "scholarships by country", "scholarships by field",
+    "competitions", "fellowships", "training", "internships",
+    "recent posts", "categories", "archives", "related posts",
+    "read more", "learn more", "click here", "apply now",
+    "home", "about", "contact", "privacy policy", "terms",
+    "menu", "search", "navigation", "skip to content",
+    "share", "tweet", "facebook", "print", "email",
+    "all scholarships", "browse scholarships", "find scholarships",
+    "scholarship search", "sign in", "my account", "dashboard",
+    "back to top", "continue reading", "load more",
+])
+
+# Heading keywords that identify the right content sections
+_ELIGIBILITY_HEADINGS = [
+    "eligibility", "who can apply", "who should apply",
+    "criteria", "qualifications", "requirements to apply",
+    "eligible applicants", "who is eligible",
+]
+_REQUIREMENTS_HEADINGS = [
+    "requirements", "documents required", "required documents",
+    "what you need", "application documents", "documents needed",
+    "how to apply", "application requirements", "what to submit",
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_navigation_item(text: str) -> bool:
+    """Returns True if this text looks like a navigation/sidebar item."""
+    # Cached: the same candidate lines are re-checked by every extraction stage
+    t = _normalize(text)
+    if t in _NAV_PHRASES:
+        return True
+    # Ends with "scholarships" alone (sidebar category links)
+    if _NAV_CATEGORY_RE.match(t):
+        return True
+    # Very short items with no sentence structure are usually nav
+    if len(t.split()) < 3 and not any(c in t for c in [":", "("]):
+        return True
+    return False
+
+
+# Page text minus boilerplate containers; see _extract_text_excluding_noise
+_NOISE_FREE_TEXT_XPATH = """
+    descendant-or-self::text()
+    [not(ancestor::script)]
+    [not(ancestor::style)]
+    [not(ancestor::nav)]
+    [not(ancestor::header)]
+    [not(ancestor::footer)]
+    [not(ancestor::aside)]
+    [not(ancestor::div[contains(@class,'related')])]
+    [not(ancestor::div[contains(@class,'sidebar')])]
+    [not(ancestor::div[contains(@class,'widget')])]
+    [not(ancestor::div[contains(@class,'comments')])]
+    [not(ancestor::div[contains(@class,'menu')])]
+    [not(ancestor::div[contains(@class,'nav')])]
+    [not(ancestor::ul[contains(@class,'nav')])]
+    [not(ancestor::ul[contains(@class,'menu')])]
+"""
+
+
+class ScholarshipExtractor:
+    """
+    Heuristic field extraction from one scholarship detail page.
+
+    With single_parse=True (the default) the page is parsed once and every
+    extract_* method walks that lxml tree directly: sections are searched in
+    place rather than serialised and re-parsed, and trafilatura gets a copy
+    of the tree instead of parsing raw_html again. single_parse=False keeps
+    the original re-parsing path for comparison (manage.py benchmark_extractor).
+    """
+
+    def __init__(
+        self,
+        *,
+        raw_html: Optional[str] = None,
+        scrapy_response=None,
+        url: Optional[str] = None,
+        single_parse: bool = True,
+    ):
+        if scrapy_response is not None:
+            self._response = scrapy_response
+            self._sel = scrapy_response
+            self.url = scrapy_response.url
+            self.raw_html = scrapy_response.text
+        elif raw_html is not None:
+            self.raw_html = raw_html
+            self._sel = Selector(text=raw_html)
+            self._response = None
+            self.url = url or ""
+        else:
+            raise ValueError("Provide either raw_html= or scrapy_response=")
+
+        self.single_parse = single_parse
+        # Scrapy responses carry their (already parsed) Selector
+        self._root = getattr(self._sel, "selector", self._sel).root
+        self._clean_text_cache: Optional[str] = None
+
+    # ── low-level helpers ─────────────────────────────────────────────────────
+
+    def css(self, query: str):
+        return self._sel.css(query)
+
+    def _nodes(self, query: str, context=None):
+        """
+        Elements matching CSS `query` under `context` (default: the page):
+        bare lxml elements in single-parse mode, parsel Selectors otherwise.
+        """
+        if not self.single_parse:
+            return (context if context is not None else self._sel).css(query)
+        return (context if context is not None else self._root).xpath(css2xpath(query))
+
+    def _string(self, node) -> str:
+        """XPath string value of a node returned by _nodes."""
+        if not self.single_parse:
+            return node.xpath("string(.)").get(default="")
+        return node.xpath("string(.)", smart_strings=False)
+
+    @property
+    def clean_text(self) -> str:
+        if self._clean_text_cache is not None:
+            return self._clean_text_cache
+        try:
+            # trafilatura's justext fallback prunes the tree it is given, so
+            # it gets a copy (several times cheaper than re-parsing raw_html)
+            text = trafilatura.extract(
+                copy.deepcopy(self._root) if self.single_parse else self.raw_html,
+                include_comments=False,
+                include_tables=True,
+                no_fallback=False,
+            )
+            if text and len(text) > 200:
+                self._clean_text_cache = text
+                return text
+        except Exception:
+            pass
+
+        content_selectors = [
+            "article", ".entry-content", ".post-content",
+            ".article-content", "main", "#content",
+            "div[class*='content']", "div[class*='article']",
+        ]
+        for sel in content_selectors:
+            text = self._extract_text_excluding_noise(self._nodes(sel))
+            if text and len(text) > 500:
+                self._clean_text_cache = text
+                return text
+
+        text = self._extract_text_excluding_noise(self._nodes("body"))
+        self._clean_text_cache = text or ""
+        return self._clean_text_cache
+
+    def _extract_text_excluding_noise(self, nodes) -> str:
+        try:
+            if self.single_parse:
+                texts = [
+                    t for node in nodes
+                    for t in node.xpath(_NOISE_FREE_TEXT_XPATH, smart_strings=False)
+                ]
+            else:
+                texts = nodes.xpath(_NOISE_FREE_TEXT_XPATH).getall()
+            joined = " ".join(t.strip() for t in texts if t.strip())
+            return re.sub(r"\s+", " ", joined).strip()
+        except Exception:
+            try:
+                return self._string(nodes[0]) if len(nodes) else ""
+            except Exception:
+                return ""
+
+    def _section_text(self, css_selector: Optional[str]) -> Optional[str]:
+        if not css_selector:
+            return None
+        clean = _SELECTOR_PSEUDO_RE.sub("", css_selector).strip()
+        try:
+            if self.single_parse:
+                nodes = self._nodes(clean)
+                if not nodes:
+                    return None
+                texts = nodes[0].xpath("descendant-or-self::text()", smart_strings=False)
+                text = " ".join(t.strip() for t in texts if t.strip())
+                if not text:
+                    text = self._string(nodes[0])
+                return text.strip() or None
+
+            el = self.css(clean).get()
+            if not el:
+                return None
+            sel = Selector(text=el)
+            texts = sel.css("::text").getall()
+            text = " ".join(t.strip() for t in texts if t.strip())
+            if not text:
+                text = sel.xpath("string(.)").get() or ""
+            return text.strip() or None
+        except Exception:
+            return None
+
+    # ── Semantic section finder ───────────────────────────────────────────────
+
+    def _find_semantic_section(self, heading_keywords: list[str]) -> Optional[str]:
+        """
+        Find the content section whose heading matches one of the keywords.
+        Returns the combined text of list items / paragraphs inside that section,
+        guaranteed NOT to be navigation content.
+
+        Strategy:
+        1. Find a heading (h2/h3/h4/dt/strong/th) whose text matches a keyword.
+        2. Walk forward siblings to collect li/p/dd text until the next heading.
+        3. Return None if nothing substantive is found.
+        """
+        # All headings on the page
+        heading_sel = "h1, h2, h3, h4, h5, dt, th, strong, [class*='heading'], [class*='title']"
+
+        for heading_el in self._nodes(heading_sel):
+            heading_text = _normalize(self._string(heading_el))
+            if not any(kw in heading_text for kw in heading_keywords):
+                continue
+
+            # Found a matching heading — collect following content
+            # Try parent container first
+            if self.single_parse:
+                # Searched in place; no need to serialise and re-parse it
+                parent = heading_el.getparent()
+                if parent is None:
+                    continue
+            else:
+                parent_html = heading_el.xpath("..").get() or ""
+                if not parent_html:
+                    continue
+                parent = Selector(text=parent_html)
+
+            # Collect li items from the parent
+            items = []
+            for li in self._nodes("li", parent):
+                text = self._string(li).strip()
+                if text and not _is_navigation_item(text):
+                    items.append(text)
+
+            if items:
+                return "\n".join(items)
+
+            # Fallback: collect paragraphs
+            for p in self._nodes("p", parent):
+                text = self._string(p).strip()
+                if len(text) > 20 and not _is_navigation_item(text):
+                    items.append(text)
+
+            if items:
+                return "\n".join(items)
+
+        return None
+
+    def _find_content_list(self, heading_keywords: list[str], validator) -> list[str]:
+        """
+        Find list items under a semantic heading and validate each with `validator`.
+        Falls back to searching clean_text with regex.
+        Does NOT fall back to bare `ul li` (navigation poison risk).
+        """
+        results = []
+
+        section_text = self._find_semantic_section(heading_keywords)
+        if section_text:
+            for line in _ITEM_SPLIT_RE.split(section_text):
+                line = _clean_bullet(line).strip()
+                if validator(line) and not _is_navigation_item(line):
+                    results.append(line)
+            if results:
+                return results
+
+        # Try class-targeted selectors only (NOT bare ul li)
+        targeted_selectors = [
+            f"[class*='{kw.split()[0]}'] li"
+            for kw in heading_keywords
+            if kw.split()[0] not in ("who", "what", "how")
+        ]
+        for sel in targeted_selectors:
+            for el in self._nodes(sel):
+                text = self._string(el).strip()
+                if validator(text) and not _is_navigation_item(text):
+                    results.append(text)
+                    if len(results) >= 10:
+                        break
+            if results:
+                return results
+
+        return results
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 1. TITLE
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_title(self, css_selector: Optional[str] = None) -> str:
+        if css_selector:
+            text = self._section_text(css_selector)
+            if text and len(text.strip()) > 5:
+                return text.strip()[:255]
+
+        for sel in ["h1", ".entry-title", ".post-title", ".scholarship-title",
+                    "[class*='title']", "[class*='heading']"]:
+            title = self.css(f"{sel}::text").get()
+            if title and len(title.strip()) > 5:
+                title = title.split("|")[0].split(" - ")[0].strip()
+                if not _is_navigation_item(title):
+                    return title[:255]
+
+        page_title = self.css("title::text").get()
+        if page_title:
+            return page_title.split("|")[0].strip()[:255]
+
+        return "Scholarship Title Not Found"
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 2. DESCRIPTION
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_description(self, css_selector: Optional[str] = None) -> str:
+        if css_selector:
+            text = self._section_text(css_selector)
+            if text and len(text) > 50:
+                return text
+
+        parts: list[str] = []
+
+        meta = self.css('meta[name="description"]::attr(content)').get()
+        if meta and len(meta) > 50:
+            parts.append(meta.strip())
+
+        for p in self._nodes("article p, .entry-content p, .post-content p, main p")[:8]:
+            text = self._string(p).strip()
+            if len(text) > 60 and not _DESCRIPTION_SKIP.any_in(text.lower()):
+                parts.append(text)
+                if len(parts) >= 3:
+                    break
+
+        if not parts:
+            for p in self._nodes("p")[:6]:
+                text = self._string(p).strip()
+                if len(text) > 60 and not _DESCRIPTION_SKIP.any_in(text.lower()):
+                    parts.append(text)
+                    if len(parts) >= 2:
+                        break
+
+        if not parts:
+            for sel in [".entry-content", ".post-content", ".article-content", "article", "main"]:
+                text = self.css(sel).xpath("string(.)").get()
+                if text and len(text.strip()) > 100:
+                    parts.append(text.strip()[:600])
+                    break
+
+        if parts:
+            return re.sub(r"\s+", " ", " ".join(parts))
+        return "No description available"
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 3. REWARD
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_reward(self, css_selector: Optional[str] = None) -> str:
+        if css_selector:
+            text = self._section_text(css_selector)
+            if text:
+                return text
+
+        page_text = self.clean_text
+
+        for pattern, prefix in _REWARD_PATTERNS:
+            for match in pattern.finditer(page_text):
+                raw = match.group(1) if match.lastindex else match.group(0)
+                if isinstance(raw, tuple):
+                    raw = next((x for x in raw if x), "")
+                try:
+                    if float(raw.replace(",", "")) > 1000:
+                        return f"{prefix}{raw}"
+                except (ValueError, AttributeError):
+                    continue
+
+        kw = _REWARD_KEYWORDS.first_in(page_text.lower())
+        if kw:
+            return f"Educational {kw}"
+
+        return "Amount not specified"
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 4. DATES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_date(
+        self,
+        date_type: str = "end",
+        css_selector: Optional[str] = None,
+    ) -> Optional[date]:
+        if css_selector:
+            raw = self._section_text(css_selector)
+            if raw:
+                parsed = _try_parse_date(raw)
+                if parsed:
+                    return parsed
+
+        return self._date_from_text(self.clean_text, date_type)
+
+    def _date_from_text(self, text: str, date_type: str) -> Optional[date]:
+        patterns = _DATE_PATTERNS["start" if date_type == "start" else "end"]
+
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                parsed = _try_parse_date(match.group(1).strip())
+                if parsed:
+                    return parsed
+        return None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 5. ELIGIBILITY
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_eligibility(
+        self,
+        css_selector: Optional[str] = None,
+        fallback_text: Optional[str] = None,
+    ) -> list[str]:
+        results: list[str] = []
+
+        # ── A. Targeted CSS selector ──────────────────────────────────────────
+        if css_selector:
+            raw = self._section_text(css_selector)
+            if raw:
+                for header in ["Eligibility:", "Who can apply:", "Criteria:"]:
+                    raw = raw.replace(header, "")
+                for part in _ITEM_SPLIT_RE.split(raw):
+                    part = _clean_bullet(part).strip()
+                    if self._is_eligibility(part) and not _is_navigation_item(part):
+                        results.append(part)
+            if results:
+                return self._clean_items(results)
+
+        # ── B. Semantic section detection (navigation-safe) ───────────────────
+        results = self._find_content_list(_ELIGIBILITY_HEADINGS, self._is_eligibility)
+        if results:
+            return self._clean_items(results)
+
+        # ── C. Regex over clean_text ──────────────────────────────────────────
+        page_text = fallback_text or self.clean_text
+        for pattern in _ELIGIBILITY_PATTERNS:
+            for m in pattern.finditer(page_text):
+                chunk = m.group(1).strip()
+                items = self._split_items(chunk, self._is_eligibility)
+                items = [i for i in items if not _is_navigation_item(i)]
+                results.extend(items)
+                if results:
+                    break
+            if results:
+                break
+
+        # ── D. Structured keyword fallback ────────────────────────────────────
+        if not results:
+            results = self._common_eligibility(page_text)
+
+        cleaned = self._clean_items(results)
+
+        # ── E. Validation gate — if still looks like nav, return empty ─────────
+        # Signal to caller (spider / process_new_submission) that LLM is needed
+        if not cleaned or all(_is_navigation_item(r) for r in cleaned):
+            return []   # Empty → QualityCheck will flag → LLM fires
+
+        return cleaned
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 6. REQUIREMENTS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_requirements(
+        self,
+        css_selector: Optional[str] = None,
+        fallback_text: Optional[str] = None,
+    ) -> list[str]:
+        results: list[str] = []
+
+        # ── A. Targeted CSS selector ──────────────────────────────────────────
+        if css_selector:
+            raw = self._section_text(css_selector)
+            if raw:
+                for header in ["Requirements:", "Documents Required:", "What you need:"]:
+                    raw = raw.replace(header, "")
+                for part in _ITEM_SPLIT_RE.split(raw):
+                    part = _clean_bullet(part).strip()
+                    if self._is_requirement(part) and not _is_navigation_item(part):
+                        results.append(part)
+            if results:
+                return self._clean_items(results)
+
+        # ── B. Semantic section detection ─────────────────────────────────────
+        results = self._find_content_list(_REQUIREMENTS_HEADINGS, self._is_requirement)
+        if results:
+            return self._clean_items(results)
+
+        # ── C. Regex over clean_text ──────────────────────────────────────────
+        page_text = fallback_text or self.clean_text
+        for pattern in _REQUIREMENTS_PATTERNS:
+            for m in pattern.finditer(page_text):
+                chunk = m.group(1).strip()
+                items = self._split_items(chunk, self._is_requirement)
+                items = [i for i in items if not _is_navigation_item(i)]
+                results.extend(items)
+                if results:
+                    break
+            if results:
+                break
+
+        # ── D. Keyword fallback ───────────────────────────────────────────────
+        if not results:
+            results = self._common_requirements(page_text)
+
+        cleaned = self._clean_items(results)
+
+        if not cleaned or all(_is_navigation_item(r) for r in cleaned):
+            return []   # Empty → LLM fires
+
+        return cleaned
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 7. LEVELS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_levels(self, css_selector: Optional[str] = None, extra_text: str = "") -> list[str]:
+        if css_selector:
+            extracted = self.css(css_selector).getall()
+            cleaned = [x.strip().lower() for x in extracted if x.strip()]
+            if cleaned:
+                return cleaned
+
+        title_text = (self.css("title::text").get() or "").lower()
+        meta_desc  = (self.css('meta[name="description"]::attr(content)').get() or "").lower()
+        all_text   = f"{self.clean_text} {title_text} {meta_desc} {extra_text}".lower()
+
+        return _LEVEL_KEYWORDS.labels_in(all_text) or ["unspecified"]
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # 8. TAGS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def extract_tags(self, css_selector: Optional[str] = None, extra_text: str = "") -> list[str]:
+        if css_selector:
+            extracted = self.css(css_selector).getall()
+            cleaned = [x.strip().lower() for x in extracted if x.strip()]
+            if cleaned:
+                return cleaned
+
+        title_text = _normalize(self.css("title::text").get() or "")
+        all_text   = _normalize(f"{self.clean_text} {title_text} {extra_text}")
+
+        tags: set[str] = set(_TAG_KEYWORDS.labels_in(all_text))
+
+        meta_kws = self.css('meta[name="keywords"]::attr(content)').get()
+        if meta_kws:
+            for mt in _normalize(meta_kws).split(","):
+                mt = mt.strip()
+                for key in _TAG_KEYWORDS.sets:
+                    if get_close_matches(mt, [key], n=1, cutoff=0.8):
+                        tags.add(key)
+
+        # Only use tag/category selectors, not generic nav
+        for sel in [".tags a", ".categories a", ".tag", ".category",
+                    "[class*='tag']", "[class*='category']"]:
+            for el in self._nodes(sel)[:5]:
+                tag_text = _normalize(self._string(el))
+                for key, kws in _TAG_KEYWORDS.items():
+                    if tag_text in kws.keywords or get_close_matches(tag_text, kws.keywords, n=1, cutoff=0.8):
+                        tags.add(key)
+
+        return list(tags) or ["general"]
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Private validators & utilities
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _is_eligibility(text: str) -> bool:
+        if not text or _is_navigation_item(text):
+            return False
+        # Must have at least 5 words to be a real criterion
+        if len(text.split()) < 5:
+            return False
+        t = text.lower()
+        # Require a keyword AND that it reads like a criterion (not a nav label)
+        has_keyword = _ELIGIBILITY_KEYWORDS.any_in(t)
+        has_verb    = _ELIGIBILITY_VERBS.any_in(t)
+        return (has_keyword or has_verb) and 15 < len(text) < 300
+
+    @staticmethod
+    def _is_requirement(text: str) -> bool:
+        if not text or _is_navigation_item(text):
+            return False
+        if len(text.split()) < 4:
+            return False
+        return _REQUIREMENT_KEYWORDS.any_in(text.lower()) and 15 < len(text) < 300
+
+    @staticmethod
+    def _split_items(text: str, validator) -> list[str]:
+        for delimiter in ["\n", ";", "•", "►", "→", "➤"]:
+            if delimiter in text:
+                return [_clean_bullet(p).strip()
+                        for p in text.split(delimiter)
+                        if validator(_clean_bullet(p).strip())]
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        return [s.strip() for s in sentences if validator(s.strip())] or [text.strip()]
+
+    @staticmethod
+    def _clean_items(items: list[str], max_items: int = 10) -> list[str]:
+        cleaned = []
+        for item in items[:max_items * 2]:
+            item = _clean_bullet(item)
+            if 12 < len(item) < 300 and not _is_navigation_item(item):
+                cleaned.append(item[0].upper() + item[1:] if item else item)
+        # Deduplicate preserving order
+        seen = set()
+        deduped = []
+        for item in cleaned:
+            key = _normalize(item)
+            if key not in seen:
+                seen.add(key)
+                deduped.append(item)
+        return deduped[:max_items]
+
+    @staticmethod
+    def _common_eligibility(page_text: str) -> list[str]:
+        eligibility: list[str] = []
+        t = page_text.lower()
+
+        age = _AGE_RE.search(t)
+        if age:
+            if age.group(2):
+                eligibility.append(f"Age between {age.group(1)} and {age.group(2)} years")
+            else:
+                eligibility.append(f"Age {age.group(1)} years or above")
+
+        for kw, label in _COMMON_ELIGIBILITY:
+            if kw in t:
+                eligibility.append(label)
+
+        if "nigerian" in t and "citizen" in t:
+            eligibility.append("Must be a Nigerian citizen")
+
+        gpa = _GPA_RE.search(t)
+        if gpa:
+            eligibility.append(f"Minimum GPA/CGPA of {gpa.group(1)}")
+
+        if "female only" in t or "women only" in t:
+            eligibility.append("Female students only")
+        elif "male only" in t:
+            eligibility.append("Male students only")
+
+        return eligibility
+
+    @staticmethod
+    def _common_requirements(page_text: str) -> list[str]:
+        return _COMMON_REQUIREMENTS.labels_in(page_text.lower())
@@ -0,0 +1,62 @@
+"""
+keywords.py
+─────────────────────────────────────────────────────────────────────────────
+Fixed keyword sets for the extraction (ScholarshipExtractor) and quality
+(QualityCheck) heuristics, built once at import instead of on every call.
+
+Matching keeps the `kw in text` substring semantics the heuristics were
+tuned with ("stem" matches "system", "need" matches "needed"). It is plain
+substring search on purpose: for sets of this size (tens of short keywords)
+CPython's `in` beats a combined alternation regex, and an overlapping-match
+one (what exact substring semantics need) by 3-7x, on list items and whole
+pages alike. What callers should avoid is re-preparing the text: lower or
+_normalize it once and check every set against that.
+
+No Django imports: QualityCheck loads this inside the Scrapy process too.
+"""
+from typing import Iterable, Mapping, Optional
+
+
+class KeywordSet:
+    """An ordered, de-duplicated set of keywords matched by substring."""
+
+    __slots__ = ("keywords",)
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+
+    def __iter__(self):
+        return iter(self.keywords)
+
+    def any_in(self, text: str) -> bool:
+        for kw in self.keywords:
+            if kw in text:
+                return True
+        return False
+
+    def first_in(self, text: str) -> Optional[str]:
+        for kw in self.keywords:
+            if kw in text:
+                return kw
+        return None
+
+    def found_in(self, text: str) -> list:
+        return [kw for kw in self.keywords if kw in text]
+
+    def count_in(self, text: str) -> int:
+        return len(self.found_in(text))
+
+
+class KeywordMap:
+    """label -> keywords; a label matches when any of its keywords does."""
+
+    __slots__ = ("sets",)
+
+    def __init__(self, mapping: Mapping[str, Iterable[str]]):
+        self.sets = {label: KeywordSet(keywords) for label, keywords in mapping.items()}
+
+    def items(self):
+        return self.sets.items()
+
+    def labels_in(self, text: str) -> list:
+        return [label for label, keywords in self.sets.items() if keywords.any_in(text)]
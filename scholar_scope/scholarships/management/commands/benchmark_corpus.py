@@ -0,0 +1,241 @@
+# scholarships/management/commands/benchmark_corpus.py
+#
+# Offline extraction benchmark over a recorded corpus (scholarships/corpus.py;
+# record one by crawling with SCRAPE_RECORD_CORPUS=dir). Each page is replayed
+# the way parse_detail handles it: extract_fields() with the site's recorded
+# selectors (ScholarshipExtractor + QualityCheck), then the spider's guard
+# rails and ScholarshipScrapedSchema. No network, database or LLM calls.
+#
+# Reports pages/sec, p50/p95 per-page latency (wall clock, every page of every
+# run), peak RSS of the process, the hit rate per field and the schema-valid
+# rate. A field hits when QualityCheck accepts it (quality fields), when a
+# start date was found, or when tags/levels are more than the fallback.
+#
+# --save writes the metrics and every page's fields to JSON, keyed by file
+# path; --compare diffs two saved runs of the same corpus: metric deltas and,
+# per field, the pages whose value changed.
+#
+#   python manage.py benchmark_corpus corpus/ --runs 3 --save before.json
+#   python manage.py benchmark_corpus corpus/ --save after.json
+#   python manage.py benchmark_corpus --compare before.json after.json
+
+import json
+import resource
+import statistics
+import time
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+
+HIT_FIELDS = ['title', 'reward', 'end_date', 'start_date', 'description',
+              'requirements', 'eligibility', 'tags', 'levels']
+FALLBACK_VALUES = {'tags': ['general'], 'levels': ['unspecified']}
+# (metric, label, higher is better)
+METRICS = (
+    ('pages_per_sec', 'pages/sec', True),
+    ('p50_ms', 'p50 ms/page', False),
+    ('p95_ms', 'p95 ms/page', False),
+    ('peak_rss_mb', 'peak RSS MB', False),
+    ('schema_valid_rate', 'schema valid', True),
+    ('mean_quality_score', 'mean quality score', True),
+    ('needs_llm_rate', 'needs LLM', False),
+)
+
+
+def percentile(samples, pct) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method='inclusive')[pct - 1]
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # KiB on Linux
+
+
+def field_hits(fields: dict, quality_report: dict) -> dict:
+    hits = {}
+    for field in HIT_FIELDS:
+        if field in quality_report['details']:
+            hits[field] = quality_report['details'][field]['valid']
+        elif field in FALLBACK_VALUES:
+            hits[field] = bool(fields[field]) and sorted(fields[field]) != FALLBACK_VALUES[field]
+        else:
+            hits[field] = fields[field] is not None
+    return hits
+
+
+def jsonable(field, value):
+    # Tags and levels come out of sets: order varies between processes
+    if field in FALLBACK_VALUES or isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class Command(BaseCommand):
+    help = 'Replay a recorded detail-page corpus through extraction, quality checks and the item schema'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help='Corpus directories, recorded pages or .html files')
+        parser.add_argument('--runs', type=int, default=3, help='Passes over the corpus (default 3)')
+        parser.add_argument('--limit', type=int, help='Replay only the first N pages')
+        parser.add_argument('--save', metavar='RUN_JSON', help='Write metrics and per-page fields here')
+        parser.add_argument('--compare', nargs=2, metavar=('BASE_JSON', 'NEW_JSON'),
+                            help='Diff two saved runs instead of benchmarking')
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            return self.compare(*options['compare'])
+        if not options['paths']:
+            raise CommandError('Give corpus paths to benchmark, or --compare BASE_JSON NEW_JSON')
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1')
+        run = self.benchmark(options['paths'], options['runs'], options['limit'])
+        if options['save']:
+            with open(options['save'], 'w', encoding='utf-8') as fh:
+                json.dump(run, fh, indent=2)
+            self.stdout.write(f'Saved run to {options["save"]}')
+
+    # ── benchmark ────────────────────────────────────────────────────────────
+
+    def benchmark(self, paths, runs, limit) -> dict:
+        from pydantic import ValidationError
+        from scholarships.corpus import corpus_paths, load_page
+        from scholarships.dates import preload_date_parsers
+        from scholarscope_scrapers.scholarscope_scrapers.spiders.schemas import ScholarshipScrapedSchema
+        from scholarscope_scrapers.scholarscope_scrapers.utils.extraction_pool import extract_fields
+
+        try:
+            files = corpus_paths(paths)[:limit]
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+        if not files:
+            raise CommandError('No recorded pages or .html/.htm files found')
+        pages = [load_page(path) for path in files]
+        preload_date_parsers()   # as the pool's worker initializer does
+        rss_before = peak_rss_mb()
+        self.stdout.write(f'{len(pages)} pages, {runs} runs (startup RSS {rss_before:.0f} MB)\n')
+
+        def replay(page):
+            fields, quality_report, _ = extract_fields(page['body'], page['url'], page['selectors'])
+            # parse_detail's guard rails, minus the LLM rescue
+            item = {
+                **fields,
+                # Plain .html pages have no URL; give the schema a valid one
+                'link': page['url'] if page['url'].startswith(('http://', 'https://'))
+                        else f'https://corpus.invalid/{page["url"]}',
+                'scraped_at': datetime.now().isoformat(),
+            }
+            for field in ['requirements', 'eligibility', 'tags', 'levels']:
+                if not item.get(field):
+                    item[field] = []
+            try:
+                ScholarshipScrapedSchema(**item)
+                schema_error = None
+            except ValidationError as e:
+                schema_error = f'{e.error_count()} errors: ' + ', '.join(
+                    '.'.join(map(str, err['loc'])) for err in e.errors()
+                )
+            return fields, quality_report, schema_error
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(runs):
+            for page in pages:
+                page_started = time.perf_counter()
+                replay(page)
+                latencies.append(1000 * (time.perf_counter() - page_started))
+        elapsed = time.perf_counter() - started
+
+        # One more pass for the results; timings above are unaffected by bookkeeping.
+        # Keyed by file: .html pages use their file name as URL, which can repeat.
+        results = {}
+        hit_counts = dict.fromkeys(HIT_FIELDS, 0)
+        for path, page in zip(files, pages):
+            fields, quality_report, schema_error = replay(page)
+            for field, hit in field_hits(fields, quality_report).items():
+                hit_counts[field] += hit
+            results[str(path)] = {
+                'url': page['url'],
+                'fields': {field: jsonable(field, value) for field, value in fields.items()},
+                'quality_score': quality_report['quality_score'],
+                'needs_llm': quality_report['needs_llm'],
+                'schema_error': schema_error,
+            }
+
+        metrics = {
+            'pages_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'mean_ms': statistics.mean(latencies),
+            'peak_rss_mb': peak_rss_mb(),
+            'schema_valid_rate': sum(r['schema_error'] is None for r in results.values()) / len(pages),
+            'mean_quality_score': statistics.mean(r['quality_score'] for r in results.values()),
+            'needs_llm_rate': sum(r['needs_llm'] for r in results.values()) / len(pages),
+        }
+        hit_rate = {field: count / len(pages) for field, count in hit_counts.items()}
+
+        self.stdout.write(
+            f'{metrics["pages_per_sec"]:.1f} pages/sec | per page p50 {metrics["p50_ms"]:.2f} ms, '
+            f'p95 {metrics["p95_ms"]:.2f} ms, mean {metrics["mean_ms"]:.2f} ms | '
+            f'peak RSS {metrics["peak_rss_mb"]:.0f} MB'
+        )
+        self.stdout.write(
+            f'schema valid {metrics["schema_valid_rate"]:.0%} | mean quality score '
+            f'{metrics["mean_quality_score"]:.3f} | needs LLM {metrics["needs_llm_rate"]:.0%}'
+        )
+        self.stdout.write('Field hit rate:')
+        for field, rate in hit_rate.items():
+            self.stdout.write(f'  {field:14} {rate:6.0%}  ({hit_counts[field]}/{len(pages)})')
+        for path, result in results.items():
+            if result['schema_error']:
+                self.stdout.write(self.style.WARNING(f'  schema rejects {path}: {result["schema_error"]}'))
+
+        return {
+            'created_at': datetime.now().isoformat(),
+            'paths': [str(p) for p in paths],
+            'pages': len(pages),
+            'runs': runs,
+            'metrics': metrics,
+            'hit_rate': hit_rate,
+            'results': results,
+        }
+
+    # ── compare ──────────────────────────────────────────────────────────────
+
+    def compare(self, base_path, new_path):
+        try:
+            with open(base_path, encoding='utf-8') as fh:
+                base = json.load(fh)
+            with open(new_path, encoding='utf-8') as fh:
+                new = json.load(fh)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Cannot read saved run: {e}')
+
+        self.stdout.write(f'base: {base_path} ({base["pages"]} pages, {base["created_at"]})')
+        self.stdout.write(f'new:  {new_path} ({new["pages"]} pages, {new["created_at"]})\n')
+
+        for key, label, higher_is_better in METRICS:
+            before, after = base['metrics'][key], new['metrics'][key]
+            change = f'{(after - before) / before:+.1%}' if before else 'n/a'
+            line = f'{label:20} {before:10.3f} -> {after:10.3f}  {change}'
+            worse = after < before if higher_is_better else after > before
+            self.stdout.write(self.style.WARNING(line) if worse and after != before else line)
+
+        common = sorted(base['results'].keys() & new['results'].keys())
+        only_base = len(base['results']) - len(common)
+        only_new = len(new['results']) - len(common)
+        self.stdout.write(f'\nField hit rate ({len(common)} pages in both runs; '
+                          f'{only_base} only in base, {only_new} only in new):')
+        for field in HIT_FIELDS:
+            changed = [
+                path for path in common
+                if base['results'][path]['fields'].get(field) != new['results'][path]['fields'].get(field)
+            ]
+            before, after = base['hit_rate'].get(field, 0.0), new['hit_rate'].get(field, 0.0)
+            line = f'  {field:14} {before:6.0%} -> {after:6.0%}  {len(changed)} pages changed'
+            self.stdout.write(self.style.WARNING(line) if after < before else line)
+            for path in changed[:5]:
+                self.stdout.write(f'      {path}')
+            if len(changed) > 5:
+                self.stdout.write(f'      ... and {len(changed) - 5} more')
@@ -0,0 +1,120 @@
+# scholarships/management/commands/benchmark_extractor.py
+#
+# Per-page CPU time and allocations for ScholarshipExtractor over a corpus
+# of saved detail pages (.html files or a recorded corpus, see
+# benchmark_corpus): the original re-parsing path (single_parse=False)
+# against the single-parse lxml path. Every extract_* field the spider reads
+# is run and scored with QualityCheck, as parse_detail does; pages whose
+# fields differ between the two paths are listed.
+#
+# CPU is process time (median of --runs); allocations are measured in a
+# separate tracemalloc pass so tracing does not inflate the timings.
+#
+#   python manage.py benchmark_extractor saved_pages/ --runs 5
+#   python manage.py benchmark_extractor saved_pages/page.html --per-page
+
+import statistics
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand, CommandError
+
+MODES = (('reparse', False), ('single', True))
+QUALITY_FIELDS = ['title', 'reward', 'end_date', 'description', 'requirements', 'eligibility']
+
+
+def extract_all(extractor) -> dict:
+    """The fields parse_detail extracts, without per-site selectors."""
+    clean_text = extractor.clean_text
+    return {
+        'title':        extractor.extract_title(),
+        'description':  extractor.extract_description(),
+        'reward':       extractor.extract_reward(),
+        'end_date':     extractor.extract_date('end'),
+        'start_date':   extractor.extract_date('start'),
+        'requirements': extractor.extract_requirements(fallback_text=clean_text),
+        'eligibility':  extractor.extract_eligibility(fallback_text=clean_text),
+        'tags':         sorted(extractor.extract_tags()),
+        'levels':       sorted(extractor.extract_levels()),
+    }
+
+
+def corpus_pages(paths) -> list:
+    from scholarships.corpus import corpus_paths
+    try:
+        pages = corpus_paths(paths)
+    except FileNotFoundError as e:
+        raise CommandError(str(e))
+    if not pages:
+        raise CommandError('No recorded pages or .html/.htm files found')
+    return pages
+
+
+class Command(BaseCommand):
+    help = 'Compare per-page CPU and allocations of the re-parsing and single-parse extractors'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Saved .html pages, recorded corpus pages, or directories of them')
+        parser.add_argument('--runs', type=int, default=5)
+        parser.add_argument('--per-page', action='store_true', help='Print a line per page')
+
+    def handle(self, *args, **options):
+        from scholarships.corpus import load_page
+        from scholarships.utils import ScholarshipExtractor
+        from scholarscope_scrapers.scholarscope_scrapers.utils.quality import QualityCheck
+
+        def run(html, single_parse):
+            item = extract_all(ScholarshipExtractor(raw_html=html, single_parse=single_parse))
+            QualityCheck.get_quality_score(item, QUALITY_FIELDS)
+            return item
+
+        pages = corpus_pages(options['paths'])
+        self.stdout.write(f'{len(pages)} pages, {options["runs"]} runs per page\n')
+
+        cpu = {name: [] for name, _ in MODES}
+        peak = {name: [] for name, _ in MODES}
+        mismatches = []
+
+        for page in pages:
+            html = load_page(page)['body']
+            results = {}
+            for name, single_parse in MODES:
+                results[name] = run(html, single_parse)   # warm-up; also the parity sample
+
+                samples = []
+                for _ in range(options['runs']):
+                    started = time.process_time()
+                    run(html, single_parse)
+                    samples.append(time.process_time() - started)
+                cpu[name].append(1000 * statistics.median(samples))
+
+                tracemalloc.start()
+                run(html, single_parse)
+                peak[name].append(tracemalloc.get_traced_memory()[1] / 1024)
+                tracemalloc.stop()
+
+            differing = [f for f in results['reparse'] if results['reparse'][f] != results['single'][f]]
+            if differing:
+                mismatches.append((page, differing))
+
+            if options['per_page']:
+                self.stdout.write(
+                    f'{page.name:40} reparse: {cpu["reparse"][-1]:7.2f} ms {peak["reparse"][-1]:8.0f} KiB '
+                    f'| single: {cpu["single"][-1]:7.2f} ms {peak["single"][-1]:8.0f} KiB'
+                )
+
+        for name, _ in MODES:
+            self.stdout.write(
+                f'{name:8} CPU/page: median {statistics.median(cpu[name]):7.2f} ms, '
+                f'total {sum(cpu[name]):9.1f} ms | peak alloc/page: mean {statistics.mean(peak[name]):8.0f} KiB'
+            )
+        self.stdout.write(
+            f'speedup x{sum(cpu["reparse"]) / max(sum(cpu["single"]), 1e-6):.2f}, '
+            f'allocations x{statistics.mean(peak["single"]) / max(statistics.mean(peak["reparse"]), 1e-6):.2f}'
+        )
+
+        if mismatches:
+            self.stdout.write(self.style.WARNING(f'{len(mismatches)} pages extract differently:'))
+            for page, fields in mismatches:
+                self.stdout.write(f'  {page}: {", ".join(fields)}')
+        else:
+            self.stdout.write(self.style.SUCCESS('Identical fields on every page'))
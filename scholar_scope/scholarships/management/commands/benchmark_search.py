@@ -0,0 +1,73 @@
+# scholarships/management/commands/benchmark_search.py
+#
+# Before/after latency for ScholarshipViewset ?q= search: the per-request
+# SearchVector over title/description/tags (the original implementation)
+# against the stored, GIN-indexed search_vector column.
+#
+#   python manage.py benchmark_search --runs 20 "engineering" "women in stem"
+#   python manage.py benchmark_search --explain "nursing"
+
+import statistics
+import time
+from django.core.management.base import BaseCommand
+
+DEFAULT_QUERIES = ["engineering", "women in stem", "international students", "merit", "nursing masters"]
+
+
+class Command(BaseCommand):
+    help = 'Compare on-the-fly SearchVector search with the stored search_vector column'
+
+    def add_arguments(self, parser):
+        parser.add_argument('queries', nargs='*', default=DEFAULT_QUERIES)
+        parser.add_argument('--runs', type=int, default=10)
+        parser.add_argument('--limit', type=int, default=12, help='Rows fetched per query (one result page)')
+        parser.add_argument('--explain', action='store_true', help='Print EXPLAIN ANALYZE for each plan')
+
+    def handle(self, *args, **options):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+        from django.db.models import F
+        from scholarships.models import Scholarship
+        from scholarships.views import SEARCH_CONFIG
+
+        def dynamic(query):
+            vector = (
+                SearchVector("title", weight="A") +
+                SearchVector("description", weight="B") +
+                SearchVector("tags__name", weight="C")
+            )
+            search_query = SearchQuery(query)
+            return (
+                Scholarship.objects.annotate(rank=SearchRank(vector, search_query))
+                .filter(rank__gte=0.1)
+                .order_by("-rank", "-created_at")
+                .distinct()
+            )
+
+        def stored(query):
+            search_query = SearchQuery(query, config=SEARCH_CONFIG)
+            return (
+                Scholarship.objects.filter(search_vector=search_query)
+                .annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
+                .order_by("-rank", "-id")
+            )
+
+        total = Scholarship.objects.count()
+        self.stdout.write(f'{total} scholarships, {options["runs"]} runs per query\n')
+
+        for query in options['queries']:
+            timings = {}
+            for name, build in (('dynamic', dynamic), ('stored', stored)):
+                samples = []
+                for _ in range(options['runs']):
+                    started = time.perf_counter()
+                    list(build(query).values_list('id', flat=True)[:options['limit']])
+                    samples.append(time.perf_counter() - started)
+                timings[name] = 1000 * statistics.median(samples)
+
+                if options['explain']:
+                    self.stdout.write(build(query)[:options['limit']].explain(analyze=True))
+
+            self.stdout.write(
+                f'{query!r:30} dynamic: {timings["dynamic"]:8.2f} ms | stored: {timings["stored"]:8.2f} ms '
+                f'| speedup x{timings["dynamic"] / max(timings["stored"], 1e-6):.1f}'
+            )
@@ -0,0 +1,70 @@
+# scholarships/management/commands/compare_recommendations.py
+#
+# A/B check for the recommendation engines in scholarships.utils.
+# Runs get_multi_vector_recommendations with two engines for the same
+# profiles and reports top-k overlap and per-call latency.
+#
+#   python manage.py compare_recommendations --baseline sql --candidate fused --top-n 20
+
+import time
+from django.core.management.base import BaseCommand
+
+ENGINES = ["memory", "fused", "sql"]
+
+
+class Command(BaseCommand):
+    help = 'Compare top-k overlap and latency between recommendation engines'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--baseline', default='sql', choices=ENGINES)
+        parser.add_argument('--candidate', default='fused', choices=ENGINES)
+        parser.add_argument('--top-n', type=int, default=20)
+        parser.add_argument('--profiles', type=int, default=50,
+                            help='Number of profiles with embedded chunks to sample')
+
+    def handle(self, *args, **options):
+        from scholarships.models import Profile
+        from scholarships.utils import get_multi_vector_recommendations
+
+        top_n     = options['top_n']
+        baseline  = options['baseline']
+        candidate = options['candidate']
+
+        profiles = (
+            Profile.objects.filter(chunks__embedding__isnull=False)
+            .select_related('user')
+            .distinct()
+            .order_by('id')[:options['profiles']]
+        )
+
+        overlaps = []
+        timings  = {baseline: [], candidate: []}
+
+        for profile in profiles:
+            ranked = {}
+            for engine in (baseline, candidate):
+                started = time.perf_counter()
+                results = get_multi_vector_recommendations(profile, top_n=top_n, engine=engine)
+                timings[engine].append(time.perf_counter() - started)
+                ranked[engine] = [s.id for s in results]
+
+            expected = set(ranked[baseline])
+            if not expected:
+                continue
+            overlap = len(expected & set(ranked[candidate])) / len(expected)
+            overlaps.append(overlap)
+            self.stdout.write(f'Profile {profile.id}: overlap@{top_n} = {overlap:.2f}')
+
+        if not overlaps:
+            self.stdout.write('No profiles with embedded chunks to compare.')
+            return
+
+        def _ms(values):
+            return 1000 * sum(values) / len(values)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(overlaps)} profiles | mean overlap@{top_n}: {sum(overlaps) / len(overlaps):.2f} '
+            f'| min: {min(overlaps):.2f} '
+            f'| {baseline}: {_ms(timings[baseline]):.1f} ms/call '
+            f'| {candidate}: {_ms(timings[candidate]):.1f} ms/call'
+        ))
@@ -96,10 +96,15 @@ class Command(BaseCommand):
             default='all',
             choices=[
                 'reminders', 'deadlines', 'renewals',
-                'outdated', 'deduplicate', 'scrape', 'all'
+                'outdated', 'deduplicate', 'scrape', 'llm-backfill', 'all'
             ],
             help='Specific task to run (default: all)',
         )
+        parser.add_argument(
+            '--sequential',
+            action='store_true',
+            help='scrape: one spider process per site instead of one concurrent multi-site crawl',
+        )
 
     def handle(self, *args, **options):
         task = options['task']
@@ -205,12 +210,15 @@ class Command(BaseCommand):
             self.stdout.write('Running outdated scholarship cleanup...')
             try:
                 from scholarships.models import Scholarship
+                from scholarships.vector_index import publish_scholarship_updates
                 cutoff = timezone.now().date()
-                updated = Scholarship.objects.filter(
+                ids = list(Scholarship.objects.filter(
                     end_date__lt=cutoff,
                     active=True,
                     is_recurring=False,
-                ).update(active=False)
+                ).values_list('id', flat=True))
+                updated = Scholarship.objects.filter(id__in=ids).update(active=False)
+                publish_scholarship_updates(ids)
                 self.stdout.write(self.style.SUCCESS(
                     f'Marked {updated} scholarships as inactive.'
                 ))
@@ -240,10 +248,38 @@ class Command(BaseCommand):
                 from scholarships.tasks import _run_spider_process
                 from django.db import connection
 
+                started = timezone.now()
                 sources = SiteConfig.objects.filter(active=True)
 
                 if not sources.exists():
                     self.stdout.write('No active sources configured.')
+                elif not options['sequential']:
+                    from django.conf import settings
+                    from scholarships.tasks import _run_multi_spider_process
+
+                    site_ids = list(sources.values_list('id', flat=True))
+                    self.stdout.write(
+                        f'Scraping {len(site_ids)} sites, '
+                        f'{settings.SCRAPE_CONCURRENT_SITES} at a time...'
+                    )
+                    p = multiprocessing.Process(
+                        target=_run_multi_spider_process,
+                        args=(site_ids,),
+                    )
+                    p.start()
+                    p.join()
+
+                    connection.close()
+                    scraped = SiteConfig.objects.filter(
+                        id__in=site_ids, last_scraped__gte=started
+                    ).count()
+                    if p.exitcode != 0:
+                        self.stderr.write(self.style.ERROR(
+                            f'{len(site_ids) - scraped} site crawls failed (exit code: {p.exitcode})'
+                        ))
+                    self.stdout.write(self.style.SUCCESS(
+                        f'Successfully scraped {scraped}/{len(site_ids)} sites'
+                    ))
                 else:
                     for site in sources:
                         self.stdout.write(f'Scraping: {site.name}...')
@@ -270,4 +306,16 @@ class Command(BaseCommand):
                             ))
             except Exception as e:
                 self.stderr.write(self.style.ERROR(f'Scraping failed: {e}'))
-                sys.exit(1)
\ No newline at end of file
+                sys.exit(1)
+
+        # ── 7. LLM backfill (weak extractions a crawl flagged) ───────────────
+        # Not part of 'all': it makes LLM calls for up to ten minutes. The
+        # weekly workflow runs it right after the scrape.
+        if task == 'llm-backfill':
+            self.stdout.write('Running LLM backfill...')
+            try:
+                from scholarships.tasks import backfill_scholarship_llm_fields
+                filled = backfill_scholarship_llm_fields()
+                self.stdout.write(self.style.SUCCESS(f'LLM backfill complete: {filled} scholarships'))
+            except Exception as e:
+                self.stderr.write(self.style.ERROR(f'LLM backfill failed: {e}'))
\ No newline at end of file
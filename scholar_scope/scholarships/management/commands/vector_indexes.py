@@ -0,0 +1,103 @@
+# scholarships/management/commands/vector_indexes.py
+#
+# Lifecycle for the pgvector ANN indexes created in migration 0020.
+#
+#   python manage.py vector_indexes status
+#   python manage.py vector_indexes rebuild --model scholarship --m 24 --ef-construction 128
+#   python manage.py vector_indexes rebuild --model scholarship --method ivfflat --lists 200
+#   python manage.py vector_indexes reindex --model all
+#
+# Index names never change, so Django's migration state stays in sync even
+# when the physical index is rebuilt with different parameters or method.
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# model key -> (app label, model name, index name)
+VECTOR_INDEXES = {
+    'scholarship':  ('scholarships', 'Scholarship',  'scholarship_embedding_hnsw'),
+    'profile':      ('scholarships', 'Profile',      'profile_embedding_hnsw'),
+    'profilechunk': ('scholarships', 'ProfileChunk', 'profilechunk_embedding_hnsw'),
+}
+
+
+class Command(BaseCommand):
+    help = 'Inspect, rebuild or reindex the pgvector embedding indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['status', 'rebuild', 'reindex'])
+        parser.add_argument('--model', default='all', choices=[*VECTOR_INDEXES, 'all'])
+        parser.add_argument('--method', default='hnsw', choices=['hnsw', 'ivfflat'])
+        parser.add_argument('--m', type=int, default=16, help='HNSW: max connections per layer')
+        parser.add_argument('--ef-construction', type=int, default=64, help='HNSW: build-time candidate list size')
+        parser.add_argument('--lists', type=int, default=None,
+                            help='IVFFlat: number of lists (default: rows / 1000, minimum 1)')
+        parser.add_argument('--blocking', action='store_true',
+                            help='Build without CONCURRENTLY (faster, but locks writes)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Vector indexes require PostgreSQL with pgvector.')
+
+        keys = list(VECTOR_INDEXES) if options['model'] == 'all' else [options['model']]
+        for key in keys:
+            if options['action'] == 'status':
+                self._status(key)
+            elif options['action'] == 'reindex':
+                self._reindex(key, options)
+            else:
+                self._rebuild(key, options)
+
+    def _model(self, key):
+        from django.apps import apps
+        app_label, model_name, index_name = VECTOR_INDEXES[key]
+        return apps.get_model(app_label, model_name), index_name
+
+    def _status(self, key):
+        model, index_name = self._model(key)
+        with connection.cursor() as cursor:
+            # Size from the pg_indexes row itself: casting the bare name to
+            # regclass would raise for a missing index instead of returning no row
+            cursor.execute(
+                "SELECT indexdef, pg_size_pretty(pg_relation_size("
+                "format('%%I.%%I', schemaname, indexname)::regclass)) "
+                "FROM pg_indexes WHERE indexname = %s AND schemaname = ANY(current_schemas(false))",
+                [index_name],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            self.stdout.write(self.style.WARNING(f'{key}: index {index_name} is missing'))
+        else:
+            self.stdout.write(f'{key}: {row[0]} ({row[1]})')
+
+    def _reindex(self, key, options):
+        _, index_name = self._model(key)
+        concurrently = '' if options['blocking'] else ' CONCURRENTLY'
+        self.stdout.write(f'Reindexing {index_name}...')
+        with connection.cursor() as cursor:
+            cursor.execute(f'REINDEX INDEX{concurrently} {connection.ops.quote_name(index_name)}')
+        self.stdout.write(self.style.SUCCESS(f'Reindexed {index_name}'))
+
+    def _rebuild(self, key, options):
+        model, index_name = self._model(key)
+        qn = connection.ops.quote_name
+        table = qn(model._meta.db_table)
+        column = qn(model._meta.get_field('embedding').column)
+        concurrently = '' if options['blocking'] else ' CONCURRENTLY'
+
+        if options['method'] == 'hnsw':
+            with_params = f"m = {options['m']}, ef_construction = {options['ef_construction']}"
+        else:
+            lists = options['lists']
+            if lists is None:
+                lists = max(1, model.objects.exclude(embedding__isnull=True).count() // 1000)
+            with_params = f'lists = {lists}'
+
+        self.stdout.write(f"Rebuilding {index_name} as {options['method']} ({with_params})...")
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX{concurrently} IF EXISTS {qn(index_name)}')
+            cursor.execute(
+                f"CREATE INDEX{concurrently} {qn(index_name)} ON {table} "
+                f"USING {options['method']} ({column} vector_cosine_ops) WITH ({with_params})"
+            )
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {index_name}'))
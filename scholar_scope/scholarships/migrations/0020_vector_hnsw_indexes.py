@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:47
+
+import pgvector.django.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # HNSW builds on a populated table can take minutes; build without
+    # blocking writes from the scraper.
+    atomic = False
+
+    dependencies = [
+        ('scholarships', '0019_alter_profile_embedding_alter_scholarship_embedding'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='profile',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='profile_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='profilechunk',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='profilechunk_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='scholarship',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='scholarship_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:50
+
+import pgvector.django.vector
+from django.db import migrations
+
+
+def clear_chunk_embeddings(apps, schema_editor):
+    # 384-d vectors can't be cast to vector(768); embed_profile_chunks
+    # regenerates them on the next profile save.
+    ProfileChunk = apps.get_model('scholarships', 'ProfileChunk')
+    ProfileChunk.objects.exclude(embedding__isnull=True).update(embedding=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scholarships', '0020_vector_hnsw_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_chunk_embeddings, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='profilechunk',
+            name='embedding',
+            field=pgvector.django.vector.VectorField(blank=True, dimensions=768, null=True),
+        ),
+    ]
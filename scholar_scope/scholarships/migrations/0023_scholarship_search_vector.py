@@ -0,0 +1,100 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Scholarship.search_vector is owned by the database: a BEFORE trigger on the
+# scholarship row and AFTER triggers on the tag relation keep it current for
+# every write path (ORM saves, bulk updates, admin, raw SQL). The text search
+# config must match SEARCH_CONFIG in scholarships/views.py.
+SEARCH_VECTOR_SQL = """
+CREATE OR REPLACE FUNCTION scholarships_search_document(sid bigint, title text, description text)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('english', coalesce((
+               SELECT string_agg(t.name, ' ')
+               FROM scholarships_scholarship_tags st
+               JOIN scholarships_tag t ON t.id = st.tag_id
+               WHERE st.scholarship_id = sid
+           ), '')), 'C')
+$$;
+
+CREATE OR REPLACE FUNCTION scholarships_scholarship_search_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := scholarships_search_document(NEW.id, NEW.title, NEW.description);
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER scholarship_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, description, search_vector ON scholarships_scholarship
+    FOR EACH ROW EXECUTE FUNCTION scholarships_scholarship_search_trigger();
+
+CREATE OR REPLACE FUNCTION scholarships_scholarship_tags_search_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    sid bigint;
+BEGIN
+    IF TG_OP = 'DELETE' THEN sid := OLD.scholarship_id; ELSE sid := NEW.scholarship_id; END IF;
+    UPDATE scholarships_scholarship s
+       SET search_vector = scholarships_search_document(s.id, s.title, s.description)
+     WHERE s.id = sid;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER scholarship_tags_search_vector_update
+    AFTER INSERT OR DELETE ON scholarships_scholarship_tags
+    FOR EACH ROW EXECUTE FUNCTION scholarships_scholarship_tags_search_trigger();
+
+CREATE OR REPLACE FUNCTION scholarships_tag_search_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE scholarships_scholarship s
+       SET search_vector = scholarships_search_document(s.id, s.title, s.description)
+     WHERE s.id IN (SELECT scholarship_id FROM scholarships_scholarship_tags WHERE tag_id = NEW.id);
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER tag_search_vector_update
+    AFTER UPDATE OF name ON scholarships_tag
+    FOR EACH ROW EXECUTE FUNCTION scholarships_tag_search_trigger();
+
+UPDATE scholarships_scholarship
+   SET search_vector = scholarships_search_document(id, title, description);
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS tag_search_vector_update ON scholarships_tag;
+DROP TRIGGER IF EXISTS scholarship_tags_search_vector_update ON scholarships_scholarship_tags;
+DROP TRIGGER IF EXISTS scholarship_search_vector_update ON scholarships_scholarship;
+DROP FUNCTION IF EXISTS scholarships_tag_search_trigger();
+DROP FUNCTION IF EXISTS scholarships_scholarship_tags_search_trigger();
+DROP FUNCTION IF EXISTS scholarships_scholarship_search_trigger();
+DROP FUNCTION IF EXISTS scholarships_search_document(bigint, text, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scholarships', '0022_user_recommendation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scholarship',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='scholarship',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='scholarship_search_gin'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_SQL, DROP_SEARCH_VECTOR_SQL),
+    ]
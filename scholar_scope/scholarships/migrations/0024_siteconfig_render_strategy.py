@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scholarships', '0023_scholarship_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteconfig',
+            name='render_strategy',
+            field=models.CharField(choices=[('auto', 'Probe (HTTP first)'), ('http', 'Plain HTTP'), ('browser', 'Browser render')], default='auto', max_length=10),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:59
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scholarships', '0024_siteconfig_render_strategy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=1000, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('content_hash', models.CharField(blank=True, max_length=64)),
+                ('last_seen', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_changed', models.DateTimeField(default=django.utils.timezone.now)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='crawl_states', to='scholarships.siteconfig')),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Dedup lookups (scholarships.dedup) hit this on every scraped card;
+    # build it without blocking writes from a running scrape.
+    atomic = False
+
+    dependencies = [
+        ('scholarships', '0025_crawlstate'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='scholarship',
+            index=models.Index(fields=['fingerprint'], name='scholarship_fingerprint_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:02
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Same as 0020/0026: don't block the scraper's inserts while building.
+    atomic = False
+
+    dependencies = [
+        ('scholarships', '0026_scholarship_fingerprint_idx'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='scholarship',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='scholarship_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
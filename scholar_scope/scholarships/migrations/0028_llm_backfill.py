@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scholarships', '0027_scholarship_title_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scholarship',
+            name='needs_llm_backfill',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='scholarshipscrapeevent',
+            name='llm_tokens_used',
+            field=models.PositiveIntegerField(default=0, help_text='Estimated LLM tokens spent on rescues'),
+        ),
+    ]
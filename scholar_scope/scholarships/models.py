@@ -5,7 +5,9 @@ from django.utils import timezone
 from django.conf import settings
 from django.utils.text import slugify
 import hashlib
-from pgvector.django import VectorField
+from pgvector.django import VectorField, HnswIndex
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 # Create your models here.
 class User(AbstractUser):
     applied_scholarships = models.ManyToManyField(
@@ -67,6 +69,12 @@ class Scholarship(models.Model):
     is_recurring = models.BooleanField(default=False, help_text="True if this scholarship reopens annually.")
     last_renewed_at = models.DateTimeField(null=True, blank=True,help_text="The last time we detected a new cycle for this item.")
     status = models.CharField(max_length=20, default="active", choices=[("active", "Active"), ("expired", "Expired")])
+    # Stored without the LLM rescue it needed (crawl budget spent or the call
+    # failed); see scholarships.tasks.llm.backfill_scholarship_llm_fields
+    needs_llm_backfill = models.BooleanField(default=False, db_index=True)
+    # title (A) + description (B) + tag names (C); maintained by Postgres
+    # triggers from migration 0023, never written by Django.
+    search_vector = SearchVectorField(null=True, editable=False)
     class Meta:
         unique_together = ('fingerprint', 'url')
 
@@ -99,6 +107,19 @@ class Scholarship(models.Model):
     
     class Meta:
         unique_together = ['title', 'link']
+        indexes = [
+            HnswIndex(
+                name="scholarship_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
+            GinIndex(name="scholarship_search_gin", fields=["search_vector"]),
+            models.Index(name="scholarship_fingerprint_idx", fields=["fingerprint"]),
+            # Near-duplicate title lookups (RenewalAndDuplicatePipeline)
+            GinIndex(name="scholarship_title_trgm", fields=["title"], opclasses=["gin_trgm_ops"]),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.fingerprint:
@@ -149,6 +170,7 @@ class ScholarshipScrapeEvent(models.Model):
     scholarships_skipped = models.PositiveIntegerField(default=0)
     error_message = models.CharField(blank=True, null=True)
     error_count = models.PositiveIntegerField(default=0)
+    llm_tokens_used = models.PositiveIntegerField(default=0, help_text="Estimated LLM tokens spent on rescues")
     objects = ScholarshipScrapeEventManager()
 
     class Meta:
@@ -182,6 +204,12 @@ class ScholarshipScrapeEvent(models.Model):
         self.error_count += 1
         self.save()
 
+    def mark_retried(self):
+        self.status = 'RUNNING'
+        self.completed_at = None
+        self.duration = None
+        self.save()
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -295,6 +323,17 @@ class Profile(models.Model):
         default=4.0
     )
 
+    class Meta:
+        indexes = [
+            HnswIndex(
+                name="profile_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
+        ]
+
     @property
     def completion_percentage(self):
         standard_fields = [
@@ -362,18 +401,47 @@ class ProfileChunk(models.Model):
     profile    = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="chunks")
     chunk_type = models.CharField(max_length=50, choices=CHUNK_TYPES)
     text       = models.TextField()
-    embedding  = VectorField(dimensions=384, null=True, blank=True)
+    embedding  = VectorField(dimensions=768, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("profile", "chunk_type")
         indexes = [
             models.Index(fields=["profile", "chunk_type"]),
+            HnswIndex(
+                name="profilechunk_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
         ]
 
     def __str__(self):
         return f"{self.profile.user.username} — {self.chunk_type}"
 
+
+class UserRecommendation(models.Model):
+    """
+    Materialised top-N recommendations per user, scored by cosine similarity
+    between Profile.embedding and Scholarship.embedding. Maintained by the
+    refresh_user_recommendations / materialize_scholarship_recommendations tasks.
+    """
+    user        = models.ForeignKey(User, on_delete=models.CASCADE, related_name="recommendations")
+    scholarship = models.ForeignKey(Scholarship, on_delete=models.CASCADE, related_name="+")
+    score       = models.FloatField()
+    rank        = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("user", "scholarship")
+        indexes = [
+            models.Index(fields=["user", "rank"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} #{self.rank} — {self.scholarship_id}"
+
    
 
 class ScrapeFailureLog(models.Model):
@@ -403,6 +471,16 @@ class SiteConfig(models.Model):
     level_selector = models.CharField(max_length=255, null=True, blank=True)
     tag_selector = models.CharField(max_length=255, null=True, blank=True)
 
+    # How the spider fetches pages. "auto" probes plain HTTP first and
+    # escalates to a browser render when it sees nothing usable; the spider
+    # then stores whichever worked so later runs skip the probe.
+    RENDER_STRATEGIES = [
+        ("auto", "Probe (HTTP first)"),
+        ("http", "Plain HTTP"),
+        ("browser", "Browser render"),
+    ]
+    render_strategy = models.CharField(max_length=10, choices=RENDER_STRATEGIES, default="auto")
+
     active = models.BooleanField(default=True)
     last_successful = models.DateTimeField(blank=True, null=True)
     last_error = models.TextField(blank=True, null=True)
@@ -432,6 +510,25 @@ class ListingSource(models.Model):
     def __str__(self):
         return f"{self.site.name} - {self.category_name or self.url}"
 
+class CrawlState(models.Model):
+    """
+    What the spider last saw at a listing URL: the HTTP validators sent back
+    as If-None-Match / If-Modified-Since, and a hash of the body so an
+    unchanged plain-HTTP listing can be skipped even when the server ignores
+    them. For browser-rendered listings the hash covers the sorted card links
+    and only a 304 skips the render.
+    """
+    site = models.ForeignKey(SiteConfig, on_delete=models.CASCADE, related_name='crawl_states')
+    url = models.URLField(max_length=1000, unique=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True)
+    last_seen = models.DateTimeField(default=timezone.now)
+    last_changed = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.url
+
 class WatchedScholarship(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     scholarship = models.ForeignKey(Scholarship, on_delete=models.CASCADE)
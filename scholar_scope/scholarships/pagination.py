@@ -21,6 +21,13 @@ class ScholarshipCursorPagination(CursorPagination):
     page_size_query_param  = "page_size"
     max_page_size          = 50
 
+    def get_ordering(self, request, queryset, view):
+        # Views can swap in a different cursor key (e.g. relevance for search)
+        ordering = getattr(view, "get_cursor_ordering", lambda: None)()
+        if ordering:
+            return ordering
+        return super().get_ordering(request, queryset, view)
+
     def get_paginated_response(self, data):
         return Response({
             "next":     self.get_next_link(),
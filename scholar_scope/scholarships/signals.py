@@ -1,11 +1,13 @@
 from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.conf import settings
 from .models import User, Profile
 from django.dispatch import receiver
 from scholarships.tasks import generate_profile_embedding, generate_scholarship_embedding
 from scholarships.models import Scholarship
 from django.utils.timezone import now
-from django.db import models
-from scholarships.tasks import batch_invalidate_user_recommendations
+from scholarships.utils import bump_recommendation_generation
+from scholarships.dedup import remember_fingerprints
 from django.core.cache import cache
 @receiver(post_save, sender=User)
 def create_profile(sender, instance, created, **kwargs):
@@ -30,58 +32,39 @@ def reembed_profile_on_update(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=Scholarship)
 def embed_scholarship_on_create(sender, instance, created, **kwargs):
+    # The scrape pipeline bulk_creates (no post_save) and embeds each batch
+    # with reembed_scholarships
     if created:
        generate_scholarship_embedding.delay(scholarship_id=instance.id)
 
 @receiver(post_save, sender=Scholarship)
 def invalidate_caches_on_scholarship_save(sender, instance, created, **kwargs):
     """
-    Strategy A + B combo:
-    - A: selectively clear cache for users with overlapping tags/levels.
-    - B: update global scholarship dataset timestamp.
+    - Bump the global scholarship dataset timestamp on create.
+    - On update, move recommendation caches to a new generation (one counter
+      increment, debounced during scrapes). New scholarships reach users
+      through materialize_scholarship_recommendations once embedded.
     """
-
-    # --- Strategy B: update global timestamp ---
     if created:
         cache.set("scholarships_updated_at", now().isoformat())
-
-    # --- Strategy A: selective invalidation ---
-    tag_ids   = _safe_m2m_ids(instance, "tags")
-    level_ids = _safe_m2m_ids(instance, "level")
-
-    if not tag_ids and not level_ids:
-        return  # nothing to match on
-
-    user_ids = list(
-        Profile.objects.filter(
-            models.Q(tags__in=tag_ids) | models.Q(level__in=level_ids)
-        ).distinct().values_list("user_id", flat=True)
-    )
-
-    if not user_ids:
+        remember_fingerprints([instance.fingerprint])
         return
-    
-    BATCH_SIZE = 500
-    for i in range(0, len(user_ids), BATCH_SIZE):
-        batch = user_ids[i : i + BATCH_SIZE]
-        batch_invalidate_user_recommendations.delay(batch)
+
+    bump_recommendation_generation()
 
 
-def _safe_m2m_ids(instance, field_name: str) -> list:
-    """
-    Safely read M2M IDs from a model instance.
-    Returns an empty list if the field doesn't exist or the relation
-    isn't yet set up (e.g. during migrations).
-    """
-    try:
-        manager = getattr(instance, field_name, None)
-        if manager is None:
-            return []
-        return list(manager.values_list("id", flat=True))
-    except Exception:
-        return []
-    
 @receiver(post_save, sender=Profile)
 def sync_profile_chunks(sender, instance, **kwargs):
     from scholarships.tasks import embed_profile_chunks
-    embed_profile_chunks.delay(instance.id)
\ No newline at end of file
+    embed_profile_chunks.delay(instance.id)
+
+@receiver(connection_created)
+def configure_vector_search(sender, connection, **kwargs):
+    """Apply the pgvector ef_search / probes settings to each new Postgres session."""
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('hnsw.ef_search', %s, false), set_config('ivfflat.probes', %s, false)",
+            [str(settings.PGVECTOR_HNSW_EF_SEARCH), str(settings.PGVECTOR_IVFFLAT_PROBES)],
+        )
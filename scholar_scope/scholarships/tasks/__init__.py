@@ -1,5 +1,6 @@
-from .scraping import scrape_site, scrape_all_sources, process_new_submission, _run_spider_process, finalize_scrape_event
-from .embeddings import generate_scholarship_embedding, embed_profile_chunks, generate_profile_embedding
+from .scraping import scrape_site, scrape_sites, scrape_all_sources, process_new_submission, _run_spider_process, _run_multi_spider_process, finalize_scrape_event
+from .embeddings import generate_scholarship_embedding, embed_profile_chunks, generate_profile_embedding, reembed_scholarships
 from .notifications import send_email_reminder, send_weekly_renewal_notifications, send_deadline_reminder
-from .llm import draft_single_essay, draft_essays_batch, collect_essay_results
+from .llm import draft_single_essay, draft_essays_batch, collect_essay_results, backfill_scholarship_llm_fields
 from .maintenance import outdated_scholarships, remove_semantic_duplicates, batch_invalidate_user_recommendations
+from .recommendations import refresh_user_recommendations, materialize_scholarship_recommendations
@@ -6,7 +6,7 @@ logger = get_task_logger(__name__)
 @shared_task(bind=True, max_retries=3, default_retry_delay=30)
 def embed_profile_chunks(self, profile_id: int) -> None:
     from scholarships.models import Profile, ProfileChunk
-    from scholarships.utils import get_text_embedding
+    from scholarships.utils import get_text_embeddings
 
     CHUNK_FIELD_MAP = {
         "leadership":      "leadership_experience",
@@ -23,16 +23,20 @@ def embed_profile_chunks(self, profile_id: int) -> None:
     try:
         profile = Profile.objects.get(id=profile_id)
 
+        texts = {}
         for chunk_type, field_name in CHUNK_FIELD_MAP.items():
             text = (getattr(profile, field_name, "") or "").strip()
-            if not text:
-                # Delete stale chunk if user cleared the field
-                ProfileChunk.objects.filter(
-                    profile=profile, chunk_type=chunk_type
-                ).delete()
-                continue
+            if text:
+                texts[chunk_type] = text
+
+        # Delete stale chunks for fields the user cleared
+        ProfileChunk.objects.filter(profile=profile).exclude(
+            chunk_type__in=list(texts)
+        ).delete()
 
-            embedding = get_text_embedding(text)
+        embeddings = get_text_embeddings(list(texts.values()))
+
+        for (chunk_type, text), embedding in zip(texts.items(), embeddings):
             if embedding is None:
                 continue
 
@@ -47,32 +51,80 @@ def embed_profile_chunks(self, profile_id: int) -> None:
     except Exception as exc:
         raise self.retry(exc=exc)
 
+def _scholarship_embedding_text(s) -> str:
+    return f"{s.title}. {s.description}. {s.eligibility or ''}. {s.requirements or ''}"
+
 @shared_task
 def generate_scholarship_embedding(scholarship_id):
     from scholarships.models import Scholarship
     from scholarships.utils import get_text_embedding
+    from scholarships.vector_index import publish_scholarship_update
+    from scholarships.tasks import materialize_scholarship_recommendations
     
     s = Scholarship.objects.get(id=scholarship_id)
-    text = f"{s.title}. {s.description}. {s.eligibility or ''}. {s.requirements or ''}"
+    text = _scholarship_embedding_text(s)
     vector = get_text_embedding(text)
     if vector:
         Scholarship.objects.filter(id=scholarship_id).update(embedding=vector)
+        publish_scholarship_update(scholarship_id)
+        materialize_scholarship_recommendations.delay([scholarship_id])
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def reembed_scholarships(self, scholarship_ids=None, only_missing=True, page_size=500):
+    """
+    Bulk (re-)embedding. Walks Scholarship in id-ordered pages, embeds each
+    page with a single get_text_embeddings call and writes it back with one
+    bulk_update. Pass scholarship_ids to limit the walk (e.g. one scrape's
+    new rows), or only_missing=False to recompute every vector.
+    """
+    from scholarships.models import Scholarship
+    from scholarships.utils import get_text_embeddings
+    from scholarships.vector_index import publish_scholarship_updates
+    from scholarships.tasks import materialize_scholarship_recommendations
+
+    qs = Scholarship.objects.only("id", "title", "description", "eligibility", "requirements")
+    if scholarship_ids is not None:
+        qs = qs.filter(id__in=scholarship_ids)
+    if only_missing:
+        qs = qs.filter(embedding__isnull=True)
+
+    last_id = 0
+    updated = 0
+    try:
+        while True:
+            page = list(qs.filter(id__gt=last_id).order_by("id")[:page_size])
+            if not page:
+                break
+            last_id = page[-1].id
+
+            vectors = get_text_embeddings([_scholarship_embedding_text(s) for s in page])
+            embedded = []
+            for s, vector in zip(page, vectors):
+                if vector:
+                    s.embedding = vector
+                    embedded.append(s)
+
+            if embedded:
+                Scholarship.objects.bulk_update(embedded, ["embedding"])
+                embedded_ids = [s.id for s in embedded]
+                publish_scholarship_updates(embedded_ids)
+                materialize_scholarship_recommendations.delay(embedded_ids)
+                updated += len(embedded)
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+    logger.info(f"[Embedding] Re-embedded {updated} scholarships.")
+    return updated
 
 @shared_task
 def generate_profile_embedding(profile_id):
     from scholarships.models import Profile
     from scholarships.utils import get_text_embedding
-    from django.core.cache import cache
+    from scholarships.tasks import refresh_user_recommendations
     
     profile = Profile.objects.get(id=profile_id)
     text = f"{profile.field_of_study}. {profile.bio}. {profile.preferred_scholarship_types}. {profile.preferred_countries}"
     vector = get_text_embedding(text)
     if vector:
         Profile.objects.filter(id=profile_id).update(embedding=vector)
-    
-@shared_task
-def batch_invalidate_user_recommendations(user_ids):
-    from django.core.cache import cache
-    from scholarships.utils import _rec_cache_key
-    for uid in user_ids:
-        cache.delete(_rec_cache_key(uid))
+        refresh_user_recommendations.delay(profile.user_id)
@@ -3,6 +3,7 @@ from celery import shared_task
 from celery.utils.log import get_task_logger
 import ollama
 from scholarships.utils import generate_text
+from scholarships.dedup import is_placeholder_title
 from asgiref.sync import async_to_sync
 logger = get_task_logger(__name__)
 
@@ -175,3 +176,129 @@ def collect_essay_results(results: list[dict], job_id: str) -> None:
 
     logger.info(f"[Essay Job] {job_id} complete: {len(successful)} drafts, {len(failed_ids)} failed.")
 
+
+
+# Placeholders the spider writes when extraction comes up empty
+_EMPTY_VALUES = ("", "Amount not specified", "Description unavailable.")
+
+
+def _missing_llm_fields(scholarship) -> list:
+    missing = []
+    if is_placeholder_title(scholarship.title):
+        missing.append("title")
+    if scholarship.description in _EMPTY_VALUES:
+        missing.append("description")
+    if scholarship.reward in _EMPTY_VALUES:
+        missing.append("reward")
+    if scholarship.end_date is None:
+        missing.append("deadline")
+    if not scholarship.requirements:
+        missing.append("requirements")
+    if not scholarship.eligibility:
+        missing.append("eligibility")
+    return missing
+
+
+def _apply_llm_fields(scholarship, missing: list, recovered) -> None:
+    """Fill the `missing` fields the LLM found, clear the flag and save."""
+    import json
+    from scholarships.dates import parse_date
+
+    recovered = recovered or {}
+    if isinstance(recovered, str):
+        recovered = json.loads(recovered.replace('```json', '').replace('```', '').strip())
+
+    for field in ("title", "description", "reward"):
+        if field in missing and recovered.get(field):
+            setattr(scholarship, field, recovered[field])
+    for field in ("requirements", "eligibility"):
+        value = recovered.get(field) if field in missing else None
+        if value:
+            setattr(scholarship, field, "\n".join(value) if isinstance(value, list) else value)
+    if "deadline" in missing and recovered.get("deadline"):
+        scholarship.end_date = parse_date(str(recovered["deadline"]))
+
+    scholarship.needs_llm_backfill = False
+    scholarship.save(update_fields=[
+        "title", "description", "reward", "requirements", "eligibility", "end_date", "needs_llm_backfill",
+    ])
+
+
+@shared_task(
+    bind=True,
+    name="scholarships.backfill_scholarship_llm_fields",
+    queue="llm",
+    time_limit=600,
+)
+def backfill_scholarship_llm_fields(self, limit: int = 25) -> int:
+    """
+    Offline LLM rescue for scholarships a crawl stored with a weak
+    extraction (needs_llm_backfill). Re-fetches each page through the
+    spider's render path for its site (utils.fetch.PageFetcher) and asks
+    the LLM for the fields that are still empty, through an LLMRescueQueue:
+    capped concurrency, emptiest first, within SCRAPE_LLM_TOKEN_BUDGET. Only
+    those fields are filled. A scholarship that fails is logged and stays flagged
+    for the next run. Returns the number of scholarships cleared.
+    """
+    import asyncio
+    from django.db.models import F
+    from scholarships.models import Scholarship, ScholarshipScrapeEvent, SiteConfig
+    from scholarships.utils import ScholarshipExtractor
+    from scholarships.tasks import reembed_scholarships
+    from scholarscope_scrapers.scholarscope_scrapers.utils.fetch import PageFetcher
+    from scholarscope_scrapers.scholarscope_scrapers.utils.llm_engine import LLMEngine
+    from scholarscope_scrapers.scholarscope_scrapers.utils.llm_queue import LLMBudgetExceeded, LLMRescueQueue
+
+    engine = LLMEngine()
+    done = []
+    jobs = []   # (scholarship, missing fields, page text)
+    # Scholarship.source is the SiteConfig name the crawl ran under
+    render_strategies = dict(SiteConfig.objects.values_list("name", "render_strategy"))
+    with PageFetcher() as fetcher:
+        for scholarship in Scholarship.objects.filter(needs_llm_backfill=True).order_by("id")[:limit]:
+            try:
+                missing = _missing_llm_fields(scholarship)
+                if not missing:
+                    _apply_llm_fields(scholarship, missing, {})
+                    done.append(scholarship.id)
+                    continue
+                html = fetcher.fetch(scholarship.link, render_strategies.get(scholarship.source, "auto"))
+                jobs.append((scholarship, missing, ScholarshipExtractor(raw_html=html, url=scholarship.link).clean_text))
+            except Exception as e:
+                logger.warning(f"[LLM backfill] Skipping {scholarship.id} ({scholarship.link}): {e}")
+
+    async def rescue_all():
+        queue = LLMRescueQueue()
+        try:
+            return await asyncio.gather(*(
+                queue.submit(
+                    lambda text=text, missing=missing: engine.recover_specific_fields(text, missing),
+                    deficit=len(missing), text=text, kind="partial",
+                )
+                for _, missing, text in jobs
+            ), return_exceptions=True)
+        finally:
+            queue.close()
+
+    results = async_to_sync(rescue_all)() if jobs else []
+    for (scholarship, missing, text), recovered in zip(jobs, results):
+        if isinstance(recovered, LLMBudgetExceeded):
+            logger.info(f"[LLM backfill] Leaving {scholarship.id} for the next run: {recovered}")
+            continue
+        try:
+            if isinstance(recovered, Exception):
+                raise recovered
+            _apply_llm_fields(scholarship, missing, recovered)
+        except Exception as e:
+            logger.warning(f"[LLM backfill] Failed for {scholarship.id} ({scholarship.link}): {e}")
+            continue
+        done.append(scholarship.id)
+        if scholarship.scrape_event_id:
+            ScholarshipScrapeEvent.objects.filter(id=scholarship.scrape_event_id).update(
+                llm_tokens_used=F("llm_tokens_used") + LLMRescueQueue.estimate_tokens(text, "partial")
+            )
+
+    if done:
+        reembed_scholarships.delay(scholarship_ids=done, only_missing=False)
+    logger.info(f"[LLM backfill] Filled {len(done)} scholarships.")
+    return len(done)
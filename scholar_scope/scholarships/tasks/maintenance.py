@@ -6,14 +6,17 @@ logger = get_task_logger(__name__)
 @shared_task
 def outdated_scholarships():
     from scholarships.models import Scholarship
+    from scholarships.vector_index import publish_scholarship_updates
     from django.utils import timezone
     from datetime import timedelta
 
     cutoff = timezone.now().date() - timedelta(days=30)
-    updated = Scholarship.objects.filter(
+    ids = list(Scholarship.objects.filter(
         end_date__lte=cutoff,
         active=True,  # don't re-update already inactive ones
-    ).update(active=False)
+    ).values_list("id", flat=True))
+    updated = Scholarship.objects.filter(id__in=ids).update(active=False)
+    publish_scholarship_updates(ids)
     
     logger.info(f"[Tasks] Marked {updated} scholarships as inactive.")
     return updated
@@ -21,14 +24,15 @@ def outdated_scholarships():
 @shared_task
 def batch_invalidate_user_recommendations(user_ids):
     from django.core.cache import cache
-    from scholarships.utils import _rec_cache_key
+    from scholarships.utils import _rec_cache_key, _rec_generation
     
-    for uid in user_ids:
-        cache.delete(_rec_cache_key(uid))
+    generation = _rec_generation()
+    cache.delete_many([_rec_cache_key(uid, generation) for uid in user_ids])
 
 @shared_task
 def remove_semantic_duplicates(threshold=0.95):
     from scholarships.models import Scholarship
+    from scholarships.vector_index import publish_scholarship_updates
     from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
     print("Starting Semantic Deduplication...")
@@ -78,4 +82,5 @@ def remove_semantic_duplicates(threshold=0.95):
         Scholarship.objects.filter(id=id_to_delete).delete()
         deleted_ids.add(id_to_delete)
         deleted_count += 1
+    publish_scholarship_updates(deleted_ids)
     return f"Cleanup Complete. Removed {deleted_count} semantic duplicates."
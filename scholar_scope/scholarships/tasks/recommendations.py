@@ -0,0 +1,36 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+@shared_task
+def refresh_user_recommendations(user_id):
+    from scholarships.models import User
+    from scholarships.utils import compute_user_recommendations, invalidate_user_recommendations
+
+    user = User.objects.select_related("profile").filter(id=user_id).first()
+    if user is None:
+        return 0
+    ranked = compute_user_recommendations(user)
+    invalidate_user_recommendations(user_id)
+    return len(ranked)
+
+@shared_task
+def materialize_scholarship_recommendations(scholarship_ids):
+    """Merge newly embedded scholarships into the materialised top-N lists."""
+    from django.core.cache import cache
+    from scholarships.utils import materialize_scholarship, _rec_cache_key, _rec_generation
+
+    if isinstance(scholarship_ids, int):
+        scholarship_ids = [scholarship_ids]
+
+    affected = set()
+    for scholarship_id in scholarship_ids:
+        affected.update(materialize_scholarship(scholarship_id))
+
+    if affected:
+        generation = _rec_generation()
+        cache.delete_many([_rec_cache_key(uid, generation) for uid in affected])
+
+    logger.info(f"[Recommendations] {len(scholarship_ids)} scholarships updated {len(affected)} users' top-N.")
+    return len(affected)
@@ -6,7 +6,6 @@ from django.utils import timezone
 from datetime import timedelta
 from django.core.mail import send_mail
 from asgiref.sync import async_to_sync
-import dateparser
 from datetime import date
 from celery.utils.log import get_task_logger
 import os
@@ -46,6 +45,91 @@ def _run_spider_process(site_config_id, scrape_event_id):
         print(f"Spider Process Failed: {e}")
         sys.exit(1)
 
+def _run_multi_spider_process(site_config_ids, max_concurrent_sites=None):
+    """
+    Crawl several SiteConfigs concurrently in ONE reactor. Every crawler
+    shares a single Playwright browser (SharedBrowserPlaywrightHandler),
+    so wall-clock is roughly the slowest site rather than the sum.
+    Updates last_scraped for the sites that finished cleanly; exits
+    non-zero if any site crawl failed.
+    """
+    try:
+        import django
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'scholarscope.settings')
+        django.setup()
+
+        from django.conf import settings as django_settings
+        from django.db import connections
+        connections.close_all()
+
+        from scrapy.utils.reactor import install_reactor
+        install_reactor("twisted.internet.asyncioreactor.AsyncioSelectorReactor")
+
+        from twisted.internet import reactor, defer
+        from scrapy.crawler import CrawlerRunner
+        from scrapy.utils.log import configure_logging
+        from scrapy.utils.project import get_project_settings
+        from scholarscope_scrapers.scholarscope_scrapers.spiders.scholarships_spider import ScholarshipBatchSpider
+
+        settings = get_project_settings()
+        settings.set("TWISTED_REACTOR", "twisted.internet.asyncioreactor.AsyncioSelectorReactor")
+        settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", django_settings.SCRAPE_PER_DOMAIN_CONCURRENCY)
+        settings.set("SCRAPE_GLOBAL_CONCURRENCY", django_settings.SCRAPE_GLOBAL_CONCURRENCY)
+        configure_logging(settings)
+
+        from scholarships.models import ScholarshipScrapeEvent, SiteConfig
+
+        # One ScrapeEvent per site, as a single-site crawl gets; the pipeline
+        # picks it up from scrape_event_id and completes it at close
+        scrape_event_ids = {
+            site.id: ScholarshipScrapeEvent.objects.create_scrape_event(
+                source_name=site.name, source_url=site.base_url
+            ).id
+            for site in SiteConfig.objects.filter(id__in=site_config_ids)
+        }
+        connections.close_all()
+
+        runner = CrawlerRunner(settings)
+        slots = defer.DeferredSemaphore(max_concurrent_sites or django_settings.SCRAPE_CONCURRENT_SITES)
+        finished = []
+        failed = {}
+
+        def _failed(failure, site_config_id):
+            logger.error(f"Crawl failed for site {site_config_id}: {failure.value}")
+            failed[site_config_id] = str(failure.value)
+
+        def _crawl(site_config_id):
+            d = runner.crawl(
+                ScholarshipBatchSpider,
+                site_config_id=site_config_id,
+                scrape_event_id=scrape_event_ids.get(site_config_id),
+            )
+            d.addCallback(lambda _: finished.append(site_config_id))
+            d.addErrback(_failed, site_config_id)
+            return d
+
+        crawls = defer.DeferredList([slots.run(_crawl, sid) for sid in site_config_ids])
+        crawls.addBoth(lambda _: reactor.stop())
+        reactor.run()
+
+        from django.utils import timezone
+        connections.close_all()
+        SiteConfig.objects.filter(id__in=finished).update(last_scraped=timezone.now())
+        # A crawl that failed before the pipeline closed leaves its event open
+        for site_config_id, error in failed.items():
+            event = ScholarshipScrapeEvent.objects.filter(
+                id=scrape_event_ids.get(site_config_id), completed_at__isnull=True
+            ).first()
+            if event:
+                event.mark_failed(error)
+
+        if len(finished) < len(site_config_ids):
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Multi-site Spider Process Failed: {e}")
+        sys.exit(1)
+
 @shared_task(bind=True)
 def scrape_site(self, site_config_id, scrape_event_id=None):
     from scholarships.models import SiteConfig 
@@ -70,12 +154,29 @@ def scrape_site(self, site_config_id, scrape_event_id=None):
     except SiteConfig.DoesNotExist:
         pass
 
+@shared_task(bind=True)
+def scrape_sites(self, site_config_ids, max_concurrent_sites=None):
+    """Crawl several sites concurrently in one spider process."""
+    p = multiprocessing.Process(
+        target=_run_multi_spider_process,
+        args=(list(site_config_ids), max_concurrent_sites)
+    )
+    p.start()
+    p.join()
+
+    if p.exitcode != 0:
+        raise Exception(f"Multi-site spider process failed with code {p.exitcode}")
+
 @shared_task
 def scrape_all_sources():
+    from django.conf import settings
     from scholarships.models import SiteConfig
-    sources = SiteConfig.objects.filter(active=True)
-    for site in sources:
-        scrape_site.delay(site_config_id=site.id)
+    site_ids = list(SiteConfig.objects.filter(active=True).values_list("id", flat=True))
+    if settings.SCRAPE_CONCURRENT_SITES > 1:
+        scrape_sites.delay(site_ids)
+        return
+    for site_id in site_ids:
+        scrape_site.delay(site_config_id=site_id)
 
 @shared_task
 def finalize_scrape_event(results, scrape_event_id):
@@ -93,6 +194,7 @@ def process_new_submission(submission_id):
     from scholarscope_scrapers.scholarscope_scrapers.utils.quality import QualityCheck
     from scholarscope_scrapers.scholarscope_scrapers.utils.llm_engine import LLMEngine
     from scholarships.utils import ScholarshipExtractor
+    from scholarships.dates import parse_date
     
     try:
         sub = ScrapeSubmission.objects.get(id=submission_id)
@@ -203,8 +305,7 @@ def process_new_submission(submission_id):
         def safe_parse_date(d):
             if not d: return None
             if isinstance(d, str):
-                parsed = dateparser.parse(d)
-                return parsed.date() if parsed else None
+                return parse_date(d)
             return d
 
         if is_valid_scholarship:
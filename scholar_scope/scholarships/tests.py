@@ -1,3 +1,447 @@
-from django.test import TestCase
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from scholarships.dedup import PLACEHOLDER_TITLE_PREFIX, similar_titles
+from scholarships.embedders import HashingEmbedder
+from scholarships.models import Bookmark, Profile, ProfileChunk, Scholarship, Tag, User
+
+# Eight scholarships per topic; each description is a different window over
+# the topic's vocabulary so the vectors are close but not identical.
+TOPICS = {
+    "engineering": "engineering robotics mechanical electrical circuits design prototype manufacturing",
+    "medicine":    "medicine nursing clinical hospital patients health surgery pharmacy",
+    "arts":        "music painting theatre film creative arts performance studio",
+    "law":         "law justice policy courts legal advocacy rights constitution",
+    "agriculture": "agriculture farming crops soil irrigation rural food livestock",
+}
+PER_TOPIC = 8
+
+# A saved detail page for the offline extraction benchmarks
+DETAIL_PAGE = """<html><head><title>Robotics Engineering Scholarship 2027</title></head><body>
+<h1>Robotics Engineering Scholarship 2027</h1>
+<p>The Robotics Engineering Scholarship supports undergraduate women in STEM
+studying mechanical or electrical engineering at an accredited university.</p>
+<p>Award amount: $5,000 per year.</p>
+<p>Application deadline: March 31, 2027</p>
+<h2>Eligibility</h2>
+<ul><li>Open to international students</li><li>Minimum GPA of 3.0</li></ul>
+<h2>Requirements</h2>
+<ul><li>Two letters of recommendation</li><li>A 500-word personal essay</li></ul>
+</body></html>"""
+
+# An engineering student; the low-weight bio chunk points elsewhere on purpose
+CHUNKS = {
+    "career_goals": "I want a career in engineering, designing robotics and electrical circuits.",
+    "academic":     "Top marks in mechanical engineering and circuits design.",
+    "research":     "Research on robotics prototype manufacturing.",
+    "bio":          "I enjoy music and film in my spare time.",
+}
+
+
+@skipUnless(connection.vendor == "postgresql", "needs Postgres with pgvector")
+class MultiVectorRecommendationTests(TestCase):
+    """
+    The fused single-statement scorer against the original per-chunk rank
+    fusion (and the in-process index), on vectors from the deterministic
+    hashing embedder. Rows are bulk-created so no embedding / chunk-sync
+    Celery tasks are queued.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        embedder = HashingEmbedder()
+
+        scholarships = []
+        for topic, vocabulary in TOPICS.items():
+            words = vocabulary.split()
+            for i in range(PER_TOPIC):
+                title = f"{topic.title()} Scholarship {i + 1}"
+                description = "Funding for students in " + " ".join(
+                    words[j % len(words)] for j in range(i, i + 4)
+                ) + "."
+                scholarships.append(Scholarship(
+                    title=title,
+                    description=description,
+                    reward="$1,000",
+                    link=f"https://example.org/{topic}/{i + 1}",
+                    source=topic,
+                    embedding=embedder.encode(f"{title}. {description}. . "),
+                ))
+        Scholarship.objects.bulk_create(scholarships)
+        cls.engineering = set(
+            Scholarship.objects.filter(source="engineering").values_list("id", flat=True)
+        )
+
+        user = User.objects.bulk_create([User(username="student", email="student@example.org")])[0]
+        cls.user = User.objects.get(id=user.id)
+        cls.profile = Profile.objects.bulk_create([Profile(user=cls.user)])[0]
+        ProfileChunk.objects.bulk_create([
+            ProfileChunk(profile=cls.profile, chunk_type=chunk_type, text=text, embedding=embedder.encode(text))
+            for chunk_type, text in CHUNKS.items()
+        ])
+
+    def _chunks(self):
+        return list(ProfileChunk.objects.filter(profile=self.profile))
+
+    def _rankings(self, top_n, excluded=()):
+        from scholarships.utils import _fused_sql_recommendations, _rank_fusion_recommendations
+        chunks = self._chunks()
+        return (
+            [s.id for s in _fused_sql_recommendations(chunks, list(excluded), top_n)],
+            [s.id for s in _rank_fusion_recommendations(chunks, list(excluded), top_n)],
+        )
+
+    def test_fused_matches_rank_fusion_on_the_clear_matches(self):
+        fused, per_chunk = self._rankings(top_n=PER_TOPIC)
+
+        self.assertEqual(set(fused), self.engineering)
+        self.assertEqual(set(per_chunk), self.engineering)
+
+    def test_top_k_overlap(self):
+        top_n = 10
+        fused, per_chunk = self._rankings(top_n=top_n)
+
+        self.assertEqual(len(fused), top_n)
+        self.assertEqual(len(per_chunk), top_n)
+        self.assertGreaterEqual(len(set(fused) & set(per_chunk)) / top_n, 0.8)
+
+    def test_fused_is_exact_weighted_cosine_below_prefilter_k(self):
+        # With fewer scholarships than RECOMMENDATION_PREFILTER_K the ANN
+        # prefilter keeps everything, so the fused ranking is exact.
+        import numpy as np
+        from scholarships.utils import CHUNK_WEIGHTS
+
+        chunks = self._chunks()
+        query = sum(
+            CHUNK_WEIGHTS.get(c.chunk_type, 0.05) * np.asarray(c.embedding) / np.linalg.norm(c.embedding)
+            for c in chunks
+        )
+        scored = {
+            sid: float(np.asarray(vector) @ query / np.linalg.norm(vector))
+            for sid, vector in Scholarship.objects.values_list("id", "embedding")
+        }
+        expected = sorted(scored, key=scored.__getitem__, reverse=True)[:PER_TOPIC]
+
+        fused, _ = self._rankings(top_n=PER_TOPIC)
+        self.assertEqual(fused, expected)
+
+    def test_excluded_scholarships_never_returned(self):
+        bookmarked = min(self.engineering)
+        Bookmark.objects.create(user=self.user, scholarship_id=bookmarked)
+        from scholarships.utils import _get_excluded_scholarships
+
+        excluded = _get_excluded_scholarships(self.user)
+        fused, per_chunk = self._rankings(top_n=PER_TOPIC - 1, excluded=excluded)
+
+        self.assertEqual(excluded, [bookmarked])
+        self.assertEqual(set(fused), self.engineering - {bookmarked})
+        self.assertEqual(set(per_chunk), self.engineering - {bookmarked})
+
+    def test_memory_engine_agrees_with_fused(self):
+        from scholarships import vector_index
+        from scholarships.utils import get_multi_vector_recommendations
+
+        vector_index._index = None   # load from this test's rows
+        try:
+            memory = [s.id for s in get_multi_vector_recommendations(self.profile, top_n=PER_TOPIC, engine="memory")]
+        finally:
+            vector_index._index = None
+        fused = [s.id for s in get_multi_vector_recommendations(self.profile, top_n=PER_TOPIC, engine="fused")]
+
+        self.assertEqual(memory, fused)
+
+
+@skipUnless(connection.vendor == "postgresql", "needs Postgres (search_vector triggers)")
+class BenchmarkSearchCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Scholarship.objects.bulk_create([
+            Scholarship(title=f"{topic.title()} Scholarship", description=vocabulary, reward="$500",
+                        link=f"https://example.org/search/{topic}")
+            for topic, vocabulary in TOPICS.items()
+        ])
+
+    def test_reports_both_plans(self):
+        out = StringIO()
+        call_command("benchmark_search", "engineering", "nursing", runs=1, stdout=out)
+
+        report = out.getvalue()
+        self.assertIn("5 scholarships", report)
+        for query in ("'engineering'", "'nursing'"):
+            self.assertRegex(report, rf"{query}\s+dynamic: .* ms \| stored: .* ms \| speedup x")
+
+
+@skipUnless(connection.vendor == "postgresql", "needs Postgres (search_vector triggers)")
+class SearchVectorTests(TestCase):
+    """
+    search_vector is written only by the migration 0023 triggers. Rows are
+    changed with bulk_create / update() so no Django signal is involved.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = Tag.objects.create(name="international")
+        cls.titled, cls.described = Scholarship.objects.bulk_create([
+            Scholarship(title="Robotics Scholarship", description="Funding for circuits design.",
+                        reward="$500", link="https://example.org/search-vector/1"),
+            Scholarship(title="Engineering Award", description="For students of robotics.",
+                        reward="$500", link="https://example.org/search-vector/2"),
+        ])
+        Scholarship.tags.through.objects.bulk_create([
+            Scholarship.tags.through(scholarship_id=cls.titled.id, tag_id=cls.tag.id),
+        ])
+
+    def _matches(self, term):
+        from django.contrib.postgres.search import SearchQuery
+        from scholarships.views import SEARCH_CONFIG
+
+        return set(
+            Scholarship.objects.filter(search_vector=SearchQuery(term, config=SEARCH_CONFIG))
+            .values_list("id", flat=True)
+        )
+
+    def test_insert_indexes_title_description_and_tags(self):
+        self.assertEqual(self._matches("robotics"), {self.titled.id, self.described.id})
+        self.assertEqual(self._matches("circuits"), {self.titled.id})
+        self.assertEqual(self._matches("international"), {self.titled.id})
+
+    def test_title_and_description_updates(self):
+        Scholarship.objects.filter(id=self.titled.id).update(
+            title="Nursing Scholarship", description="Clinical placements."
+        )
+
+        self.assertEqual(self._matches("robotics"), {self.described.id})
+        self.assertEqual(self._matches("nursing"), {self.titled.id})
+        self.assertEqual(self._matches("clinical"), {self.titled.id})
+        self.assertEqual(self._matches("international"), {self.titled.id})   # tags kept
+
+    def test_tag_links_and_renames(self):
+        TagLink = Scholarship.tags.through
+        TagLink.objects.bulk_create([TagLink(scholarship_id=self.described.id, tag_id=self.tag.id)])
+        self.assertEqual(self._matches("international"), {self.titled.id, self.described.id})
+
+        TagLink.objects.filter(scholarship_id=self.titled.id).delete()
+        self.assertEqual(self._matches("international"), {self.described.id})
+
+        Tag.objects.filter(id=self.tag.id).update(name="merit")
+        self.assertEqual(self._matches("international"), set())
+        self.assertEqual(self._matches("merit"), {self.described.id})
+
+    def test_q_searches_the_stored_vector(self):
+        response = self.client.get("/api/scholarships/", {"q": "robotics"})
+        self.assertEqual(response.status_code, 200)
+        # Title (weight A) outranks description (weight B)
+        self.assertEqual([r["id"] for r in response.json()["results"]], [self.titled.id, self.described.id])
+
+        response = self.client.get("/api/scholarships/", {"q": "international"})
+        self.assertEqual([r["id"] for r in response.json()["results"]], [self.titled.id])
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@skipUnless(connection.vendor == "postgresql", "needs Postgres with pgvector")
+@override_settings(CACHES=LOCMEM_CACHE, HYBRID_SEARCH_K=3)
+class HybridSearchTests(TestCase):
+    """
+    ?mode=hybrid: reciprocal rank fusion of the full-text and ANN top-k.
+    Query embeddings come from the hashing embedder instead of the API.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        embedder = HashingEmbedder()
+        rows = (
+            # Title matches: the lexical top-k before any filter
+            [(f"Robotics Scholarship {i}", "Funding for robotics students.", False) for i in range(5)]
+            # Description-only matches, tagged
+            + [(f"Engineering Award {i}", "Open to circuits and robotics majors.", True) for i in range(3)]
+            # No lexical match at all
+            + [("Nursing Grant", "Clinical placements for nurses.", False)]
+        )
+        scholarships = Scholarship.objects.bulk_create([
+            Scholarship(title=title, description=description, reward="$500",
+                        link=f"https://example.org/hybrid/{n}",
+                        embedding=embedder.encode(f"{title}. {description}. . "))
+            for n, (title, description, _) in enumerate(rows)
+        ])
+        tag = Tag.objects.create(name="international")
+        Scholarship.tags.through.objects.bulk_create([
+            Scholarship.tags.through(scholarship_id=s.id, tag_id=tag.id)
+            for s, (_, _, tagged) in zip(scholarships, rows) if tagged
+        ])
+        cls.tagged = {s.id for s, (_, _, tagged) in zip(scholarships, rows) if tagged}
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        embedder = HashingEmbedder()
+        patcher = mock.patch("scholarships.views.get_text_embedding", side_effect=embedder.encode)
+        self.embed = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _top_k(self, query, tag=None):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+        from django.db.models import F
+        from pgvector.django import CosineDistance
+        from scholarships.views import SEARCH_CONFIG
+
+        candidates = Scholarship.objects.filter(tags__name=tag) if tag else Scholarship.objects.all()
+        search_query = SearchQuery(query, config=SEARCH_CONFIG)
+        lexical = list(
+            candidates.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
+            .order_by("-rank", "-id").values_list("id", flat=True)[:3]
+        )
+        semantic = list(
+            candidates.order_by(CosineDistance("embedding", HashingEmbedder().encode(query)))
+            .values_list("id", flat=True)[:3]
+        )
+        return lexical, semantic
+
+    def test_reciprocal_rank_fusion(self):
+        from scholarships.views import RRF_K, _hybrid_search_ranking
+
+        lexical, semantic = self._top_k("robotics")
+        expected = {}
+        for ranking in (lexical, semantic):
+            for position, sid in enumerate(ranking, start=1):
+                expected[sid] = expected.get(sid, 0.0) + 1.0 / (RRF_K + position)
+
+        fused = _hybrid_search_ranking("  Robotics ")
+        self.assertEqual(dict(fused).keys(), expected.keys())
+        for sid, score in fused:
+            self.assertAlmostEqual(score, expected[sid])
+        self.assertEqual([sid for sid, _ in fused], sorted(expected, key=lambda sid: (-expected[sid], -sid)))
+
+    def test_lexical_only_when_embedding_is_over_budget(self):
+        import time
+        from scholarships import views
+
+        self.embed.side_effect = lambda text: time.sleep(0.5) or HashingEmbedder().encode(text)
+        lexical, _ = self._top_k("robotics")
+        with override_settings(HYBRID_SEARCH_EMBED_BUDGET_MS=10), \
+             mock.patch.object(views, "cache") as search_cache:
+            search_cache.get.return_value = None
+            fused = views._hybrid_search_ranking("robotics")
+
+        self.assertEqual([sid for sid, _ in fused], lexical)
+        # A degraded ranking is cached briefly, not for HYBRID_SEARCH_CACHE_TTL
+        search_cache.set.assert_called_once_with(mock.ANY, fused, 60)
+
+    def test_complete_ranking_uses_the_configured_ttl(self):
+        from scholarships import views
+
+        with override_settings(HYBRID_SEARCH_CACHE_TTL=123), mock.patch.object(views, "cache") as search_cache:
+            search_cache.get.return_value = None
+            fused = views._hybrid_search_ranking("robotics")
+        search_cache.set.assert_called_once_with(mock.ANY, fused, 123)
+
+    def test_cursor_pages_follow_the_fused_rank(self):
+        from scholarships.views import _hybrid_search_ranking
+
+        ids, url, params = [], "/api/scholarships/", {"q": "robotics", "mode": "hybrid", "page_size": 2}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            ids += [r["id"] for r in response.json()["results"]]
+            url, params = response.json()["next"], None
+
+        self.assertEqual(ids, [sid for sid, _ in _hybrid_search_ranking("robotics")])
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_filters_apply_inside_the_top_k(self):
+        # The unfiltered lexical top-3 are all untagged title matches; the
+        # tagged rows must still fill a ?tag= query
+        lexical, _ = self._top_k("robotics")
+        self.assertFalse(self.tagged & set(lexical))
+
+        response = self.client.get("/api/scholarships/", {"q": "robotics", "mode": "hybrid", "tag": "international"})
+        self.assertEqual({r["id"] for r in response.json()["results"]}, self.tagged)
+
+
+@skipUnless(connection.vendor == "postgresql", "needs Postgres (pg_trgm)")
+class SimilarTitlesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.real, cls.placeholder = Scholarship.objects.bulk_create([
+            Scholarship(title="Merit Award for Engineers", description="d", reward="$500",
+                        link="https://example.org/similar/1"),
+            Scholarship(title=f"{PLACEHOLDER_TITLE_PREFIX}https://example.org/merit-award",
+                        description="Description unavailable.", reward="$500",
+                        link="https://example.org/merit-award"),
+        ])
+
+    def test_placeholder_rows_are_not_candidates(self):
+        ids = [sid for sid, _, _ in similar_titles("Merit Award")]
+        self.assertIn(self.real.id, ids)
+        self.assertNotIn(self.placeholder.id, ids)
+
+    def test_placeholder_title_has_no_candidates(self):
+        self.assertEqual(similar_titles(f"{PLACEHOLDER_TITLE_PREFIX}https://example.org/other"), [])
+
+
+class BenchmarkExtractorCommandTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.corpus = Path(tmp.name)
+
+    def test_reports_both_extractors(self):
+        (self.corpus / "robotics.html").write_text(DETAIL_PAGE, encoding="utf-8")
+        out = StringIO()
+        call_command("benchmark_extractor", str(self.corpus), runs=1, per_page=True, stdout=out)
+
+        report = out.getvalue()
+        self.assertIn("1 pages, 1 runs per page", report)
+        self.assertRegex(report, r"robotics\.html\s+reparse: .* ms .* KiB \| single: .* ms .* KiB")
+        self.assertRegex(report, r"speedup x\d+\.\d\d, allocations x\d+\.\d\d")
+        self.assertIn("Identical fields on every page", report)
+
+    def test_empty_corpus_is_an_error(self):
+        with self.assertRaisesMessage(CommandError, "No recorded pages"):
+            call_command("benchmark_extractor", str(self.corpus), stdout=StringIO())
+
+
+class BenchmarkCorpusCommandTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        # Same file name in two directories: results must not collide
+        for site in ("site_a", "site_b"):
+            (self.tmp / "corpus" / site).mkdir(parents=True)
+            (self.tmp / "corpus" / site / "index.html").write_text(DETAIL_PAGE, encoding="utf-8")
+
+    def test_save_and_compare(self):
+        import json
+
+        saved = self.tmp / "run.json"
+        out = StringIO()
+        call_command("benchmark_corpus", str(self.tmp / "corpus"), runs=1, save=str(saved), stdout=out)
+
+        report = out.getvalue()
+        self.assertIn("2 pages, 1 runs", report)
+        self.assertRegex(report, r"pages/sec \| per page p50 .* ms, p95 .* ms")
+        self.assertIn("Field hit rate:", report)
+
+        run = json.loads(saved.read_text(encoding="utf-8"))
+        self.assertEqual(run["pages"], 2)
+        self.assertEqual(len(run["results"]), 2)
+        self.assertEqual({r["url"] for r in run["results"].values()}, {"index.html"})
+
+        out = StringIO()
+        call_command("benchmark_corpus", compare=[str(saved), str(saved)], stdout=out)
+        report = out.getvalue()
+        self.assertIn("2 pages in both runs; 0 only in base, 0 only in new", report)
+        self.assertNotRegex(report, r"[1-9]\d* pages changed")
+
+    def test_needs_paths_or_compare(self):
+        with self.assertRaisesMessage(CommandError, "Give corpus paths"):
+            call_command("benchmark_corpus", stdout=StringIO())
@@ -2,20 +2,19 @@ from __future__ import annotations
 import random
 import string
 import hashlib
+import threading
+import time
 from django.conf import settings
 from django.core.mail import send_mail
 from django.core.cache import cache 
-from django.db.models import Count, Q
+from django.db.models import Count, Q, Value, FloatField
 from django.utils.timezone import now
 from pgvector.django import CosineDistance
 from typing import Optional, List
-import re
+from contextlib import contextmanager
+from scholarships.embedders import get_embedder, embedding_cache_namespace
+from scholarships.extraction import ScholarshipExtractor  # noqa: F401  (moved; still importable from here)
 import logging
-import dateparser
-import trafilatura
-from parsel import Selector
-from difflib import get_close_matches
-from datetime import date
 import google.generativeai as genai
 from openai import AsyncOpenAI
 import os
@@ -25,44 +24,6 @@ logger = logging.getLogger(__name__)
 
 TOP_K_CHUNKS = 3
 EMBEDDING_CACHE_TTL = 7 * 24 * 3600  
-RECOMMENDATION_CACHE_TTL = 60 * 60 
-_embedder = None
-
-def _rec_cache_key(user_id: int) -> str:
-    return f"user_recommendations:{user_id}"
-
-class MockNumpyArray(list):
-    """Magic trick to mimic a numpy array's .tolist() method."""
-    def tolist(self): return self
-
-class GeminiEmbedder:
-    def __init__(self, model_name="models/text-embedding-004"):
-        import google.generativeai as genai
-        self.model_name = model_name
-        genai.configure(api_key=os.environ.get("GEMINI_API_KEY"))
-
-    def encode(self, text: str, **kwargs):
-        import google.generativeai as genai
-        result = genai.embed_content(
-            model=self.model_name,
-            content=text
-        )
-        return MockNumpyArray(result['embedding'])
-    
-def invalidate_user_recommendations(user_id: int) -> None:
-    cache.delete(_rec_cache_key(user_id))
-
-def get_embedder():
-    """
-    Returns a singleton instance of the configured remote embedder.
-    Controlled by the EMBEDDING_PROVIDER environment variable.
-    """
-    global _embedder
-    if _embedder is None:
-        logger.info("Initializing Gemini API Embedder (768 dimensions)")
-        _embedder = GeminiEmbedder()
-            
-    return _embedder
 
 def build_profile_text(profile) -> str:
     """
@@ -107,7 +68,7 @@ def generate_fingerprint(title, link):
 # Load model once globally (so it's not reloaded on every task)
 
 def _text_cache_key(text: str) -> str:
-    return "embedding_" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return embedding_cache_namespace() + hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 def get_text_embedding(text, ttl_seconds= 7 * 24 * 3600) -> Optional[List[float]]:
     """
@@ -130,6 +91,34 @@ def get_text_embedding(text, ttl_seconds= 7 * 24 * 3600) -> Optional[List[float]
     cache.set(key, emb, timeout=ttl_seconds)
     return emb
 
+def get_text_embeddings(texts, ttl_seconds=7 * 24 * 3600) -> List[Optional[List[float]]]:
+    """
+    Batch version of get_text_embedding: one cache MGET for all texts, then
+    only the misses are sent to the embedder in provider-sized batches.
+    Returns one entry per input text (None for blank texts or failures).
+    """
+    keys = {text: _text_cache_key(text) for text in texts if text and text.strip()}
+    if not keys:
+        return [None] * len(texts)
+
+    cached = cache.get_many(list(set(keys.values())))
+    found = {text: cached[key] for text, key in keys.items() if key in cached}
+    misses = [text for text in keys if text not in found]
+
+    if misses:
+        try:
+            vectors = get_embedder().encode_batch(misses)
+        except Exception as exc:
+            logger.exception(f"[Embedding] encode_batch() failed for {len(misses)} texts: {exc}")
+            vectors = []
+
+        fresh = {text: list(vec) for text, vec in zip(misses, vectors)}
+        if fresh:
+            cache.set_many({keys[text]: vec for text, vec in fresh.items()}, timeout=ttl_seconds)
+        found.update(fresh)
+
+    return [found.get(text) for text in texts]
+
 def send_admin_alert(subject: str, body: str):
     admin_email = getattr(settings, "ADMINS_EMAIL", None)
     if admin_email:
@@ -229,46 +218,266 @@ async def generate_text(prompt, response_format="text", max_words=None):
 
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60   
 
-def _rec_cache_key(user_id: int) -> str:
-    return f"user_recommendations_{user_id}"
+# Bump when the cached payload layout changes; old entries are then never read.
+REC_CACHE_SCHEMA = 2
+REC_GENERATION_KEY = "user_recommendations:generation"
 
-def get_cached_recommendations(user, top_n=20):
+# While depth > 0, bump_recommendation_generation only records that a bump is
+# due (see defer_recommendation_invalidation) — until `until` (monotonic), so a
+# crawl that dies without flushing can't suppress bumps for the process's life.
+# The lock covers callers on different threads (reactor, DB executor, web).
+REC_INVALIDATION_MAX_DEFER = 2 * 60 * 60
+_rec_invalidation = {"depth": 0, "pending": False, "until": 0.0}
+_rec_invalidation_lock = threading.Lock()
+
+def _rec_generation() -> int:
+    return int(cache.get(REC_GENERATION_KEY) or 0)
+
+def _rec_cache_key(user_id: int, generation: Optional[int] = None) -> str:
+    if generation is None:
+        generation = _rec_generation()
+    return f"user_recommendations:v{REC_CACHE_SCHEMA}:g{generation}:{user_id}"
+
+def invalidate_user_recommendations(user_id: int) -> None:
+    cache.delete(_rec_cache_key(user_id))
+
+def bump_recommendation_generation() -> None:
+    """
+    Invalidate every cached recommendation list at once by moving all keys
+    to a new generation; entries under the old one expire on their TTL.
+    """
+    with _rec_invalidation_lock:
+        if _rec_invalidation["depth"]:
+            if time.monotonic() < _rec_invalidation["until"]:
+                _rec_invalidation["pending"] = True
+                return
+            logger.warning("[Recommendations] Deferred invalidation was never flushed; resuming bumps.")
+            _rec_invalidation.update(depth=0, pending=False)
+    try:
+        try:
+            cache.incr(REC_GENERATION_KEY)
+        except ValueError:
+            cache.add(REC_GENERATION_KEY, 0, timeout=None)
+            cache.incr(REC_GENERATION_KEY)
+    except Exception as exc:
+        logger.warning(f"[Recommendations] Could not bump cache generation: {exc}")
+
+def defer_recommendation_invalidation(max_seconds: int = REC_INVALIDATION_MAX_DEFER) -> None:
+    """
+    Coalesce generation bumps until the matching flush (e.g. one scrape run),
+    or for at most max_seconds if the flush never comes.
+    """
+    with _rec_invalidation_lock:
+        _rec_invalidation["depth"] += 1
+        _rec_invalidation["until"] = max(_rec_invalidation["until"], time.monotonic() + max_seconds)
+
+def flush_recommendation_invalidation() -> None:
+    with _rec_invalidation_lock:
+        _rec_invalidation["depth"] = max(0, _rec_invalidation["depth"] - 1)
+        due = not _rec_invalidation["depth"] and _rec_invalidation["pending"]
+        if due:
+            _rec_invalidation["pending"] = False
+    if due:
+        bump_recommendation_generation()
+
+def _pack_recommendations(ranked) -> bytes:
+    """[(scholarship_id, score), ...] → int64 ids followed by float32 scores."""
+    from array import array
+    ids = array("q", (sid for sid, _ in ranked))
+    scores = array("f", (score for _, score in ranked))
+    return ids.tobytes() + scores.tobytes()
+
+def _unpack_recommendations(blob: bytes) -> list:
+    from array import array
+    count = len(blob) // 12
+    ids, scores = array("q"), array("f")
+    ids.frombytes(blob[:count * 8])
+    scores.frombytes(blob[count * 8:])
+    return list(zip(ids, scores))
+
+def _hydrate_recommendations(ranked) -> list:
+    """One in_bulk query for the ranked ids, in rank order, without embeddings."""
     from scholarships.models import Scholarship
-    key = _rec_cache_key(user.id)
+    by_id = Scholarship.objects.filter(active=True).defer("embedding").in_bulk(
+        [sid for sid, _ in ranked]
+    )
+    results = []
+    for sid, score in ranked:
+        scholarship = by_id.get(sid)
+        if scholarship is not None:
+            scholarship.score = score
+            results.append(scholarship)
+    return results
+
+def get_cached_recommendations(user, top_n=20):
     try:
+        key = _rec_cache_key(user.id)
         cached = cache.get(key)
-        if cached:
-            return cached["results"]
+        if cached is not None:
+            return _hydrate_recommendations(_unpack_recommendations(cached)[:top_n])
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Redis cache unavailable for recommendations: {e}")
         return []
 
-    # 2. Get User Profile
+    # 2. Read the materialised top-N (one indexed query)
+    ranked = get_materialized_recommendations(user, top_n)
+
+    if len(ranked) < top_n:
+        # 3. Not materialised yet, or bookmarks / applications / deactivations
+        #    filtered it below top_n: fill the rest from the live query
+        profile = getattr(user, "profile", None)
+        if profile is None or profile.embedding is None or len(profile.embedding) == 0:
+            if not ranked:
+                return _fallback_recommendations(user)
+        else:
+            if not ranked:
+                from scholarships.tasks import refresh_user_recommendations
+                refresh_user_recommendations.delay(user.id)
+            ranked += _live_recommendations(
+                user, profile.embedding, top_n - len(ranked), exclude_ids=[sid for sid, _ in ranked]
+            )
+
+    # 4. Save the compact (id, score) list to the cache
+    cache.set(key, _pack_recommendations(ranked), CACHE_TTL_SECONDS)
+
+    return _hydrate_recommendations(ranked)
+
+MATERIALIZED_TOP_N = 20
+
+def _similarity(vector):
+    return Value(1.0, output_field=FloatField()) - CosineDistance("embedding", vector)
+
+def get_materialized_recommendations(user, top_n=20) -> list:
+    """
+    [(scholarship_id, score), ...] from the user's UserRecommendation rows,
+    best first. Bookmarked/applied and deactivated scholarships are filtered
+    at read time.
+    """
+    from scholarships.models import UserRecommendation, Bookmark, Application
+    return list(
+        UserRecommendation.objects.filter(user=user, scholarship__active=True)
+        .exclude(scholarship_id__in=Bookmark.objects.filter(user=user).values("scholarship_id"))
+        .exclude(scholarship_id__in=Application.objects.filter(user=user).values("scholarship_id"))
+        .order_by("rank")
+        .values_list("scholarship_id", "score")[:top_n]
+    )
+
+def _live_recommendations(user, vector, limit: int, exclude_ids=()) -> list:
+    """[(scholarship_id, score), ...] straight from the embeddings, best first."""
+    from scholarships.models import Scholarship
+    if limit <= 0:
+        return []
+    return list(
+        Scholarship.objects.filter(active=True)
+        .exclude(embedding__isnull=True)
+        .exclude(id__in=[*_get_excluded_scholarships(user), *exclude_ids])
+        .annotate(score=_similarity(vector))
+        .order_by(CosineDistance("embedding", vector))
+        .values_list("id", "score")[:limit]
+    )
+
+def _lock_users(user_ids) -> None:
+    """
+    Row-lock the users (in id order, so concurrent callers can't deadlock)
+    until the enclosing transaction ends. Every read-modify-write of a user's
+    UserRecommendation rows holds this, so a full refresh and an incremental
+    merge for the same user can't overwrite each other.
+    """
+    from scholarships.models import User
+    list(User.objects.select_for_update().filter(id__in=list(user_ids)).order_by("id").values_list("id", flat=True))
+
+def _store_user_recommendations(rankings: dict) -> None:
+    """Replace the materialised rows of each user in {user_id: [(scholarship_id, score), ...]}."""
+    from django.db import transaction
+    from scholarships.models import UserRecommendation
+    with transaction.atomic():
+        UserRecommendation.objects.filter(user_id__in=list(rankings)).delete()
+        UserRecommendation.objects.bulk_create([
+            UserRecommendation(user_id=user_id, scholarship_id=sid, score=score, rank=rank)
+            for user_id, ranked in rankings.items()
+            for rank, (sid, score) in enumerate(ranked)
+        ])
+
+def compute_user_recommendations(user, top_n=MATERIALIZED_TOP_N) -> list:
+    """Full recompute of one user's top-N; returns the stored [(scholarship_id, score), ...]."""
+    from django.db import transaction
     profile = getattr(user, "profile", None)
-    if profile.embedding is None or len(profile.embedding) == 0:
-        return _fallback_recommendations(user)
-
-   
-    scholarships = Scholarship.objects.filter(
-        active=True
-    ).exclude(
-        id__in=_get_excluded_scholarships(user)
-    ).order_by(
-        CosineDistance('embedding', profile.embedding)
-    )[:top_n]
-
-    results = list(scholarships)
-
-    # 4. Save to Cache
-    cache.set(
-        key,
-        {"results": results, "cached_at": now().isoformat()},
-        CACHE_TTL_SECONDS,
+    with transaction.atomic():
+        _lock_users([user.id])
+        ranked = []
+        if profile is not None and profile.embedding is not None:
+            ranked = _live_recommendations(user, profile.embedding, top_n)
+        _store_user_recommendations({user.id: ranked})
+    return ranked
+
+def materialize_scholarship(scholarship_id: int, top_n=MATERIALIZED_TOP_N, batch_size=500) -> list:
+    """
+    Incrementally merge one (re-)embedded scholarship into every user's
+    top-N. All profiles are scored against it in a single query; only users
+    it now qualifies for (or who already had it listed) are rewritten.
+    Users that were never materialised are skipped — their first read
+    schedules a full refresh. Returns the affected user ids.
+    """
+    from scholarships.models import Scholarship, Profile, UserRecommendation, Bookmark, Application
+    from django.db import transaction
+    from django.db.models import Min
+
+    vector = (
+        Scholarship.objects.filter(id=scholarship_id, active=True)
+        .exclude(embedding__isnull=True)
+        .values_list("embedding", flat=True)
+        .first()
     )
 
-    return results
+    listed = set(
+        UserRecommendation.objects.filter(scholarship_id=scholarship_id)
+        .values_list("user_id", flat=True)
+    )
+    others = UserRecommendation.objects.exclude(scholarship_id=scholarship_id)
+    cutoffs = {
+        user_id: (count, floor)
+        for user_id, count, floor in others.values("user_id")
+        .annotate(count=Count("id"), floor=Min("score"))
+        .values_list("user_id", "count", "floor")
+    }
+
+    scores = {}
+    if vector is not None:
+        skip = set(Bookmark.objects.filter(scholarship_id=scholarship_id).values_list("user_id", flat=True))
+        skip.update(Application.objects.filter(scholarship_id=scholarship_id).values_list("user_id", flat=True))
+        for user_id, score in (
+            Profile.objects.exclude(embedding__isnull=True)
+            .filter(user_id__in=UserRecommendation.objects.values("user_id"))
+            .annotate(score=_similarity(vector))
+            .values_list("user_id", "score")
+            .iterator(chunk_size=2000)
+        ):
+            count, floor = cutoffs.get(user_id, (0, None))
+            if user_id not in skip and (count < top_n or floor is None or score > floor):
+                scores[user_id] = score
+
+    affected = sorted(listed | set(scores))
+    for start in range(0, len(affected), batch_size):
+        batch = affected[start:start + batch_size]
+        with transaction.atomic():
+            # Re-read each list under the lock: another merge or a full
+            # refresh may have rewritten it since the cutoffs above
+            _lock_users(batch)
+            rankings = {user_id: [] for user_id in batch}
+            for user_id, sid, score in (
+                others.filter(user_id__in=batch)
+                .order_by("user_id", "rank")
+                .values_list("user_id", "scholarship_id", "score")
+            ):
+                rankings[user_id].append((sid, score))
+            for user_id, ranked in rankings.items():
+                if user_id in scores:
+                    ranked.append((scholarship_id, scores[user_id]))
+                    ranked.sort(key=lambda item: item[1], reverse=True)
+                    del ranked[top_n:]
+            _store_user_recommendations(rankings)
+
+    return affected
 
 CHUNK_WEIGHTS = {
     "career_goals":    0.30,
@@ -280,13 +489,18 @@ CHUNK_WEIGHTS = {
 }
 
 
-def get_multi_vector_recommendations(profile, top_n: int = 20) -> list:
+def get_multi_vector_recommendations(profile, top_n: int = 20, engine: Optional[str] = None) -> list:
     """
     Score scholarships against multiple profile chunk embeddings,
     weighted by how much each dimension typically matters for matching.
     Falls back to single-vector if chunks aren't ready.
+
+    engine="memory" scores every chunk in one pass over the in-process
+    vector index; engine="fused" computes the weighted score in Postgres;
+    engine="sql" is the original per-chunk rank fusion, kept for A/B
+    comparison. Defaults to settings.RECOMMENDATION_ENGINE.
     """
-    from scholarships.models import ProfileChunk, Scholarship
+    from scholarships.models import ProfileChunk
     chunks = list(
         ProfileChunk.objects.filter(profile=profile)
         .exclude(embedding__isnull=True)
@@ -297,6 +511,121 @@ def get_multi_vector_recommendations(profile, top_n: int = 20) -> list:
         return _fallback_recommendations(profile.user)
 
     excluded = _get_excluded_scholarships(profile.user)
+    engine = engine or getattr(settings, "RECOMMENDATION_ENGINE", "memory")
+
+    if engine == "memory":
+        results = _vector_index_recommendations(chunks, excluded, top_n)
+        if results is not None:
+            return results
+
+    if engine in ("memory", "fused"):
+        return _fused_sql_recommendations(chunks, excluded, top_n)
+
+    return _rank_fusion_recommendations(chunks, excluded, top_n)
+
+
+def _vector_index_recommendations(chunks, excluded, top_n: int) -> Optional[list]:
+    """
+    Returns the top_n scholarships from the in-process index, or None when
+    the index can't serve this request (numpy missing, dimension mismatch).
+    """
+    from scholarships.models import Scholarship
+    from scholarships.vector_index import get_scholarship_index
+
+    vectors = [c.embedding for c in chunks]
+    weights = [CHUNK_WEIGHTS.get(c.chunk_type, 0.05) for c in chunks]
+    try:
+        index = get_scholarship_index()
+        ranked = index.search(vectors, weights, top_n=top_n, exclude_ids=excluded)
+        ids = [sid for sid, _ in ranked]
+        by_id = Scholarship.objects.filter(active=True).in_bulk(ids)
+        # Deactivations are published too, but a row can go inactive between
+        # the last replayed delta and this read (or its publish can fail):
+        # drop such rows from the index and search again until top_n are live.
+        for _ in range(3):
+            stale = [sid for sid in ids if sid not in by_id]
+            if not stale or len(ranked) < top_n:
+                break
+            index.discard(stale)
+            ranked = index.search(vectors, weights, top_n=top_n, exclude_ids=excluded)
+            ids = [sid for sid, _ in ranked]
+            by_id.update(Scholarship.objects.filter(active=True).in_bulk(
+                [sid for sid in ids if sid not in by_id]
+            ))
+    except ImportError:
+        logger.warning("[Recommendations] numpy unavailable — using SQL rank fusion.")
+        return None
+    except ValueError as exc:
+        logger.warning(f"[Recommendations] Vector index unusable: {exc}")
+        return None
+
+    return [by_id[sid] for sid in ids if sid in by_id][:top_n]
+
+
+@contextmanager
+def vector_search_params(ef_search: Optional[int] = None, probes: Optional[int] = None):
+    """
+    Override pgvector's hnsw.ef_search / ivfflat.probes for the queries run
+    inside the block (SET LOCAL, so it ends with the transaction).
+    """
+    from django.db import connection, transaction
+    with transaction.atomic():
+        if connection.vendor == "postgresql" and (ef_search or probes):
+            with connection.cursor() as cursor:
+                if ef_search:
+                    cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+                if probes:
+                    cursor.execute("SELECT set_config('ivfflat.probes', %s, true)", [str(probes)])
+        yield
+
+
+def _fused_sql_recommendations(chunks, excluded, top_n: int, prefilter_k: Optional[int] = None) -> list:
+    """
+    Single-statement weighted scoring in Postgres.
+
+    Each chunk contributes an ANN-friendly `ORDER BY embedding <=> chunk LIMIT k`
+    subquery (served by the HNSW index); the UNION of those ids is rescored with
+    the full CHUNK_WEIGHTS-weighted cosine similarity and cut to top_n. Cost
+    scales with k × chunks, not with the size of the catalogue.
+    """
+    from functools import reduce
+    from operator import add
+    from scholarships.models import Scholarship
+
+    k = prefilter_k or getattr(settings, "RECOMMENDATION_PREFILTER_K", 50)
+    base = (
+        Scholarship.objects.filter(active=True)
+        .exclude(id__in=excluded)
+        .exclude(embedding__isnull=True)
+    )
+
+    candidates = None
+    for chunk in chunks:
+        nearest = (
+            base.order_by(CosineDistance("embedding", chunk.embedding))
+            .values_list("id", flat=True)[:k]
+        )
+        candidates = nearest if candidates is None else candidates.union(nearest)
+
+    score = reduce(add, [
+        Value(CHUNK_WEIGHTS.get(c.chunk_type, 0.05), output_field=FloatField())
+        * (Value(1.0, output_field=FloatField()) - CosineDistance("embedding", c.embedding))
+        for c in chunks
+    ])
+
+    # Each prefilter subquery needs ef_search >= k to return k neighbours
+    ef_search = max(k, getattr(settings, "PGVECTOR_HNSW_EF_SEARCH", 100))
+    with vector_search_params(ef_search=ef_search):
+        return list(
+            Scholarship.objects.filter(id__in=candidates)
+            .annotate(score=score)
+            .defer("embedding")
+            .order_by("-score", "-id")[:top_n]
+        )
+
+
+def _rank_fusion_recommendations(chunks, excluded, top_n: int) -> list:
+    from scholarships.models import Scholarship
     scholarships = list(
         Scholarship.objects.filter(active=True)
         .exclude(id__in=excluded)
@@ -359,761 +688,6 @@ def _fallback_recommendations(user):
 
 logger = logging.getLogger(__name__)
 
-"""
-scholarship_extractor.py
-─────────────────────────────────────────────────────────────────────────────
-Single, reusable extraction engine shared by:
-  • ScholarshipBatchSpider  (Scrapy spider)
-  • extract_from_html()     (Django REST view / Chrome-extension endpoint)
-
-Usage
-─────
-# Plain HTML string (view / Chrome extension)
-extractor = ScholarshipExtractor(raw_html=html_str, url="https://example.com/scholarship")
-title      = extractor.extract_title()
-end_date   = extractor.extract_date("end")
-...
-
-# Scrapy response object (spider)
-extractor = ScholarshipExtractor(scrapy_response=response)
-title      = extractor.extract_title()
-...
-"""        
-
-def _normalize(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
-
-
-def _clean_bullet(text: str) -> str:
-    text = re.sub(r"^[\d.\)\-*•►→➤]\s*", "", text.strip())
-    return re.sub(r"^\w\)\s*", "", text).strip()
-
-
-def _try_parse_date(raw: str) -> Optional[date]:
-    if not raw or len(raw) < 4:
-        return None
-    try:
-        dt = dateparser.parse(
-            raw,
-            settings={"STRICT_PARSING": False, "PREFER_DATES_FROM": "future"},
-        )
-        return dt.date() if dt else None
-    except Exception:
-        return None
-
-_NAV_PHRASES = frozenset([
-    "postgraduate scholarships", "undergraduate scholarships",
-    "masters scholarships", "phd scholarships", "high school scholarships",
-    "scholarships by level", "scholarships by country", "scholarships by field",
-    "competitions", "fellowships", "training", "internships",
-    "recent posts", "categories", "archives", "related posts",
-    "read more", "learn more", "click here", "apply now",
-    "home", "about", "contact", "privacy policy", "terms",
-    "menu", "search", "navigation", "skip to content",
-    "share", "tweet", "facebook", "print", "email",
-    "all scholarships", "browse scholarships", "find scholarships",
-    "scholarship search", "sign in", "my account", "dashboard",
-    "back to top", "continue reading", "load more",
-])
-
-# Heading keywords that identify the right content sections
-_ELIGIBILITY_HEADINGS = [
-    "eligibility", "who can apply", "who should apply",
-    "criteria", "qualifications", "requirements to apply",
-    "eligible applicants", "who is eligible",
-]
-_REQUIREMENTS_HEADINGS = [
-    "requirements", "documents required", "required documents",
-    "what you need", "application documents", "documents needed",
-    "how to apply", "application requirements", "what to submit",
-]
-
-
-def _is_navigation_item(text: str) -> bool:
-    """Returns True if this text looks like a navigation/sidebar item."""
-    t = _normalize(text)
-    if t in _NAV_PHRASES:
-        return True
-    # Ends with "scholarships" alone (sidebar category links)
-    if re.match(r"^[a-z\s]+ scholarships?$", t):
-        return True
-    # Very short items with no sentence structure are usually nav
-    if len(t.split()) < 3 and not any(c in t for c in [":", "("]):
-        return True
-    return False
-
-
-class ScholarshipExtractor:
-    def __init__(
-        self,
-        *,
-        raw_html: Optional[str] = None,
-        scrapy_response=None,
-        url: Optional[str] = None,
-    ):
-        if scrapy_response is not None:
-            self._response = scrapy_response
-            self._sel = scrapy_response
-            self.url = scrapy_response.url
-            self.raw_html = scrapy_response.text
-        elif raw_html is not None:
-            self.raw_html = raw_html
-            self._sel = Selector(text=raw_html)
-            self._response = None
-            self.url = url or ""
-        else:
-            raise ValueError("Provide either raw_html= or scrapy_response=")
-
-        self._clean_text_cache: Optional[str] = None
-
-    # ── low-level helpers ─────────────────────────────────────────────────────
-
-    def css(self, query: str):
-        return self._sel.css(query)
-
-    @property
-    def clean_text(self) -> str:
-        if self._clean_text_cache is not None:
-            return self._clean_text_cache
-        try:
-            text = trafilatura.extract(
-                self.raw_html,
-                include_comments=False,
-                include_tables=True,
-                no_fallback=False,
-            )
-            if text and len(text) > 200:
-                self._clean_text_cache = text
-                return text
-        except Exception:
-            pass
-
-        content_selectors = [
-            "article", ".entry-content", ".post-content",
-            ".article-content", "main", "#content",
-            "div[class*='content']", "div[class*='article']",
-        ]
-        for sel in content_selectors:
-            text = self._extract_text_excluding_noise(self.css(sel))
-            if text and len(text) > 500:
-                self._clean_text_cache = text
-                return text
-
-        text = self._extract_text_excluding_noise(self.css("body"))
-        self._clean_text_cache = text or ""
-        return self._clean_text_cache
-
-    def _extract_text_excluding_noise(self, selector) -> str:
-        try:
-            clean_xpath = """
-                descendant-or-self::text()
-                [not(ancestor::script)]
-                [not(ancestor::style)]
-                [not(ancestor::nav)]
-                [not(ancestor::header)]
-                [not(ancestor::footer)]
-                [not(ancestor::aside)]
-                [not(ancestor::div[contains(@class,'related')])]
-                [not(ancestor::div[contains(@class,'sidebar')])]
-                [not(ancestor::div[contains(@class,'widget')])]
-                [not(ancestor::div[contains(@class,'comments')])]
-                [not(ancestor::div[contains(@class,'menu')])]
-                [not(ancestor::div[contains(@class,'nav')])]
-                [not(ancestor::ul[contains(@class,'nav')])]
-                [not(ancestor::ul[contains(@class,'menu')])]
-            """
-            texts = selector.xpath(clean_xpath).getall()
-            joined = " ".join(t.strip() for t in texts if t.strip())
-            return re.sub(r"\s+", " ", joined).strip()
-        except Exception:
-            try:
-                return selector.xpath("string(.)").get() or ""
-            except Exception:
-                return ""
-
-    def _section_text(self, css_selector: Optional[str]) -> Optional[str]:
-        if not css_selector:
-            return None
-        clean = re.sub(r"::(text|attr\([^)]+\))", "", css_selector).strip()
-        try:
-            el = self.css(clean).get()
-            if not el:
-                return None
-            sel = Selector(text=el)
-            texts = sel.css("::text").getall()
-            text = " ".join(t.strip() for t in texts if t.strip())
-            if not text:
-                text = sel.xpath("string(.)").get() or ""
-            return text.strip() or None
-        except Exception:
-            return None
-
-    # ── Semantic section finder ───────────────────────────────────────────────
-
-    def _find_semantic_section(self, heading_keywords: list[str]) -> Optional[str]:
-        """
-        Find the content section whose heading matches one of the keywords.
-        Returns the combined text of list items / paragraphs inside that section,
-        guaranteed NOT to be navigation content.
-
-        Strategy:
-        1. Find a heading (h2/h3/h4/dt/strong/th) whose text matches a keyword.
-        2. Walk forward siblings to collect li/p/dd text until the next heading.
-        3. Return None if nothing substantive is found.
-        """
-        # All headings on the page
-        heading_sel = "h1, h2, h3, h4, h5, dt, th, strong, [class*='heading'], [class*='title']"
-
-        for heading_el in self.css(heading_sel):
-            heading_text = _normalize(heading_el.xpath("string(.)").get() or "")
-            if not any(kw in heading_text for kw in heading_keywords):
-                continue
-
-            # Found a matching heading — collect following content
-            # Try parent container first
-            parent_html = heading_el.xpath("..").get() or ""
-            if not parent_html:
-                continue
-
-            parent_sel = Selector(text=parent_html)
-
-            # Collect li items from the parent
-            items = []
-            for li in parent_sel.css("li"):
-                text = li.xpath("string(.)").get(default="").strip()
-                if text and not _is_navigation_item(text):
-                    items.append(text)
-
-            if items:
-                return "\n".join(items)
-
-            # Fallback: collect paragraphs
-            for p in parent_sel.css("p"):
-                text = p.xpath("string(.)").get(default="").strip()
-                if len(text) > 20 and not _is_navigation_item(text):
-                    items.append(text)
-
-            if items:
-                return "\n".join(items)
-
-        return None
-
-    def _find_content_list(self, heading_keywords: list[str], validator) -> list[str]:
-        """
-        Find list items under a semantic heading and validate each with `validator`.
-        Falls back to searching clean_text with regex.
-        Does NOT fall back to bare `ul li` (navigation poison risk).
-        """
-        results = []
-
-        section_text = self._find_semantic_section(heading_keywords)
-        if section_text:
-            for line in re.split(r"[\n;•►→➤]", section_text):
-                line = _clean_bullet(line).strip()
-                if validator(line) and not _is_navigation_item(line):
-                    results.append(line)
-            if results:
-                return results
-
-        # Try class-targeted selectors only (NOT bare ul li)
-        targeted_selectors = [
-            f"[class*='{kw.split()[0]}'] li"
-            for kw in heading_keywords
-            if kw.split()[0] not in ("who", "what", "how")
-        ]
-        for sel in targeted_selectors:
-            for el in self.css(sel):
-                text = el.xpath("string(.)").get(default="").strip()
-                if validator(text) and not _is_navigation_item(text):
-                    results.append(text)
-                    if len(results) >= 10:
-                        break
-            if results:
-                return results
-
-        return results
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 1. TITLE
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_title(self, css_selector: Optional[str] = None) -> str:
-        if css_selector:
-            text = self._section_text(css_selector)
-            if text and len(text.strip()) > 5:
-                return text.strip()[:255]
-
-        for sel in ["h1", ".entry-title", ".post-title", ".scholarship-title",
-                    "[class*='title']", "[class*='heading']"]:
-            title = self.css(f"{sel}::text").get()
-            if title and len(title.strip()) > 5:
-                title = title.split("|")[0].split(" - ")[0].strip()
-                if not _is_navigation_item(title):
-                    return title[:255]
-
-        page_title = self.css("title::text").get()
-        if page_title:
-            return page_title.split("|")[0].strip()[:255]
-
-        return "Scholarship Title Not Found"
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 2. DESCRIPTION
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_description(self, css_selector: Optional[str] = None) -> str:
-        if css_selector:
-            text = self._section_text(css_selector)
-            if text and len(text) > 50:
-                return text
-
-        parts: list[str] = []
-
-        meta = self.css('meta[name="description"]::attr(content)').get()
-        if meta and len(meta) > 50:
-            parts.append(meta.strip())
-
-        skip = {"home", "menu", "navigation", "copyright", "privacy", "cookie",
-                "subscribe", "newsletter", "advertisement"}
-        for p in self.css("article p, .entry-content p, .post-content p, main p")[:8]:
-            text = p.xpath("string(.)").get(default="").strip()
-            if len(text) > 60 and not any(w in text.lower() for w in skip):
-                parts.append(text)
-                if len(parts) >= 3:
-                    break
-
-        if not parts:
-            for p in self.css("p")[:6]:
-                text = p.xpath("string(.)").get(default="").strip()
-                if len(text) > 60 and not any(w in text.lower() for w in skip):
-                    parts.append(text)
-                    if len(parts) >= 2:
-                        break
-
-        if not parts:
-            for sel in [".entry-content", ".post-content", ".article-content", "article", "main"]:
-                text = self.css(sel).xpath("string(.)").get()
-                if text and len(text.strip()) > 100:
-                    parts.append(text.strip()[:600])
-                    break
-
-        if parts:
-            return re.sub(r"\s+", " ", " ".join(parts))
-        return "No description available"
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 3. REWARD
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_reward(self, css_selector: Optional[str] = None) -> str:
-        if css_selector:
-            text = self._section_text(css_selector)
-            if text:
-                return text
-
-        page_text = self.clean_text
-
-        naira  = [r"₦\s*([0-9,]+(?:\.[0-9]{2})?)", r"N\s*([0-9,]+(?:\.[0-9]{2})?)",
-                  r"([0-9,]+(?:\.[0-9]{2})?)\s*naira"]
-        usd    = [r"\$\s*([0-9,]+(?:\.[0-9]{2})?)",
-                  r"([0-9,]+(?:\.[0-9]{2})?)\s*(?:USD|dollars?)"]
-        gen    = [r"worth\s*(?:of\s*)?₦?\$?\s*([0-9,]+)",
-                  r"value\s*(?:of\s*)?₦?\$?\s*([0-9,]+)",
-                  r"amount\s*(?:of\s*)?₦?\$?\s*([0-9,]+)"]
-
-        for group, prefix in [(naira, "₦"), (usd, "$"), (gen, "")]:
-            for pattern in group:
-                for match in re.finditer(pattern, page_text, re.IGNORECASE):
-                    raw = match.group(1) if match.lastindex else match.group(0)
-                    if isinstance(raw, tuple):
-                        raw = next((x for x in raw if x), "")
-                    try:
-                        if float(raw.replace(",", "")) > 1000:
-                            return f"{prefix}{raw}"
-                    except (ValueError, AttributeError):
-                        continue
-
-        for kw in ["tuition", "allowance", "stipend", "support", "funding",
-                   "full scholarship", "fully funded"]:
-            if kw in page_text.lower():
-                return f"Educational {kw}"
-
-        return "Amount not specified"
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 4. DATES
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_date(
-        self,
-        date_type: str = "end",
-        css_selector: Optional[str] = None,
-    ) -> Optional[date]:
-        if css_selector:
-            raw = self._section_text(css_selector)
-            if raw:
-                parsed = _try_parse_date(raw)
-                if parsed:
-                    return parsed
-
-        return self._date_from_text(self.clean_text, date_type)
-
-    def _date_from_text(self, text: str, date_type: str) -> Optional[date]:
-        if date_type == "start":
-            patterns = [
-                r"application\s*(?:opens?|starts?)[:\s]*([^.!?\n]+)",
-                r"opening\s*date[:\s]*([^.!?\n]+)",
-                r"start\s*date[:\s]*([^.!?\n]+)",
-                r"begins?[:\s]*([^.!?\n]+)",
-                r"from[:\s]*([^.!?\n]+?)(?:\s*to\s*|\s*-\s*)",
-                r"available\s*from[:\s]*([^.!?\n]+)",
-            ]
-        else:
-            patterns = [
-                r"deadline[:\s]*([^.!?\n]+)",
-                r"due date[:\s]*([^.!?\n]+)",
-                r"closing date[:\s]*([^.!?\n]+)",
-                r"last date[:\s]*([^.!?\n]+)",
-                r"application closes?[:\s]*([^.!?\n]+)",
-                r"expires?[:\s]*([^.!?\n]+)",
-                r"close[sd]?\s*on[:\s]*([^.!?\n]+)",
-                r"submit\s*by[:\s]*([^.!?\n]+)",
-            ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                parsed = _try_parse_date(match.group(1).strip())
-                if parsed:
-                    return parsed
-        return None
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 5. ELIGIBILITY
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_eligibility(
-        self,
-        css_selector: Optional[str] = None,
-        fallback_text: Optional[str] = None,
-    ) -> list[str]:
-        results: list[str] = []
-
-        # ── A. Targeted CSS selector ──────────────────────────────────────────
-        if css_selector:
-            raw = self._section_text(css_selector)
-            if raw:
-                for header in ["Eligibility:", "Who can apply:", "Criteria:"]:
-                    raw = raw.replace(header, "")
-                for part in re.split(r"[\n;•►→➤]", raw):
-                    part = _clean_bullet(part).strip()
-                    if self._is_eligibility(part) and not _is_navigation_item(part):
-                        results.append(part)
-            if results:
-                return self._clean_items(results)
-
-        # ── B. Semantic section detection (navigation-safe) ───────────────────
-        results = self._find_content_list(_ELIGIBILITY_HEADINGS, self._is_eligibility)
-        if results:
-            return self._clean_items(results)
-
-        # ── C. Regex over clean_text ──────────────────────────────────────────
-        page_text = fallback_text or self.clean_text
-        patterns = [
-            r"eligibility[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"eligible\s*(?:candidates?|applicants?)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"who\s*can\s*apply[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"criteria[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"qualifications?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-        ]
-        for pattern in patterns:
-            for m in re.finditer(pattern, page_text, re.IGNORECASE | re.MULTILINE):
-                chunk = m.group(1).strip()
-                items = self._split_items(chunk, self._is_eligibility)
-                items = [i for i in items if not _is_navigation_item(i)]
-                results.extend(items)
-                if results:
-                    break
-            if results:
-                break
-
-        # ── D. Structured keyword fallback ────────────────────────────────────
-        if not results:
-            results = self._common_eligibility(page_text)
-
-        cleaned = self._clean_items(results)
-
-        # ── E. Validation gate — if still looks like nav, return empty ─────────
-        # Signal to caller (spider / process_new_submission) that LLM is needed
-        if not cleaned or all(_is_navigation_item(r) for r in cleaned):
-            return []   # Empty → QualityCheck will flag → LLM fires
-
-        return cleaned
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 6. REQUIREMENTS
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_requirements(
-        self,
-        css_selector: Optional[str] = None,
-        fallback_text: Optional[str] = None,
-    ) -> list[str]:
-        results: list[str] = []
-
-        # ── A. Targeted CSS selector ──────────────────────────────────────────
-        if css_selector:
-            raw = self._section_text(css_selector)
-            if raw:
-                for header in ["Requirements:", "Documents Required:", "What you need:"]:
-                    raw = raw.replace(header, "")
-                for part in re.split(r"[\n;•►→➤]", raw):
-                    part = _clean_bullet(part).strip()
-                    if self._is_requirement(part) and not _is_navigation_item(part):
-                        results.append(part)
-            if results:
-                return self._clean_items(results)
-
-        # ── B. Semantic section detection ─────────────────────────────────────
-        results = self._find_content_list(_REQUIREMENTS_HEADINGS, self._is_requirement)
-        if results:
-            return self._clean_items(results)
-
-        # ── C. Regex over clean_text ──────────────────────────────────────────
-        page_text = fallback_text or self.clean_text
-        patterns = [
-            r"requirements?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"documents?\s*(?:required|needed)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"application\s*requirements?[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-            r"must\s*(?:provide|submit|include)[:\s]*([^.!?\n]*(?:\n[^.!?\n]*){0,5})",
-        ]
-        for pattern in patterns:
-            for m in re.finditer(pattern, page_text, re.IGNORECASE | re.MULTILINE):
-                chunk = m.group(1).strip()
-                items = self._split_items(chunk, self._is_requirement)
-                items = [i for i in items if not _is_navigation_item(i)]
-                results.extend(items)
-                if results:
-                    break
-            if results:
-                break
-
-        # ── D. Keyword fallback ───────────────────────────────────────────────
-        if not results:
-            results = self._common_requirements(page_text)
-
-        cleaned = self._clean_items(results)
-
-        if not cleaned or all(_is_navigation_item(r) for r in cleaned):
-            return []   # Empty → LLM fires
-
-        return cleaned
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 7. LEVELS
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_levels(self, css_selector: Optional[str] = None, extra_text: str = "") -> list[str]:
-        if css_selector:
-            extracted = self.css(css_selector).getall()
-            cleaned = [x.strip().lower() for x in extracted if x.strip()]
-            if cleaned:
-                return cleaned
-
-        title_text = (self.css("title::text").get() or "").lower()
-        meta_desc  = (self.css('meta[name="description"]::attr(content)').get() or "").lower()
-        all_text   = f"{self.clean_text} {title_text} {meta_desc} {extra_text}".lower()
-
-        level_keywords = {
-            "highschool":    ["secondary school", "high school", "ssce", "waec", "neco", "a-level", "k12"],
-            "undergraduate": ["undergraduate", "bachelor", "bsc", "ba ", "first degree", "college student"],
-            "postgraduate":  ["postgraduate", "masters", "msc", "ma ", "mphil", "graduate school"],
-            "phd":           ["phd", "doctorate", "doctoral", "dphil", "research degree"],
-        }
-        detected = {lvl for lvl, kws in level_keywords.items() if any(k in all_text for k in kws)}
-        return list(detected) or ["unspecified"]
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # 8. TAGS
-    # ─────────────────────────────────────────────────────────────────────────
-
-    def extract_tags(self, css_selector: Optional[str] = None, extra_text: str = "") -> list[str]:
-        if css_selector:
-            extracted = self.css(css_selector).getall()
-            cleaned = [x.strip().lower() for x in extracted if x.strip()]
-            if cleaned:
-                return cleaned
-
-        title_text = _normalize(self.css("title::text").get() or "")
-        all_text   = _normalize(f"{self.clean_text} {title_text} {extra_text}")
-
-        tag_keywords = {
-            "international": ["international", "global", "worldwide", "abroad", "foreign"],
-            "women":         ["women", "female", "girls"],
-            "stem":          ["stem", "engineering", "science"],
-            "merit":         ["merit", "academic excellence", "outstanding", "scholarly"],
-            "need":          ["need", "financial aid", "low income", "need-based"],
-        }
-
-        tags: set[str] = set()
-        for tag, kws in tag_keywords.items():
-            if any(kw in all_text for kw in kws):
-                tags.add(tag)
-
-        meta_kws = self.css('meta[name="keywords"]::attr(content)').get()
-        if meta_kws:
-            for mt in _normalize(meta_kws).split(","):
-                mt = mt.strip()
-                for key in tag_keywords:
-                    if get_close_matches(mt, [key], n=1, cutoff=0.8):
-                        tags.add(key)
-
-        # Only use tag/category selectors, not generic nav
-        for sel in [".tags a", ".categories a", ".tag", ".category",
-                    "[class*='tag']", "[class*='category']"]:
-            for el in self.css(sel)[:5]:
-                tag_text = _normalize(el.xpath("string(.)").get(default=""))
-                for key, kws in tag_keywords.items():
-                    if tag_text in kws or get_close_matches(tag_text, kws, n=1, cutoff=0.8):
-                        tags.add(key)
-
-        return list(tags) or ["general"]
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # Private validators & utilities
-    # ─────────────────────────────────────────────────────────────────────────
-
-    @staticmethod
-    def _is_eligibility(text: str) -> bool:
-        if not text or _is_navigation_item(text):
-            return False
-        # Must have at least 5 words to be a real criterion
-        if len(text.split()) < 5:
-            return False
-        keywords = [
-            "citizen", "nationality", "age", "year old", "year of age",
-            "grade", "gpa", "cgpa", "score",
-            "undergraduate", "postgraduate", "graduate", "student",
-            "enrolled", "admitted", "applicant",
-            "resident", "income", "family",
-            "female", "male", "gender",
-            "minority", "disability", "field of study",
-            "department", "faculty", "university", "college",
-            "must be", "must have", "should be", "should have",
-            "open to", "available to", "eligible",
-        ]
-        t = text.lower()
-        # Require a keyword AND that it reads like a criterion (not a nav label)
-        has_keyword = any(k in t for k in keywords)
-        has_verb    = any(v in t for v in ["must", "should", "need", "require",
-                                            "open", "eligible", "have", "be a", "be an"])
-        return (has_keyword or has_verb) and 15 < len(text) < 300
-
-    @staticmethod
-    def _is_requirement(text: str) -> bool:
-        if not text or _is_navigation_item(text):
-            return False
-        if len(text.split()) < 4:
-            return False
-        keywords = [
-            "transcript", "certificate", "cv", "resume", "letter",
-            "essay", "statement", "recommendation", "reference",
-            "passport", "photo", "photograph",
-            "application form", "birth certificate", "identification",
-            "academic record", "degree", "diploma",
-            "ssce", "waec", "jamb", "neco",
-            "bank statement", "financial", "medical report",
-            "upload", "submit", "attach", "provide",
-            "official", "certified", "notarized",
-            "two copies", "three copies",
-        ]
-        t = text.lower()
-        return any(k in t for k in keywords) and 15 < len(text) < 300
-
-    @staticmethod
-    def _split_items(text: str, validator) -> list[str]:
-        for delimiter in ["\n", ";", "•", "►", "→", "➤"]:
-            if delimiter in text:
-                return [_clean_bullet(p).strip()
-                        for p in text.split(delimiter)
-                        if validator(_clean_bullet(p).strip())]
-        sentences = re.split(r"[.!?]", text)
-        return [s.strip() for s in sentences if validator(s.strip())] or [text.strip()]
-
-    @staticmethod
-    def _clean_items(items: list[str], max_items: int = 10) -> list[str]:
-        cleaned = []
-        for item in items[:max_items * 2]:
-            item = _clean_bullet(item)
-            if 12 < len(item) < 300 and not _is_navigation_item(item):
-                cleaned.append(item[0].upper() + item[1:] if item else item)
-        # Deduplicate preserving order
-        seen = set()
-        deduped = []
-        for item in cleaned:
-            key = _normalize(item)
-            if key not in seen:
-                seen.add(key)
-                deduped.append(item)
-        return deduped[:max_items]
-
-    @staticmethod
-    def _common_eligibility(page_text: str) -> list[str]:
-        eligibility: list[str] = []
-        t = page_text.lower()
-
-        age = re.search(
-            r"(?:age|years?)\s*(?:between|from|of)?\s*(\d+)(?:\s*(?:to|and|-)\s*(\d+))?",
-            t
-        )
-        if age:
-            if age.group(2):
-                eligibility.append(f"Age between {age.group(1)} and {age.group(2)} years")
-            else:
-                eligibility.append(f"Age {age.group(1)} years or above")
-
-        mapping = [
-            ("undergraduate", "Must be an undergraduate student"),
-            ("postgraduate",  "Must be a postgraduate student"),
-            ("international", "Open to international students"),
-        ]
-        for kw, label in mapping:
-            if kw in t:
-                eligibility.append(label)
-
-        if "nigerian" in t and "citizen" in t:
-            eligibility.append("Must be a Nigerian citizen")
-
-        gpa = re.search(r"(?:gpa|cgpa)\s*(?:of\s*)?(\d+\.?\d*)", t)
-        if gpa:
-            eligibility.append(f"Minimum GPA/CGPA of {gpa.group(1)}")
-
-        if "female only" in t or "women only" in t:
-            eligibility.append("Female students only")
-        elif "male only" in t:
-            eligibility.append("Male students only")
-
-        return eligibility
-
-    @staticmethod
-    def _common_requirements(page_text: str) -> list[str]:
-        t = page_text.lower()
-        patterns = {
-            "Academic Transcript":      ["transcript", "academic record"],
-            "CV or Resume":             ["cv", "resume", "curriculum vitae"],
-            "Passport Photograph":      ["passport photo", "recent photo", "passport photograph"],
-            "Birth Certificate":        ["birth certificate"],
-            "Letter of Recommendation": ["recommendation letter", "reference letter", "letter of recommendation"],
-            "Statement of Purpose":     ["statement of purpose", "personal statement", "motivation letter"],
-            "Application Form":         ["application form", "completed form"],
-            "Academic Certificates":    ["academic certificate", "degree certificate"],
-            "Valid ID / Passport":      ["national id", "valid passport", "identification document"],
-        }
-        return [name for name, kws in patterns.items() if any(k in t for k in kws)]
-
-    
-
 # SiteConfig.objects.create(
 #     name="Scholarship Region",
 #     base_url="https://www.scholarshipregion.com",
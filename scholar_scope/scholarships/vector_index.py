@@ -0,0 +1,258 @@
+"""
+vector_index.py
+─────────────────────────────────────────────────────────────────────────────
+In-process index over Scholarship embeddings.
+
+Keeps an L2-normalised float32 matrix of every active scholarship's embedding
+so multi-chunk recommendation scoring is one matrix multiply instead of one
+`ORDER BY CosineDistance` query per ProfileChunk.
+
+Processes don't share memory, so writers (the embedding Celery tasks, and
+anything that deactivates or deletes scholarships) publish the changed ids
+through the cache with `publish_scholarship_update(s)`.
+Every process holding an index replays those deltas on its next search; if it
+fell too far behind, or the index is older than INDEX_MAX_AGE, it reloads.
+"""
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION_KEY = "scholarship_index:version"
+INDEX_DELTA_KEY   = "scholarship_index:delta:{}"
+INDEX_DELTA_TTL   = 24 * 3600
+INDEX_MAX_AGE     = 6 * 3600   # full reload at least this often (compacts removed rows)
+MAX_DELTA_BATCH   = 500        # beyond this many pending deltas a reload is cheaper
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def publish_scholarship_update(scholarship_id: int) -> None:
+    """Record that a scholarship's embedding (or active flag) changed."""
+    publish_scholarship_updates([scholarship_id])
+
+
+def publish_scholarship_updates(scholarship_ids) -> None:
+    """
+    Record a batch of changed / deactivated / deleted scholarships. Batches
+    bigger than MAX_DELTA_BATCH only bump the version: consumers reload.
+    """
+    scholarship_ids = list(scholarship_ids)
+    if not scholarship_ids:
+        return
+    try:
+        try:
+            version = cache.incr(INDEX_VERSION_KEY, len(scholarship_ids))
+        except ValueError:
+            cache.add(INDEX_VERSION_KEY, 0, timeout=None)
+            version = cache.incr(INDEX_VERSION_KEY, len(scholarship_ids))
+        if len(scholarship_ids) <= MAX_DELTA_BATCH:
+            first = version - len(scholarship_ids) + 1
+            cache.set_many(
+                {INDEX_DELTA_KEY.format(first + i): sid for i, sid in enumerate(scholarship_ids)},
+                INDEX_DELTA_TTL,
+            )
+    except Exception as exc:
+        # Index consumers fall back to the periodic full reload
+        logger.warning(f"[VectorIndex] Could not publish {len(scholarship_ids)} updates: {exc}")
+
+
+def _current_version() -> int:
+    try:
+        return int(cache.get(INDEX_VERSION_KEY) or 0)
+    except Exception:
+        return 0
+
+
+class ScholarshipVectorIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids = None          # np.ndarray[int64], row -> scholarship id
+        self._matrix = None       # np.ndarray[float32] (n, d), unit-length rows
+        self._alive = None        # np.ndarray[bool], False for rows removed since load
+        self._positions = {}      # scholarship id -> row
+        self._version = 0
+        self._loaded_at = 0.0
+
+    def __len__(self):
+        return len(self._positions)
+
+    @property
+    def dimensions(self):
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    # ── loading / refresh ─────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        import numpy as np
+        from scholarships.models import Scholarship
+
+        version = _current_version()
+        rows = list(
+            Scholarship.objects.filter(active=True)
+            .exclude(embedding__isnull=True)
+            .values_list("id", "embedding")
+        )
+
+        with self._lock:
+            if rows:
+                ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+                matrix = _normalise(np.asarray([r[1] for r in rows], dtype=np.float32))
+            else:
+                ids = np.empty(0, dtype=np.int64)
+                matrix = None
+
+            self._ids = ids
+            self._matrix = matrix
+            self._alive = np.ones(len(ids), dtype=bool)
+            self._positions = {int(sid): i for i, sid in enumerate(ids)}
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+        logger.info(f"[VectorIndex] Loaded {len(rows)} scholarship vectors (version {version}).")
+
+    def refresh(self) -> None:
+        """Bring the index up to date with published deltas, reloading if needed."""
+        # Held throughout so two threads can't replay the same deltas, or
+        # publish a version whose arrays another thread is still swapping in
+        with self._lock:
+            if self._matrix is None and not self._loaded_at:
+                return self.load()
+            if time.monotonic() - self._loaded_at > INDEX_MAX_AGE:
+                return self.load()
+
+            current = _current_version()
+            if current <= self._version:
+                return
+            if current - self._version > MAX_DELTA_BATCH:
+                return self.load()
+
+            keys = [INDEX_DELTA_KEY.format(v) for v in range(self._version + 1, current + 1)]
+            deltas = cache.get_many(keys)
+            if len(deltas) < len(keys):
+                # Some deltas expired before we saw them — can't replay safely
+                return self.load()
+
+            self._apply(set(deltas.values()))
+            self._version = current
+
+    def _apply(self, scholarship_ids: set) -> None:
+        import numpy as np
+        from scholarships.models import Scholarship
+
+        rows = {
+            sid: (active, embedding)
+            for sid, active, embedding in Scholarship.objects.filter(
+                id__in=scholarship_ids
+            ).values_list("id", "active", "embedding")
+        }
+
+        with self._lock:
+            appended_ids, appended_vectors = [], []
+            for sid in scholarship_ids:
+                active, embedding = rows.get(sid, (False, None))
+                if not active or embedding is None:
+                    self._remove(sid)
+                    continue
+
+                vector = _normalise(np.asarray(embedding, dtype=np.float32)[None, :])[0]
+                if self._matrix is not None and vector.shape[0] != self._matrix.shape[1]:
+                    logger.warning(f"[VectorIndex] Skipping {sid}: dimension {vector.shape[0]} != {self._matrix.shape[1]}")
+                    continue
+
+                row = self._positions.get(sid)
+                if row is not None:
+                    self._matrix[row] = vector
+                    self._alive[row] = True
+                else:
+                    appended_ids.append(sid)
+                    appended_vectors.append(vector)
+
+            if appended_ids:
+                new_rows = np.vstack(appended_vectors)
+                start = len(self._ids)
+                self._matrix = new_rows if self._matrix is None else np.vstack([self._matrix, new_rows])
+                self._ids = np.concatenate([self._ids, np.asarray(appended_ids, dtype=np.int64)])
+                self._alive = np.concatenate([self._alive, np.ones(len(appended_ids), dtype=bool)])
+                for offset, sid in enumerate(appended_ids):
+                    self._positions[sid] = start + offset
+
+    def _remove(self, scholarship_id: int) -> None:
+        row = self._positions.pop(scholarship_id, None)
+        if row is not None:
+            self._alive[row] = False
+
+    def discard(self, scholarship_ids) -> None:
+        """Drop rows a caller found inactive before their delta was replayed."""
+        with self._lock:
+            for sid in scholarship_ids:
+                self._remove(sid)
+
+    # ── search ────────────────────────────────────────────────────────────────
+
+    def search(self, query_vectors, weights, top_n: int = 20, exclude_ids=()) -> list:
+        """
+        Score every indexed scholarship against all query vectors at once.
+
+        The weighted sum of cosine similarities  Σ wᵢ·cos(s, qᵢ)  equals
+        ŝ · Σ wᵢ·q̂ᵢ, so the chunk matrix collapses to a single combined
+        query before the (n, d) multiply.
+
+        Returns [(scholarship_id, score), ...] best first.
+        """
+        import numpy as np
+
+        self.refresh()
+
+        with self._lock:
+            if self._matrix is None or not self._positions:
+                return []
+
+            queries = _normalise(np.asarray(query_vectors, dtype=np.float32))
+            if queries.shape[1] != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Query dimension {queries.shape[1]} does not match index dimension {self._matrix.shape[1]}"
+                )
+            combined = np.asarray(weights, dtype=np.float32) @ queries
+
+            scores = self._matrix @ combined
+            scores[~self._alive] = -np.inf
+            for sid in exclude_ids:
+                row = self._positions.get(sid)
+                if row is not None:
+                    scores[row] = -np.inf
+
+            k = min(top_n, len(self._positions))
+            if k <= 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                (int(self._ids[i]), float(scores[i]))
+                for i in top
+                if np.isfinite(scores[i])
+            ]
+
+
+def _normalise(matrix):
+    import numpy as np
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def get_scholarship_index() -> ScholarshipVectorIndex:
+    """Returns the process-wide index, loading it lazily on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = ScholarshipVectorIndex()
+                index.load()
+                _index = index
+    return _index
@@ -4,7 +4,7 @@ from allauth.account.views import SignupView
 from scholarships.models import Scholarship, Bookmark, Application, Profile, SiteConfig, WatchedScholarship, ScrapeSubmission, Tag, Level
 from .tasks import process_new_submission
 from rest_framework import status
-from django.contrib.postgres.search import SearchVector, SearchRank, SearchQuery
+from django.contrib.postgres.search import SearchRank, SearchQuery
 from django.db.models import Q
 from .serializers import (ScholarshipSerializer, UserDashBoardSerializer, ApplicationStatusSerializer, ScrapeSubmissionSerializer,
                           ApplicationSerializer, BookmarkSerializer, ProfileUpdateSerializer, SiteConfigSerializer)
@@ -12,18 +12,21 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import viewsets
 from django.utils import timezone
-from django.db.models import Q, Count
+from django.db.models import Q, Count, F, Case, When, Value, FloatField
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from dj_rest_auth.registration.views import SocialLoginView
 from django.conf import settings
-from .utils import get_cached_recommendations
+from .utils import get_cached_recommendations, get_text_embedding
+from pgvector.django import CosineDistance
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import hashlib
 from rest_framework.decorators import api_view, permission_classes
 from asgiref.sync import async_to_sync
 import datetime
-import dateparser
 from .utils import ScholarshipExtractor
+from .dates import parse_date
 from scholarscope_scrapers.scholarscope_scrapers.utils.llm_engine import LLMEngine
 from scholarscope_scrapers.scholarscope_scrapers.utils.quality import QualityCheck
 import uuid
@@ -46,6 +49,76 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
+
+# Must match the config used by the search_vector triggers (migration 0023)
+SEARCH_CONFIG = "english"
+RRF_K = 60  # reciprocal-rank-fusion damping constant
+
+# Query embeddings run here so the request can stop waiting at the latency
+# budget; a late result still lands in the embedding cache for next time.
+_embedding_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search-embed")
+
+
+def _filter_scholarships(queryset, level=None, tag=None):
+    """The ?level= / ?tag= filters of the scholarship list."""
+    if level:
+        queryset = queryset.filter(level__level__iexact=level)
+    if tag:
+        queryset = queryset.filter(tags__name__iexact=tag)
+    return queryset
+
+
+def _hybrid_search_ranking(query: str, level=None, tag=None) -> list:
+    """
+    [(scholarship_id, rrf_score), ...] for ?mode=hybrid, best first.
+
+    Fuses the full-text top-k and the embedding ANN top-k with reciprocal
+    rank fusion, both taken over the rows the list filters allow (so a
+    filtered query still gets k candidates). Falls back to lexical-only when
+    the query embedding misses HYBRID_SEARCH_EMBED_BUDGET_MS. Cached per
+    normalised query and filters.
+    """
+    normalised = " ".join(query.lower().split())
+    filters = f"{(level or '').lower()}|{(tag or '').lower()}"
+    key = "hybrid_search:" + hashlib.sha256(f"{normalised}|{filters}".encode("utf-8")).hexdigest()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    k = settings.HYBRID_SEARCH_K
+    candidates = _filter_scholarships(Scholarship.objects.all(), level=level, tag=tag)
+    search_query = SearchQuery(normalised, config=SEARCH_CONFIG)
+    lexical = list(
+        candidates.filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
+        .order_by("-rank", "-id")
+        .values_list("id", flat=True)[:k]
+    )
+
+    semantic = []
+    complete = True
+    future = _embedding_executor.submit(get_text_embedding, normalised)
+    try:
+        vector = future.result(timeout=settings.HYBRID_SEARCH_EMBED_BUDGET_MS / 1000)
+    except FutureTimeout:
+        logger.info(f"[Search] Embedding over budget for {normalised!r}; lexical only.")
+        vector, complete = None, False
+    if vector:
+        semantic = list(
+            candidates.exclude(embedding__isnull=True)
+            .order_by(CosineDistance("embedding", vector))
+            .values_list("id", flat=True)[:k]
+        )
+
+    scores = {}
+    for ranking in (lexical, semantic):
+        for position, sid in enumerate(ranking, start=1):
+            scores[sid] = scores.get(sid, 0.0) + 1.0 / (RRF_K + position)
+    fused = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+
+    # Don't pin a degraded (lexical-only) result for the whole TTL
+    cache.set(key, fused, settings.HYBRID_SEARCH_CACHE_TTL if complete else 60)
+    return fused
 class GoogleOAuth2Client(OAuth2Client):
     def __init__(self, *args, **kwargs):
         if 'scope_delimiter' in kwargs:
@@ -75,10 +148,18 @@ class ScholarshipViewset(viewsets.ModelViewSet):
         else:
             return [IsAdminUser()]
         
+    def get_cursor_ordering(self):
+        """Search results page by relevance; everything else by recency."""
+        if self.request.query_params.get("q"):
+            return ("-rank", "-id")
+        return None
+
     def get_queryset(self):
-        queryset = Scholarship.objects.all()
+        # The serializer never reads the vector columns
+        queryset = Scholarship.objects.defer("embedding", "search_vector")
 
         query = self.request.query_params.get("q")
+        mode = self.request.query_params.get("mode")
         level = self.request.query_params.get("level")
         tag = self.request.query_params.get("tag")
 
@@ -102,25 +183,33 @@ class ScholarshipViewset(viewsets.ModelViewSet):
                 ),
             )
 
-        if level:
-            queryset = queryset.filter(level__level__iexact=level)
-        if tag:
-            queryset = queryset.filter(tags__name__iexact=tag)
+        queryset = _filter_scholarships(queryset, level=level, tag=tag)
 
-        if query:
-            search_vector = (
-                SearchVector("title", weight="A") +
-                SearchVector("description", weight="B") +
-                SearchVector("tags__name", weight="C")
+        if query and mode == "hybrid":
+            fused = _hybrid_search_ranking(query, level=level, tag=tag)
+            queryset = (
+                queryset
+                .filter(id__in=[sid for sid, _ in fused])
+                .annotate(rank=Case(
+                    *[When(id=sid, then=Value(score)) for sid, score in fused],
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                ))
+                .order_by("-rank", "-id")
             )
-            search_query = SearchQuery(query)
+        elif query:
+            # Stored, trigger-maintained tsvector (migration 0023): the @@ match
+            # is a GIN index scan, ts_rank_cd only runs on the matching rows.
+            # Every match is returned, best first; there is no minimum rank
+            # (the old ts_rank >= 0.1 cut-off hid weak but real matches, and
+            # ts_rank_cd values are on a different scale anyway).
+            search_query = SearchQuery(query, config=SEARCH_CONFIG)
             
             queryset = (
                 queryset
-                .annotate(rank=SearchRank(search_vector, search_query))
-                .filter(rank__gte=0.1) 
-                .order_by("-rank", "-created_at") 
-                .distinct()
+                .filter(search_vector=search_query)
+                .annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
+                .order_by("-rank", "-id") 
             )
         else:
             queryset = queryset.order_by("-created_at")
@@ -625,8 +714,7 @@ def _parse_dates_inplace(data: dict) -> None:
     for key in ("end_date", "start_date"):
         val = data.get(key)
         if isinstance(val, str):
-            dt = dateparser.parse(val)
-            data[key] = dt.date() if dt else None
+            data[key] = parse_date(val)
 
 def _normalise_url(raw: str) -> str:
     parsed = urlparse(raw)